@@ -0,0 +1,74 @@
+"""
+Сравнение размера файла задач и времени сохранения/загрузки для разных кодеков сжатия.
+
+Запуск из корня проекта:
+
+    python -m benchmarks.compression --count 50000
+"""
+import os
+import time
+import random
+import logging
+import argparse
+import tempfile
+
+import tabulate
+
+from tasks.codecs import CODECS
+from tasks.task_manager import TaskManager
+
+EXTENSIONS = {None: ".json", "gzip": ".json.gz", "bz2": ".json.bz2", "lzma": ".json.xz", "zstd": ".json.zst"}
+
+WORDS = ["задача", "отчёт", "встреча", "клиент", "проект", "звонок", "письмо", "ремонт", "бюджет", "план"]
+
+
+def fill(manager: TaskManager, count: int):
+
+    rng = random.Random(0)
+
+    for i in range(count):
+        manager.add_task(
+            title=f"{rng.choice(WORDS).capitalize()} {i}",
+            description=" ".join(rng.choices(WORDS, k=8)),
+            category=rng.choice(WORDS[:4]),
+            due_date=rng.randint(1, 60),
+            priority=rng.choice(["низкий", "средний", "высокий"]),
+            status=rng.choice(["выполнено", "не выполнено"])
+        )
+
+
+def main():
+
+    parser = argparse.ArgumentParser(description="Бенчмарк сжатия файла задач")
+    parser.add_argument("--count", type=int, default=50000, help="Количество задач")
+    args = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+
+    with tempfile.TemporaryDirectory() as directory:
+        source = TaskManager(os.path.join(directory, "source.json"))
+        fill(source, args.count)
+        tasks_dict = source._dump_tasks()
+
+        table = []
+        for compression in [None, *CODECS]:
+            manager = TaskManager(os.path.join(directory, "tasks" + EXTENSIONS[compression]))
+
+            started = time.process_time()
+            manager._write_json(tasks_dict)
+            save_time = time.process_time() - started
+
+            started = time.process_time()
+            manager._read_json()
+            load_time = time.process_time() - started
+
+            size = os.path.getsize(manager.filename)
+            table.append([compression or "без сжатия", f"{size / 1024:.0f}", f"{save_time:.2f}", f"{load_time:.2f}"])
+
+    headers = ["Кодек", "Размер (КБ)", "Сохранение, CPU (с)", "Загрузка, CPU (с)"]
+    print(f"Задач: {args.count}")
+    print(tabulate.tabulate(table, headers=headers, tablefmt="grid"))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""
+Сравнение выгрузки задач по одной (to_dict + csv.DictWriter) с пакетной колоночной выгрузкой.
+
+Запуск из корня проекта:
+
+    python -m benchmarks.export --count 200000
+"""
+import os
+import csv
+import time
+import logging
+import argparse
+import tempfile
+import tracemalloc
+
+import tabulate
+
+from tasks.export import COLUMNS
+from tasks.task_manager import TaskManager
+from benchmarks.compression import fill
+
+
+def export_rows(manager: TaskManager, path: str) -> int:
+
+    with open(path, "w", encoding="utf-8", newline="") as file:
+        writer = csv.DictWriter(file, fieldnames=COLUMNS)
+        writer.writeheader()
+
+        for task in manager.tasks.values():
+            writer.writerow(task.to_dict())
+
+    return len(manager.tasks)
+
+
+def measure(function, path: str):
+
+    tracemalloc.start()
+    started = time.perf_counter()
+    function(path)
+    elapsed = time.perf_counter() - started
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    return elapsed, peak
+
+
+def main():
+
+    parser = argparse.ArgumentParser(description="Бенчмарк выгрузки задач")
+    parser.add_argument("--count", type=int, default=200000, help="Количество задач")
+    args = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+
+    with tempfile.TemporaryDirectory() as directory:
+        manager = TaskManager(os.path.join(directory, "tasks.json"))
+        fill(manager, args.count)
+
+        cases = [
+            ("to_dict по одной задаче, CSV", lambda path: export_rows(manager, path), os.path.join(directory, "rows.csv")),
+            ("пакеты, CSV", manager.export, os.path.join(directory, "batches.csv")),
+            ("пакеты, колоночный формат", lambda path: manager.export(path, columnar=True), os.path.join(directory, "batches.tcol")),
+        ]
+
+        table = []
+        for name, function, path in cases:
+            elapsed, peak = measure(function, path)
+            table.append([name, f"{elapsed:.2f}", f"{peak / 1024 / 1024:.1f}", f"{os.path.getsize(path) / 1024 / 1024:.1f}"])
+
+    headers = ["Способ", "Время (с)", "Пик памяти (МБ)", "Размер (МБ)"]
+    print(f"Задач: {args.count}")
+    print(tabulate.tabulate(table, headers=headers, tablefmt="grid"))
+
+
+if __name__ == "__main__":
+    main()
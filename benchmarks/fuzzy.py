@@ -0,0 +1,91 @@
+"""
+Время нечёткого поиска по триграммному индексу в сравнении с полным перебором задач.
+
+Запуск из корня проекта:
+
+    python -m benchmarks.fuzzy --count 200000
+"""
+import os
+import time
+import heapq
+import logging
+import argparse
+import tempfile
+
+import tabulate
+
+from tasks.fuzzy import INDEXED_FIELDS, TrigramIndex, trigrams
+from tasks.task_manager import TaskManager
+from benchmarks.compression import fill
+
+QUERIES = ["атчет", "встреча по бюджету", "звонок клиенту", "праект", "ремонт 12345", "xyz"]
+
+
+def scan(manager: TaskManager, query: str, limit: int = 10, threshold: float = 0.3) -> list[str]:
+    """
+    Полный перебор: пересечение триграмм запроса с триграммами каждой задачи.
+    """
+    query_grams = trigrams(query)
+    required = max(1, threshold * len(query_grams))
+    scored = []
+
+    for task in manager.tasks.values():
+        grams = trigrams(" ".join(getattr(task, field) for field in INDEXED_FIELDS))
+        shared = len(query_grams & grams)
+
+        if shared >= required:
+            scored.append((shared, -len(grams), task.id))
+
+    return [task_id for _, _, task_id in heapq.nlargest(limit, scored)]
+
+
+def measure(function, repeat: int) -> float:
+
+    started = time.perf_counter()
+
+    for _ in range(repeat):
+        result = function()
+
+    return (time.perf_counter() - started) / repeat * 1000, result
+
+
+def main():
+
+    parser = argparse.ArgumentParser(description="Бенчмарк нечёткого поиска")
+    parser.add_argument("--count", type=int, default=200000, help="Количество задач")
+    parser.add_argument("--repeat", type=int, default=5, help="Количество повторов каждого запроса")
+    parser.add_argument("--no-scan", dest="scan", action="store_false", help="Не измерять полный перебор")
+    args = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+
+    with tempfile.TemporaryDirectory() as directory:
+        manager = TaskManager(os.path.join(directory, "tasks.json"))
+        fill(manager, args.count)
+
+        started = time.perf_counter()
+        index = TrigramIndex()
+        index.on_reset(manager.tasks)
+        build_time = time.perf_counter() - started
+
+        table = []
+        for query in QUERIES:
+            index_time, found = measure(lambda: index.search(query), args.repeat)
+            row = [query, f"{index_time:.1f}", len(found)]
+
+            if args.scan:
+                scan_time, expected = measure(lambda: scan(manager, query), 1)
+                row += [f"{scan_time:.1f}", "да" if [task_id for task_id, _ in found] == expected else "нет"]
+
+            table.append(row)
+
+    headers = ["Запрос", "Индекс (мс)", "Найдено"]
+    if args.scan:
+        headers += ["Перебор (мс)", "Совпадает"]
+
+    print(f"Задач: {args.count}, построение индекса: {build_time:.2f} с")
+    print(tabulate.tabulate(table, headers=headers, tablefmt="grid"))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,16 +1,45 @@
+import sys
+import shlex
 import argparse
-from datetime import datetime
+from time import perf_counter
+from datetime import datetime, timedelta
 
 from tasks.task_manager import TaskManager
+from tasks.recurrence import Recurrence
+from tasks.watch import TaskWatcher
+from tasks.scheduler import DeadlineScheduler, WebhookNotifier, StdoutNotifier, log_notifier
 
+# Команды, после которых задачи нужно сохранить
+MODIFYING_COMMANDS = {"add", "delete", "update", "depend"}
+# Команды, которые сохраняют задачи и поэтому записывают историю изменений
+HISTORY_COMMANDS = MODIFYING_COMMANDS | {"save", "batch"}
 
-def main():
+# Команды, доступные в пакетном режиме: они не требуют ввода и не работают бесконечно
+BATCH_COMMANDS = {"add", "delete", "update", "search", "view", "depend", "next", "stats"}
 
-    filename = input("Введите имя файла: ")
 
-    task_manager = TaskManager(filename)
+def parse_date(value: str) -> datetime:
+    """
+    Преобразует дату в формате DD.MM.YYYY для аргументов командной строки.
+    """
+    try:
+        return datetime.strptime(value, "%d.%m.%Y")
+    except ValueError as e:
+        raise argparse.ArgumentTypeError("Дата должна быть в формате DD.MM.YYYY") from e
+
+
+def parse_weekdays(value: str) -> list[int]:
+
+    try:
+        return [int(day) for day in value.split(",")]
+    except ValueError as e:
+        raise argparse.ArgumentTypeError("Дни недели указываются через запятую числами от 0 до 6") from e
+
+
+def build_parser() -> argparse.ArgumentParser:
 
     parser = argparse.ArgumentParser(description="Менеджер Задач")
+    parser.add_argument("--file", help="Файл задач (если не указан, имя файла запрашивается при запуске)")
     subparsers = parser.add_subparsers(dest="command", help="Доступные команды")
 
     # Добавление задачи
@@ -21,15 +50,27 @@ def main():
     add_parser.add_argument("--due_date", type=int, required=True, help="Срок выполнения задачи (в днях)")
     add_parser.add_argument("--priority", choices=["низкий", "средний", "высокий"], default="средний", help="Приоритет задачи")
     add_parser.add_argument("--status", choices=["выполнено", "не выполнено"], default="не выполнено", help="Статус выполнения задачи")
+    add_parser.add_argument("--repeat", choices=["daily", "weekly", "monthly"], help="Повторять задачу: ежедневно, еженедельно или ежемесячно")
+    add_parser.add_argument("--every", type=int, default=1, help="Интервал повторения (каждые N дней, недель или месяцев)")
+    add_parser.add_argument("--weekdays", type=parse_weekdays, help="Дни недели для еженедельного повторения, например 0,2,4 (0 — понедельник)")
+    add_parser.add_argument("--blocked_by", nargs="+", help="ID задач, которые нужно выполнить до этой задачи")
 
     # Удаление задачи
     delete_parser = subparsers.add_parser("delete", help="Удалить задачу")
     delete_parser.add_argument("--id", help="ID задачи")
     delete_parser.add_argument("--category", help="Категория задачи")
+    delete_parser.add_argument("--all", action="store_true", help="Удалить все задачи категории без подтверждения")
 
     # Просмотр задач
     view_parser = subparsers.add_parser("view", help="Просмотреть задачи")
     view_parser.add_argument("--category", help="Категория для фильтрации задачи")
+    view_parser.add_argument("--recent", type=int, help="Показать задачи, созданные за последние N дней")
+    view_parser.add_argument("--from", dest="start", type=parse_date, help="Показать задачи со сроком начиная с даты (DD.MM.YYYY)")
+    view_parser.add_argument("--to", dest="end", type=parse_date, help="Показать задачи со сроком до даты (DD.MM.YYYY)")
+    view_parser.add_argument("--actionable", action="store_true", help="Показать только задачи, которые можно начинать (не заблокированы)")
+    view_parser.add_argument("--watch", action="store_true", help="Обновлять таблицу при изменении файла задач")
+    view_parser.add_argument("--interval", type=float, default=1.0, help="Интервал проверки файла в режиме --watch (в секундах)")
+    view_parser.add_argument("--as-of", dest="as_of", type=parse_date, help="Показать задачи в состоянии на конец дня (DD.MM.YYYY)")
 
     # Поиск задач
     search_parser = subparsers.add_parser("search", help="Поиск задач")
@@ -38,6 +79,11 @@ def main():
     search_parser.add_argument("--category", help="Категория задачи")
     search_parser.add_argument("--priority", choices=["низкий", "средний", "высокий"], help="Приоритет задачи")
     search_parser.add_argument("--status", choices=["выполнено", "не выполнено"], help="Статус выполнения задачи")
+    search_parser.add_argument("--from", dest="start", type=parse_date, help="Искать задачи со сроком начиная с даты (DD.MM.YYYY)")
+    search_parser.add_argument("--to", dest="end", type=parse_date, help="Искать задачи со сроком до даты (DD.MM.YYYY)")
+    search_parser.add_argument("--fuzzy", help="Нечёткий поиск по названию, описанию и категории")
+    search_parser.add_argument("--limit", type=int, default=10, help="Максимальное количество результатов нечёткого поиска")
+    search_parser.add_argument("--as-of", dest="as_of", type=parse_date, help="Искать задачи в состоянии на конец дня (DD.MM.YYYY)")
 
     # Обновление задач
     update_parser = subparsers.add_parser("update", help="Обновить задачу")
@@ -55,92 +101,360 @@ def main():
     # Загрузка задач
     load_parser = subparsers.add_parser("load", help="Загрузить задачи из JSON-файла")
 
-    args = parser.parse_args()
-
-    if args.command == "add":
-        
-        task_manager.add_task(
-            args.title,
-            args.description,
-            args.category,
-            args.due_date,
-            args.priority,
-            args.status
-        )
+    # Зависимости задач
+    depend_parser = subparsers.add_parser("depend", help="Указать, что задача заблокирована другими задачами")
+    depend_parser.add_argument("--id", required=True, help="ID задачи")
+    depend_parser.add_argument("--on", nargs="+", required=True, help="ID блокирующих задач")
+    depend_parser.add_argument("--remove", action="store_true", help="Удалить зависимость вместо добавления")
 
-        task_manager.save_json()
+    # Самые срочные задачи
+    next_parser = subparsers.add_parser("next", help="Показать самые срочные невыполненные задачи")
+    next_parser.add_argument("--count", type=int, default=20, help="Количество задач")
+    next_parser.add_argument("--category", help="Категория для фильтрации задач")
+
+    # Статистика
+    stats_parser = subparsers.add_parser("stats", help="Показать статистику по задачам")
+
+    # Выгрузка для аналитики
+    export_parser = subparsers.add_parser("export", help="Выгрузить задачи для аналитики")
+    export_parser.add_argument("--output", required=True, help="Имя файла выгрузки")
+    export_parser.add_argument("--columnar", action="store_true", help="Бинарный колоночный формат вместо CSV")
+    export_parser.add_argument("--batch_size", type=int, default=10000, help="Количество задач в пакете")
+
+    # Напоминания о сроках
+    remind_parser = subparsers.add_parser("remind", help="Напоминать о приближении срока выполнения задач")
+    remind_parser.add_argument("--lead_time", type=int, default=1, help="За сколько дней до срока напоминать")
+    remind_parser.add_argument("--interval", type=float, default=60.0, help="Интервал проверки (в секундах)")
+    remind_parser.add_argument("--webhook", help="URL локального webhook для напоминаний")
+    remind_parser.add_argument("--once", action="store_true", help="Проверить один раз и завершить работу")
+
+    # Пакетный режим
+    batch_parser = subparsers.add_parser("batch", help="Выполнить команды из файла или стандартного ввода одним процессом")
+    batch_parser.add_argument("--input", default="-", help="Файл с командами, по одной на строку ('-' — стандартный ввод)")
+    batch_parser.add_argument("--stop_on_error", action="store_true", help="Остановиться на первой команде с ошибкой")
+
+    return parser
+
+
+def parse_command(parser: argparse.ArgumentParser, argv: list[str] | None = None) -> argparse.Namespace:
+
+    args = parser.parse_args(argv)
+
+    # Дата окончания в командной строке включается в промежуток
+    if getattr(args, "end", None) is not None:
+        args.end += timedelta(days=1)
+
+    if getattr(args, "as_of", None) is not None:
+        args.as_of += timedelta(days=1, microseconds=-1)
+
+    return args
+
+
+def command_add(task_manager: TaskManager, args, interactive: bool):
+
+    blocked_by = [task_manager.resolve_id(task_id) for task_id in args.blocked_by or []]
+
+    task_manager.add_task(
+        args.title,
+        args.description,
+        args.category,
+        args.due_date,
+        args.priority,
+        args.status,
+        Recurrence(args.repeat, args.every, args.weekdays) if args.repeat else None,
+        blocked_by
+    )
 
-    elif args.command == "delete":
-        
-        if args.category:
-            task_manager.delete_task_by_category(category=args.category)
-            task_manager.save_json()
-        elif args.id:
-            task_manager.delete_task_by_id(task_id=args.id)
-            task_manager.save_json()
-        else:
-            print("Укажите категорию или ID задачи для удаления")
 
-    elif args.command == "view":
+def command_delete(task_manager: TaskManager, args, interactive: bool):
 
-        task_list = task_manager.view_tasks(tasks=task_manager.tasks, category=args.category)
-        print(task_list)
+    if args.category:
+        if args.all:
+            deleted = task_manager.delete_tasks_by_category(args.category)
+            print(f"Удалено задач: {len(deleted)}")
+            return
 
-    elif args.command == "search":
+        if not interactive:
+            # Без ввода нельзя выбрать одну из нескольких задач категории
+            count = sum(1 for task in task_manager.tasks.values() if task.category == args.category)
 
+            if count > 1:
+                raise ValueError(f"Категории {args.category} соответствуют {count} задач: укажите --id или --all")
+
+        task_manager.delete_task_by_category(category=args.category)
+    elif args.id:
+        task_manager.delete_task_by_id(task_id=task_manager.resolve_id(args.id))
+    else:
+        raise ValueError("Укажите категорию или ID задачи для удаления")
+
+
+def command_view(task_manager: TaskManager, args, interactive: bool):
+
+    if args.as_of is not None:
+        if args.watch or args.actionable or args.recent:
+            raise ValueError("Параметры --watch, --actionable и --recent нельзя использовать вместе с --as-of")
+
+        print(task_manager.view_tasks(tasks=task_manager.as_of(args.as_of), category=args.category, start=args.start, end=args.end))
+        return
+
+    if args.watch:
+        if not interactive:
+            raise ValueError("Режим --watch недоступен в пакетном режиме")
+
+        try:
+            TaskWatcher(task_manager, category=args.category, interval=args.interval).run()
+        except KeyboardInterrupt:
+            print("Наблюдение остановлено.")
+        return
+
+    tasks = task_manager.ready_tasks() if args.actionable else task_manager.tasks
+
+    if args.recent:
+        since = datetime.now() - timedelta(days=args.recent)
+        created = {task.id for task in task_manager.recent_tasks(since)}
+        tasks = [task for task in (tasks.values() if hasattr(tasks, "values") else tasks) if task.id in created]
+
+    task_list = task_manager.view_tasks(tasks=tasks, category=args.category, start=args.start, end=args.end)
+    print(task_list)
+
+
+def command_search(task_manager: TaskManager, args, interactive: bool):
+
+    if args.fuzzy:
+        if args.as_of is not None:
+            raise ValueError("Нечёткий поиск нельзя использовать вместе с --as-of")
+
+        results = task_manager.fuzzy_search(args.fuzzy, limit=args.limit)
+    else:
         results = task_manager.search_task(
             title=args.title,
             description=args.description,
             category=args.category,
             priority=args.priority,
-            status=args.status
+            status=args.status,
+            start=args.start,
+            end=args.end,
+            as_of=args.as_of
         )
 
-        if results:
-            print("Результаты поиска:\n")
-            print(task_manager.view_tasks({task.id: task for task in results}))
-        else:
-            print("Задачи не найдены.")
+    if results:
+        print("Результаты поиска:\n")
+        print(task_manager.view_tasks(results))
+    else:
+        print("Задачи не найдены.")
+
+
+def command_update(task_manager: TaskManager, args, interactive: bool):
+
+    task_id = task_manager.resolve_id(args.id)
+
+    if args.due_date is None:
+        due_date = None
+    elif args.due_date.isdigit():
+        due_date = int(args.due_date)
+    else:
+        try:
+            due_date = datetime.strptime(args.due_date, "%d.%m.%Y")
+        except ValueError as e:
+            raise ValueError("Дата должна быть в формате DD.MM.YYYY или числом (количество дней до дедлайна)") from e
+
+    task_manager.update_task(
+        task_id=task_id,
+        title=args.title,
+        description=args.description,
+        category=args.category,
+        due_date=due_date,
+        priority=args.priority,
+        status=args.status)
+
+    print("Задача обновлена!")
 
-    elif args.command == "update":
 
-        if args.due_date.isdigit():
-            due_date = int(args.due_date)
+def command_save(task_manager: TaskManager, args, interactive: bool):
+
+    task_manager.save_json()
+    print("Задачи сохранены!")
+
+
+def command_load(task_manager: TaskManager, args, interactive: bool):
+
+    task_manager.load_json()
+
+
+def command_depend(task_manager: TaskManager, args, interactive: bool):
+
+    task_id = task_manager.resolve_id(args.id)
+
+    for blocker in args.on:
+        blocker_id = task_manager.resolve_id(blocker)
+
+        if args.remove:
+            task_manager.remove_dependency(task_id, blocker_id)
         else:
-            try:
-                due_date = datetime.strptime(args.due_date, "%d.%m.%Y")
-            except ValueError as e:
-                raise ValueError ("Дата должна быть в формате YYYY-MM-DD или числом (количество дней до дедлайна)") from e
-            
-        
-        task_manager.update_task(
-            task_id=args.id,
-            title=args.title,
-            description=args.description,
-            category=args.category,
-            due_date=due_date,
-            priority=args.priority,
-            status=args.status)
+            task_manager.add_dependency(task_id, blocker_id)
 
-        task_manager.save_json()
-        print("Задача обновлена!")
+    print("Зависимости обновлены!")
 
-    elif args.command == "save":
 
-        task_manager.save_json()
-        print("Задачи сохранены!")
+def command_next(task_manager: TaskManager, args, interactive: bool):
 
-    elif args.command == "load":
+    results = task_manager.next_tasks(args.count, category=args.category)
 
-        task_manager.load_json()
-    
+    if results:
+        print(task_manager.view_tasks(results))
     else:
+        print("Нет невыполненных задач.")
+
+
+def command_stats(task_manager: TaskManager, args, interactive: bool):
+
+    print(task_manager.stats.report())
+
+
+def command_export(task_manager: TaskManager, args, interactive: bool):
+
+    rows = task_manager.export(args.output, columnar=args.columnar, batch_size=args.batch_size)
+    print(f"Выгружено задач: {rows}")
+
+
+def command_remind(task_manager: TaskManager, args, interactive: bool):
+
+    notifiers = [StdoutNotifier(task_manager), log_notifier]
+    if args.webhook:
+        notifiers.append(WebhookNotifier(args.webhook))
+
+    scheduler = DeadlineScheduler(task_manager, lead_time=timedelta(days=args.lead_time), notifiers=notifiers)
+
+    if args.once:
+        if not scheduler.poll():
+            print("Нет задач с приближающимся сроком выполнения.")
+    else:
+        try:
+            scheduler.run(interval=args.interval)
+        except KeyboardInterrupt:
+            print("Напоминания остановлены.")
+
+
+COMMANDS = {
+    "add": command_add,
+    "delete": command_delete,
+    "view": command_view,
+    "search": command_search,
+    "update": command_update,
+    "save": command_save,
+    "load": command_load,
+    "depend": command_depend,
+    "next": command_next,
+    "stats": command_stats,
+    "export": command_export,
+    "remind": command_remind,
+}
+
+
+def run_command(task_manager: TaskManager, args, interactive: bool = True):
+    """
+    Выполняет разобранную команду. Ошибки в параметрах команды возвращаются как ValueError.
+    """
+    COMMANDS[args.command](task_manager, args, interactive)
+
+
+def run_batch(task_manager: TaskManager, parser: argparse.ArgumentParser, lines, stop_on_error: bool = False) -> int:
+    """
+    Выполняет команды из lines (по одной на строку, в синтаксисе командной строки)
+    над одним загруженным менеджером и сохраняет задачи один раз в конце.
+
+    Пустые строки и строки, начинающиеся с '#', пропускаются.
+    Возвращает количество команд, завершившихся ошибкой.
+    """
+    started = perf_counter()
+    executed = failed = 0
+
+    try:
+        for number, line in enumerate(lines, start=1):
+            line = line.strip()
+
+            if not line or line.startswith("#"):
+                continue
+
+            executed += 1
+            print(f"[{number}] {line}")
+            command_started = perf_counter()
+
+            try:
+                try:
+                    args = parse_command(parser, shlex.split(line))
+                except SystemExit:
+                    # argparse уже вывел описание ошибки
+                    raise ValueError("Неверные аргументы команды") from None
+
+                if args.file is not None:
+                    raise ValueError("Параметр --file нельзя указывать для команды пакета")
+
+                if args.command not in BATCH_COMMANDS:
+                    raise ValueError(f"Команда недоступна в пакетном режиме: {args.command}. Допустимые команды: {', '.join(sorted(BATCH_COMMANDS))}")
+
+                run_command(task_manager, args, interactive=False)
+
+            except (ValueError, TypeError, KeyError) as e:
+                failed += 1
+                print(f"[{number}] Ошибка: {e} ({(perf_counter() - command_started) * 1000:.1f} мс)")
+
+                if stop_on_error:
+                    break
+            else:
+                print(f"[{number}] Готово ({(perf_counter() - command_started) * 1000:.1f} мс)")
+    finally:
+        # Результаты успешных команд сохраняются, даже если пакет прерван непредвиденной ошибкой
+        if task_manager.dirty:
+            task_manager.save_json()
+
+        print(f"Выполнено команд: {executed}, с ошибками: {failed}. Общее время: {perf_counter() - started:.3f} с")
+
+    return failed
+
+
+def main(argv: list[str] | None = None):
+
+    parser = build_parser()
+    args = parse_command(parser, argv)
+
+    if args.command is None:
         print("Неизвестная команда")
         parser.print_help()
+        return
 
-if __name__ == "__main__":
-    main()
+    # Команды пакета читаются из стандартного ввода, и запрос имени файла съел бы первую из них
+    if args.command == "batch" and args.input == "-" and not args.file:
+        parser.error("для пакета из стандартного ввода укажите файл задач через --file")
 
+    filename = args.file or input("Введите имя файла: ")
 
-    
-    
\ No newline at end of file
+    task_manager = TaskManager(filename)
+
+    # Команды только для чтения (в том числе view --watch) не накапливают историю в памяти
+    if args.command in HISTORY_COMMANDS or getattr(args, "as_of", None) is not None:
+        task_manager.enable_history()
+
+    if args.command == "batch":
+        if args.input == "-":
+            failed = run_batch(task_manager, parser, sys.stdin, args.stop_on_error)
+        else:
+            with open(args.input, encoding="utf-8") as file:
+                failed = run_batch(task_manager, parser, file, args.stop_on_error)
+
+        if failed:
+            sys.exit(1)
+        return
+
+    try:
+        run_command(task_manager, args)
+    except (ValueError, TypeError, KeyError) as e:
+        print(e)
+        return
+
+    if args.command in MODIFYING_COMMANDS and task_manager.dirty:
+        task_manager.save_json()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,186 @@
+import asyncio
+import logging
+from concurrent.futures import Executor
+from datetime import datetime
+
+from .task import Task
+from .task_manager import TaskManager
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncTaskManager:
+    """
+    Асинхронная обёртка над TaskManager для использования внутри asyncio.
+
+    Все операции выполняются под asyncio.Lock, поэтому конкурентные корутины
+    видят согласованное состояние. Файловый ввод-вывод выполняется в пуле потоков,
+    а серия изменений, сделанных за save_delay секунд, сохраняется одной записью.
+    """
+    def __init__(self, manager: TaskManager, save_delay: float = 0.05, executor: Executor | None = None):
+
+        self.manager = manager
+        self.save_delay = save_delay
+        self._executor = executor
+        self._lock = asyncio.Lock()
+        self._write_lock = asyncio.Lock()
+        self._dirty = False
+        self._save_task = None
+
+    @classmethod
+    async def open(cls, filename: str = "tasks.json", save_delay: float = 0.05, executor: Executor | None = None):
+        """
+        Создаёт менеджер, загружая файл задач в пуле потоков.
+        """
+        loop = asyncio.get_running_loop()
+        manager = await loop.run_in_executor(executor, TaskManager, filename)
+
+        return cls(manager, save_delay=save_delay, executor=executor)
+
+    @property
+    def tasks(self) -> dict:
+
+        return self.manager.tasks
+
+    async def add_task(self, title: str, description: str, category: str, due_date: int | datetime, priority: str = "средний", status: str = "не выполнено") -> Task:
+        """
+        Добавляет задачу и планирует сохранение.
+        """
+        async with self._lock:
+            task = self.manager.add_task(title, description, category, due_date, priority, status)
+            self._schedule_save()
+
+        return task
+
+    async def get_task(self, task_id: str) -> Task | None:
+
+        async with self._lock:
+            return self.manager.tasks.get(task_id)
+
+    async def delete_task_by_id(self, task_id: str):
+        """
+        Удаляет задачу по её id и планирует сохранение.
+        """
+        async with self._lock:
+            self.manager.delete_task_by_id(task_id)
+            self._schedule_save()
+
+    async def delete_task_by_category(self, category: str) -> list[Task]:
+        """
+        Удаляет все задачи категории без интерактивного подтверждения.
+        """
+        async with self._lock:
+            deleted = self.manager.delete_tasks_by_category(category)
+            self._schedule_save()
+
+        return deleted
+
+    async def update_task(self, task_id: str, **kwargs) -> Task:
+        """
+        Обновляет задачу и планирует сохранение.
+        """
+        async with self._lock:
+            task = self.manager.update_task(task_id, **kwargs)
+            self._schedule_save()
+
+        return task
+
+    async def search_task(self, **kwargs) -> list[Task]:
+
+        async with self._lock:
+            return self.manager.search_task(**kwargs)
+
+    async def view_tasks(self, category=None) -> str:
+
+        async with self._lock:
+            return self.manager.view_tasks(self.manager.tasks, category=category)
+
+    async def load_json(self):
+        """
+        Перезагружает задачи из файла в пуле потоков.
+        """
+        loop = asyncio.get_running_loop()
+
+        async with self._lock:
+            await loop.run_in_executor(self._executor, self.manager.load_json)
+
+    async def save_json(self):
+        """
+        Немедленно сохраняет задачи, не дожидаясь отложенного сохранения.
+        """
+        try:
+            await self._save()
+        except Exception as e:
+            self._dirty = True
+            logger.error("Не удалось сохранить задачи: %s", e)
+            raise
+
+        logger.info("Задачи сохранены в %s", self.manager.filename)
+
+    async def flush(self):
+        """
+        Дожидается завершения запланированного сохранения.
+
+        Если отложенное сохранение не удалось, повторяет его и передаёт ошибку вызывающему коду.
+        """
+        if self._save_task is not None:
+            await self._save_task
+
+        if self._dirty:
+            await self.save_json()
+
+    async def aclose(self):
+
+        await self.flush()
+
+    async def __aenter__(self):
+
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+
+        await self.aclose()
+
+    async def _save(self) -> int:
+        """
+        Делает снимок задач и записывает его в пуле потоков. Возвращает количество задач.
+        """
+        loop = asyncio.get_running_loop()
+
+        # Снимки записываются в том порядке, в котором сделаны, поэтому более старый
+        # снимок не может перезаписать более новый
+        async with self._write_lock:
+            async with self._lock:
+                self._dirty = False
+                self.manager.dirty = False
+                tasks_dict = self.manager._dump_tasks()
+
+            # TaskManager._save выполняет сохранения по одному и при ошибке
+            # снова помечает задачи несохранёнными
+            await loop.run_in_executor(self._executor, self.manager._save, tasks_dict)
+
+        return len(tasks_dict)
+
+    def _schedule_save(self):
+
+        self._dirty = True
+
+        if self._save_task is None or self._save_task.done():
+            self._save_task = asyncio.create_task(self._save_later())
+
+    async def _save_later(self):
+        """
+        Сохраняет задачи после паузы, объединяя все изменения, накопленные за это время.
+        """
+        while self._dirty:
+            await asyncio.sleep(self.save_delay)
+
+            try:
+                count = await self._save()
+            except Exception as e:
+                # Изменения остаются несохранёнными: запись повторит следующее изменение или flush
+                self._dirty = True
+                logger.error("Не удалось сохранить задачи: %s", e)
+                return
+
+            logger.info("Задачи сохранены в %s (%d шт.)", self.manager.filename, count)
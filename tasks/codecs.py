@@ -0,0 +1,59 @@
+import bz2
+import gzip
+import lzma
+from functools import partial
+
+try:
+    from compression import zstd
+except ImportError:
+    zstd = None
+
+# Кодеки сжатия из стандартной библиотеки; zstd доступен начиная с Python 3.14
+CODECS = {
+    # Уровень 6 сжимает почти так же, как 9 по умолчанию, но заметно быстрее
+    "gzip": partial(gzip.open, compresslevel=6),
+    "bz2": bz2.open,
+    "lzma": lzma.open,
+}
+
+if zstd is not None:
+    CODECS["zstd"] = zstd.open
+
+EXTENSIONS = {
+    ".gz": "gzip",
+    ".bz2": "bz2",
+    ".xz": "lzma",
+    ".lzma": "lzma",
+    ".zst": "zstd",
+}
+
+
+def detect_compression(filename: str) -> str | None:
+    """
+    Определяет кодек сжатия по расширению файла
+    """
+    for extension, codec in EXTENSIONS.items():
+        if filename.endswith(extension):
+            return codec
+
+    return None
+
+
+def validate_compression(compression: str | None) -> str | None:
+
+    if compression is not None and compression not in CODECS:
+        raise ValueError(f"Неизвестный формат сжатия: {compression}. Допустимые значения: {', '.join(CODECS)}")
+
+    return compression
+
+
+def open_text(filename: str, mode: str, compression: str | None = None):
+    """
+    Открывает файл задач в текстовом режиме, при необходимости со сжатием.
+
+    Данные сжимаются и распаковываются потоково, по мере чтения и записи.
+    """
+    if compression is None:
+        return open(filename, mode, encoding="utf-8")
+
+    return CODECS[compression](filename, mode + "t", encoding="utf-8")
@@ -0,0 +1,164 @@
+import copy
+import threading
+from contextlib import contextmanager
+
+from .task import Task
+from .task_manager import TaskManager
+
+
+class ConcurrentTaskManager(TaskManager):
+    """
+    Потокобезопасный TaskManager с чтением по снимкам (copy-on-write).
+
+    Читатели получают текущий опубликованный словарь задач без блокировки,
+    не дожидаясь писателей, и могут обходить его сколько угодно долго:
+    опубликованный словарь больше не изменяется. Писатели выполняются по одному
+    под блокировкой и изменяют копию словаря, которая публикуется заменой ссылки
+    в конце операции; update_task изменяет копию задачи, поэтому читатели никогда
+    не видят задачу, обновлённую наполовину.
+
+    Каждая операция записи копирует словарь задач. Серию изменений можно
+    объединить в batch(), тогда словарь копируется и публикуется один раз.
+    Чтение и разбор файла при загрузке выполняются вне блокировки.
+    """
+    def __init__(self, filename="tasks.json", **kwargs):
+
+        if kwargs.get("cache_size") is not None:
+            raise ValueError("Режим ограниченной памяти не поддерживается ConcurrentTaskManager")
+
+        self._lock = threading.RLock()
+        self._writer = None
+        self._tasks = {}
+        self._draft = None
+        super().__init__(filename, **kwargs)
+
+    @property
+    def tasks(self) -> dict:
+        """
+        Для читателей — опубликованный неизменяемый снимок задач, для писателя — изменяемая копия.
+        """
+        # _writer равен ID потока, только если этот поток сам выполняет запись
+        if self._writer != threading.get_ident():
+            return self._tasks
+
+        if self._draft is None:
+            self._draft = dict(self._tasks)
+
+        return self._draft
+
+    @tasks.setter
+    def tasks(self, value: dict):
+
+        with self._writing():
+            self._draft = value
+
+    def snapshot(self) -> dict:
+        """
+        Возвращает согласованный снимок задач. Снимок нельзя изменять.
+        """
+        return self.tasks
+
+    @contextmanager
+    def _writing(self):
+
+        with self._lock:
+            previous = self._writer
+            self._writer = threading.get_ident()
+
+            try:
+                yield
+            finally:
+                self._writer = previous
+
+                # Публикация — одна замена ссылки, поэтому читатель видит словарь
+                # либо до операции записи, либо после неё
+                if previous is None and self._draft is not None:
+                    self._tasks = self._draft
+                    self._draft = None
+
+    def batch(self):
+        """
+        Объединяет несколько операций записи: изменения публикуются одним снимком в конце.
+        """
+        return self._writing()
+
+    def _task_for_update(self, task_id: str) -> Task | None:
+
+        task = self.tasks.get(task_id)
+
+        return copy.copy(task) if task is not None else None
+
+    def add_task(self, *args, **kwargs):
+
+        with self._writing():
+            return super().add_task(*args, **kwargs)
+
+    def delete_task_by_id(self, task_id: str):
+
+        with self._writing():
+            return super().delete_task_by_id(task_id)
+
+    def delete_task_by_category(self, category: str):
+
+        with self._writing():
+            return super().delete_task_by_category(category)
+
+    def delete_tasks_by_category(self, category: str) -> list[Task]:
+
+        with self._writing():
+            return super().delete_tasks_by_category(category)
+
+    def update_task(self, task_id: str, **kwargs) -> Task:
+
+        with self._writing():
+            return super().update_task(task_id, **kwargs)
+
+    def add_dependency(self, task_id: str, blocker_id: str) -> Task:
+
+        with self._writing():
+            return super().add_dependency(task_id, blocker_id)
+
+    def remove_dependency(self, task_id: str, blocker_id: str) -> Task:
+
+        with self._writing():
+            return super().remove_dependency(task_id, blocker_id)
+
+    def _reset(self, tasks: dict):
+
+        with self._writing():
+            return super()._reset(tasks)
+
+    def _apply_reload(self, tasks_data: dict) -> tuple[int, int, int]:
+
+        with self._writing():
+            return super()._apply_reload(tasks_data)
+
+    # Индексы обновляются писателями, поэтому запросы к ним выполняются под блокировкой.
+    # Сами запросы короткие, и читатели ждут не дольше одной операции записи.
+    # short_id (его вызывает view_tasks для каждой строки) блокировка не нужна:
+    # индекс ID публикует новый список при каждом изменении.
+
+    def next_tasks(self, *args, **kwargs) -> list[Task]:
+
+        with self._lock:
+            return super().next_tasks(*args, **kwargs)
+
+    def fuzzy_search(self, *args, **kwargs) -> list[Task]:
+
+        with self._lock:
+            return super().fuzzy_search(*args, **kwargs)
+
+    def resolve_id(self, prefix: str) -> str:
+
+        with self._lock:
+            return super().resolve_id(prefix)
+
+    def ready_tasks(self) -> list[Task]:
+
+        with self._lock:
+            return super().ready_tasks()
+
+    def recent_tasks(self, *args, **kwargs) -> list[Task]:
+
+        with self._lock:
+            return super().recent_tasks(*args, **kwargs)
@@ -0,0 +1,220 @@
+import logging
+from collections import deque
+
+from .task import Task
+from .listeners import TaskListener
+
+logger = logging.getLogger(__name__)
+
+
+class DependencyGraph(TaskListener):
+    """
+    Граф зависимостей "задача заблокирована задачей" с инкрементальным топологическим порядком.
+
+    Для каждой задачи хранится число невыполненных блокирующих задач, поэтому
+    выполнение задачи разблокирует зависимые за время, пропорциональное их числу.
+    Топологический порядок поддерживается алгоритмом Пирса — Келли: при добавлении
+    связи переупорядочивается только участок графа между её концами.
+    """
+    def __init__(self):
+
+        self.on_reset({})
+
+    def on_reset(self, tasks: dict):
+
+        self._order = {}
+        self._next_order = 0
+        self._done = {}
+        self._blockers = {}
+        self._dependents = {}
+        self._open_blockers = {}
+        self._ready = set()
+
+        for task in tasks.values():
+            self._add_node(task)
+
+        for task in tasks.values():
+            for blocker_id in task.blocked_by:
+                if blocker_id in self._done:
+                    self._link(blocker_id, task.id)
+
+        self._order = self._kahn_order()
+        self._next_order = len(self._order)
+
+    def _kahn_order(self) -> dict:
+
+        indegree = {task_id: len(blockers) for task_id, blockers in self._blockers.items()}
+        queue = deque(task_id for task_id, degree in indegree.items() if degree == 0)
+        order = {}
+
+        while queue:
+            task_id = queue.popleft()
+            order[task_id] = len(order)
+
+            for dependent in self._dependents[task_id]:
+                indegree[dependent] -= 1
+
+                if indegree[dependent] == 0:
+                    queue.append(dependent)
+
+        if len(order) < len(indegree):
+            cyclic = [task_id for task_id in indegree if task_id not in order]
+            logger.error("В зависимостях задач обнаружен цикл: %s", cyclic)
+
+            for task_id in cyclic:
+                order[task_id] = len(order)
+
+        return order
+
+    def _add_node(self, task: Task):
+
+        self._order[task.id] = self._next_order
+        self._next_order += 1
+        self._done[task.id] = task.status == "выполнено"
+        self._blockers[task.id] = set()
+        self._dependents[task.id] = set()
+        self._open_blockers[task.id] = 0
+        self._update_ready(task.id)
+
+    def _update_ready(self, task_id: str):
+
+        if not self._done[task_id] and self._open_blockers[task_id] == 0:
+            self._ready.add(task_id)
+        else:
+            self._ready.discard(task_id)
+
+    def _link(self, blocker_id: str, task_id: str):
+
+        self._blockers[task_id].add(blocker_id)
+        self._dependents[blocker_id].add(task_id)
+
+        if not self._done[blocker_id]:
+            self._open_blockers[task_id] += 1
+            self._update_ready(task_id)
+
+    def _unlink(self, blocker_id: str, task_id: str):
+
+        self._blockers[task_id].discard(blocker_id)
+        self._dependents[blocker_id].discard(task_id)
+
+        if not self._done[blocker_id]:
+            self._open_blockers[task_id] -= 1
+            self._update_ready(task_id)
+
+    def _reach(self, start: str, edges: dict, allowed) -> set:
+
+        seen = {start}
+        stack = [start]
+
+        while stack:
+            for neighbour in edges[stack.pop()]:
+                if neighbour not in seen and allowed(neighbour):
+                    seen.add(neighbour)
+                    stack.append(neighbour)
+
+        return seen
+
+    def check(self, blocker_id: str, task_id: str):
+        """
+        Проверяет, что связь "task_id заблокирована blocker_id" не создаёт цикл.
+        """
+        for node in (blocker_id, task_id):
+            if node not in self._order:
+                raise ValueError(f"Задача с id {node} отсутствует в списке.")
+
+        if blocker_id == task_id:
+            raise ValueError("Задача не может блокировать сама себя")
+
+        upper = self._order[blocker_id]
+
+        if self._order[task_id] > upper:
+            return
+
+        if blocker_id in self._reach(task_id, self._dependents, lambda node: self._order[node] <= upper):
+            raise ValueError(f"Зависимость создаёт цикл: задача {blocker_id} уже зависит от задачи {task_id}")
+
+    def _add_edge(self, blocker_id: str, task_id: str):
+
+        lower, upper = self._order[task_id], self._order[blocker_id]
+
+        if lower < upper:
+            forward = self._reach(task_id, self._dependents, lambda node: self._order[node] <= upper)
+            backward = self._reach(blocker_id, self._blockers, lambda node: self._order[node] >= lower)
+
+            # Блокирующие задачи встают перед зависимыми на тех же позициях
+            slots = sorted(self._order[node] for node in forward | backward)
+            nodes = sorted(backward, key=self._order.get) + sorted(forward, key=self._order.get)
+
+            for slot, node in zip(slots, nodes):
+                self._order[node] = slot
+
+        self._link(blocker_id, task_id)
+
+    def on_add(self, task: Task):
+
+        self._add_node(task)
+
+        for blocker_id in task.blocked_by:
+            if blocker_id in self._order:
+                self._add_edge(blocker_id, task.id)
+
+    def on_update(self, task: Task, old: dict):
+
+        done = task.status == "выполнено"
+
+        if done != self._done[task.id]:
+            self._done[task.id] = done
+            delta = -1 if done else 1
+
+            for dependent in self._dependents[task.id]:
+                self._open_blockers[dependent] += delta
+                self._update_ready(dependent)
+
+            self._update_ready(task.id)
+
+        for blocker_id in old["blocked_by"] - task.blocked_by:
+            if blocker_id in self._order:
+                self._unlink(blocker_id, task.id)
+
+        for blocker_id in task.blocked_by - old["blocked_by"]:
+            if blocker_id in self._order:
+                try:
+                    self.check(blocker_id, task.id)
+                except ValueError as e:
+                    logger.error("Зависимость %s -> %s пропущена: %s", blocker_id, task.id, e)
+                    continue
+
+                self._add_edge(blocker_id, task.id)
+
+    def on_delete(self, task: Task):
+
+        for dependent in list(self._dependents[task.id]):
+            self._unlink(task.id, dependent)
+
+        for blocker_id in list(self._blockers[task.id]):
+            self._unlink(blocker_id, task.id)
+
+        for mapping in (self._order, self._done, self._blockers, self._dependents, self._open_blockers):
+            del mapping[task.id]
+
+        self._ready.discard(task.id)
+
+    def is_blocked(self, task_id: str) -> bool:
+
+        return self._open_blockers.get(task_id, 0) > 0
+
+    def ready(self) -> set[str]:
+        """
+        Возвращает ID невыполненных задач, у которых нет невыполненных блокирующих задач.
+        """
+        return set(self._ready)
+
+    def dependents(self, task_id: str) -> set[str]:
+
+        return set(self._dependents.get(task_id, ()))
+
+    def topological_order(self) -> list[str]:
+        """
+        Возвращает ID задач так, что каждая блокирующая задача идёт раньше зависимых.
+        """
+        return sorted(self._order, key=self._order.get)
@@ -0,0 +1,178 @@
+import csv
+import sys
+import json
+import struct
+from array import array
+from datetime import datetime
+from itertools import islice
+
+COLUMNS = ("id", "title", "description", "category", "due_date", "priority", "status")
+
+# Колонки с небольшим числом различных значений кодируются словарём
+DICTIONARY_COLUMNS = ("category", "priority", "status")
+
+MAGIC = b"TCOL1\n"
+
+_UINT32 = struct.Struct("<I")
+
+
+def iter_batches(tasks, batch_size: int = 10000):
+    """
+    Лениво разбивает задачи на пакеты по batch_size и отдаёт каждый пакет как словарь колонок.
+
+    Значения читаются из атрибутов задач напрямую, без промежуточных словарей to_dict.
+    """
+    if batch_size < 1:
+        raise ValueError("Размер пакета должен быть положительным числом")
+
+    tasks = iter(tasks)
+
+    while True:
+        batch = list(islice(tasks, batch_size))
+
+        if not batch:
+            return
+
+        yield {column: [getattr(task, column) for task in batch] for column in COLUMNS}
+
+
+def write_csv(tasks, file, batch_size: int = 10000) -> int:
+    """
+    Записывает задачи в CSV по пакетам. Возвращает количество записанных строк.
+    """
+    writer = csv.writer(file)
+    writer.writerow(COLUMNS)
+    rows = 0
+
+    for batch in iter_batches(tasks, batch_size):
+        batch["due_date"] = [due_date.strftime("%d.%m.%Y") for due_date in batch["due_date"]]
+        writer.writerows(zip(*(batch[column] for column in COLUMNS)))
+        rows += len(batch["id"])
+
+    return rows
+
+
+def _int_array(typecode: str, values) -> bytes:
+
+    data = array(typecode, values)
+
+    # Формат файла фиксирован как little-endian
+    if sys.byteorder == "big":
+        data.byteswap()
+
+    return data.tobytes()
+
+
+def _read_int_array(file, typecode: str, count: int) -> list:
+
+    data = array(typecode)
+    data.frombytes(file.read(count * data.itemsize))
+
+    if sys.byteorder == "big":
+        data.byteswap()
+
+    return data.tolist()
+
+
+def _pack_strings(values: list[str]) -> bytes:
+
+    encoded = [value.encode("utf-8") for value in values]
+    blob = b"".join(encoded)
+
+    return _int_array("I", map(len, encoded)) + _UINT32.pack(len(blob)) + blob
+
+
+def _unpack_strings(file, count: int) -> list[str]:
+
+    lengths = _read_int_array(file, "I", count)
+    blob = file.read(_UINT32.unpack(file.read(4))[0])
+    values = []
+    offset = 0
+
+    for length in lengths:
+        values.append(blob[offset:offset + length].decode("utf-8"))
+        offset += length
+
+    return values
+
+
+def write_columnar(tasks, file, batch_size: int = 10000) -> int:
+    """
+    Записывает задачи в бинарный колоночный файл. Возвращает количество записанных строк.
+
+    Формат: MAGIC, JSON-заголовок с описанием колонок, затем пакеты. Пакет начинается
+    с числа строк; строковые колонки записаны как длины + UTF-8 данные, due_date — как
+    миллисекунды Unix-времени (int64), а словарные колонки — как новые значения словаря
+    этого пакета + коды (uint32). Словари накапливаются от пакета к пакету.
+    """
+    header = json.dumps({
+        "columns": [
+            {"name": column, "type": "dictionary" if column in DICTIONARY_COLUMNS else "timestamp" if column == "due_date" else "string"}
+            for column in COLUMNS
+        ],
+        "byteorder": "little"
+    }).encode("utf-8")
+
+    file.write(MAGIC + _UINT32.pack(len(header)) + header)
+
+    dictionaries = {column: {} for column in DICTIONARY_COLUMNS}
+    rows = 0
+
+    for batch in iter_batches(tasks, batch_size):
+        count = len(batch["id"])
+        file.write(_UINT32.pack(count))
+
+        for column in COLUMNS:
+            values = batch[column]
+
+            if column in DICTIONARY_COLUMNS:
+                dictionary = dictionaries[column]
+                known = len(dictionary)
+                codes = [dictionary.setdefault(value, len(dictionary)) for value in values]
+                new_values = list(dictionary)[known:]
+
+                file.write(_UINT32.pack(len(new_values)) + _pack_strings(new_values) + _int_array("I", codes))
+            elif column == "due_date":
+                file.write(_int_array("q", (int(value.timestamp() * 1000) for value in values)))
+            else:
+                file.write(_pack_strings(values))
+
+        rows += count
+
+    file.write(_UINT32.pack(0))
+
+    return rows
+
+
+def read_columnar(file):
+    """
+    Читает бинарный колоночный файл и отдаёт пакеты как словари колонок.
+    """
+    if file.read(len(MAGIC)) != MAGIC:
+        raise ValueError("Файл не является колоночным экспортом задач")
+
+    header = json.loads(file.read(_UINT32.unpack(file.read(4))[0]))
+    columns = [column["name"] for column in header["columns"]]
+    types = {column["name"]: column["type"] for column in header["columns"]}
+    dictionaries = {column: [] for column in columns if types[column] == "dictionary"}
+
+    while True:
+        count = _UINT32.unpack(file.read(4))[0]
+
+        if count == 0:
+            return
+
+        batch = {}
+
+        for column in columns:
+            if types[column] == "dictionary":
+                dictionary = dictionaries[column]
+                new_count = _UINT32.unpack(file.read(4))[0]
+                dictionary.extend(_unpack_strings(file, new_count))
+                batch[column] = [dictionary[code] for code in _read_int_array(file, "I", count)]
+            elif types[column] == "timestamp":
+                batch[column] = [datetime.fromtimestamp(value / 1000) for value in _read_int_array(file, "q", count)]
+            else:
+                batch[column] = _unpack_strings(file, count)
+
+        yield batch
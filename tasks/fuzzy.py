@@ -0,0 +1,145 @@
+import re
+import heapq
+from math import ceil
+from collections import Counter
+
+from .task import Task
+from .listeners import TaskListener
+
+INDEXED_FIELDS = ("title", "description", "category")
+
+_WORD_RE = re.compile(r"\w+")
+
+
+def trigrams(text: str) -> frozenset[str]:
+    """
+    Разбивает текст на символьные триграммы слов.
+
+    Слова дополняются пробелами (два в начале, один в конце), поэтому
+    начало слова весит больше, а короткие слова тоже дают триграммы.
+    """
+    text = text.lower().replace("ё", "е")
+    result = set()
+
+    for word in _WORD_RE.findall(text):
+        padded = f"  {word} "
+        result.update(padded[i:i + 3] for i in range(len(padded) - 2))
+
+    return frozenset(result)
+
+
+class TrigramIndex(TaskListener):
+    """
+    Триграммный индекс по названию, описанию и категории задач для нечёткого поиска.
+
+    Похожесть задачи на запрос: доля триграмм запроса, найденных в задаче; при равной
+    доле выше задача с меньшим числом триграмм (больше коэффициент Жаккара).
+
+    Списки задач по триграммам разбиты на группы по числу триграмм задачи. Группы
+    обходятся от меньших задач к большим: как только найдено limit результатов,
+    группа, где совпасть может не больше триграмм, чем у худшего из них, пропускается
+    целиком, а внутри группы кандидаты берутся только из самых редких триграмм
+    (префиксный фильтр), и частые триграммы лишь проверяются у этих кандидатов.
+    Поэтому частые слова запроса не требуют обхода всех задач, где они встречаются.
+    """
+    def __init__(self):
+
+        self._buckets = {}
+        self._grams = {}
+
+    def __len__(self) -> int:
+
+        return len(self._grams)
+
+    def on_add(self, task: Task):
+
+        grams = trigrams(" ".join(getattr(task, field) for field in INDEXED_FIELDS))
+        self._grams[task.id] = grams
+        postings = self._buckets.setdefault(len(grams), {})
+
+        for gram in grams:
+            postings.setdefault(gram, set()).add(task.id)
+
+    def on_update(self, task: Task, old: dict):
+
+        if all(getattr(task, field) == old[field] for field in INDEXED_FIELDS):
+            return
+
+        self.on_delete(task)
+        self.on_add(task)
+
+    def on_delete(self, task: Task):
+
+        grams = self._grams.pop(task.id, None)
+
+        if grams is None:
+            return
+
+        postings = self._buckets[len(grams)]
+
+        for gram in grams:
+            ids = postings[gram]
+            ids.discard(task.id)
+
+            if not ids:
+                del postings[gram]
+
+        if not postings:
+            del self._buckets[len(grams)]
+
+    def on_reset(self, tasks: dict):
+
+        self._buckets = {}
+        self._grams = {}
+
+        for task in tasks.values():
+            self.on_add(task)
+
+    def search(self, query: str, limit: int = 10, threshold: float = 0.3) -> list[tuple[str, float]]:
+        """
+        Возвращает до limit пар (ID задачи, похожесть) по убыванию похожести.
+        """
+        query_grams = trigrams(query)
+
+        if not query_grams or limit <= 0:
+            return []
+
+        required = max(1, ceil(threshold * len(query_grams)))
+
+        # Куча худших из лучших: (совпадения, -число триграмм, ID)
+        best = []
+
+        for size in sorted(self._buckets):
+            postings = self._buckets[size]
+            lists = sorted((postings[gram] for gram in query_grams if gram in postings), key=len)
+
+            # Задачи этой группы больше уже найденных, поэтому войдут в результат,
+            # только если совпадений строго больше, чем у худшего из limit лучших
+            needed = max(required, best[0][0] + 1) if len(best) == limit else required
+
+            if len(lists) < needed:
+                continue
+
+            # Задача, набравшая needed совпадений, есть хотя бы в одном из самых редких списков
+            prefix = len(lists) - needed + 1
+            counts = Counter()
+
+            for ids in lists[:prefix]:
+                counts.update(ids)
+
+            for ids in lists[prefix:]:
+                for task_id in counts.keys() & ids:
+                    counts[task_id] += 1
+
+            for task_id, count in counts.items():
+                if count < needed:
+                    continue
+
+                item = (count, -size, task_id)
+
+                if len(best) < limit:
+                    heapq.heappush(best, item)
+                elif item > best[0]:
+                    heapq.heapreplace(best, item)
+
+        return [(task_id, round(count / len(query_grams), 3)) for count, _, task_id in sorted(best, reverse=True)]
@@ -0,0 +1,257 @@
+import os
+import json
+import logging
+import threading
+from bisect import bisect_right
+from datetime import datetime
+
+from .task import Task
+from .listeners import TaskListener
+
+logger = logging.getLogger(__name__)
+
+FIELDS = ("title", "description", "category", "due_date", "priority", "status", "blocked_by")
+
+
+def _timestamp(value: datetime) -> str:
+
+    # Строки одного формата сравниваются так же, как даты
+    return value.isoformat(timespec="microseconds")
+
+
+class ChangeHistory(TaskListener):
+    """
+    История изменений задач с контрольными снимками для запросов на прошлую дату.
+
+    Каждое изменение записывается в журнал (JSONL) отдельной строкой: для добавленной
+    задачи — её словарь, для обновлённой — только изменившиеся поля, для удалённой — ID.
+    Контрольный снимок всех задач делается, когда число изменений с прошлого снимка
+    достигает max(checkpoint_interval, количество задач в прошлом снимке), поэтому объём истории растёт
+    пропорционально числу изменений, а восстановление состояния на дату требует
+    прочитать один снимок и не больше этого числа записей журнала.
+
+    Рядом с файлом задач хранятся три файла:
+
+        <файл>.history.jsonl: журнал изменений
+        <файл>.checkpoints.jsonl: контрольные снимки
+        <файл>.history.idx: индекс снимков — время, смещение в журнале и смещение снимка
+
+    Записи накапливаются в памяти и записываются на диск при сохранении задач (flush).
+
+    Файл задач могут менять и без записи истории (библиотечный TaskManager, реестр,
+    AsyncTaskManager). Поэтому при загрузке задач состояние, восстановленное по истории,
+    сравнивается с загруженным, и при расхождении делается новый контрольный снимок:
+    изменения, сделанные без истории, попадают в неё одним снимком.
+    """
+    def __init__(self, manager, checkpoint_interval: int = 1000):
+
+        if checkpoint_interval < 1:
+            raise ValueError("Интервал контрольных снимков должен быть положительным числом")
+
+        self.manager = manager
+        self.checkpoint_interval = checkpoint_interval
+        self.log_path = f"{manager.filename}.history.jsonl"
+        self.checkpoints_path = f"{manager.filename}.checkpoints.jsonl"
+        self.index_path = f"{manager.filename}.history.idx"
+        self._pending = []
+        self._edits = 0
+        self._threshold = checkpoint_interval
+        self._lock = threading.Lock()
+
+    def _record(self, record: dict):
+
+        record = {"ts": _timestamp(datetime.now()), **record}
+
+        with self._lock:
+            self._pending.append(("edit", record))
+            self._edits += 1
+
+            if self._edits >= self._threshold:
+                self._checkpoint(record["ts"])
+
+    def _checkpoint(self, ts: str, tasks: dict | None = None):
+
+        tasks = {task_id: task.to_dict() for task_id, task in list((self.manager.tasks if tasks is None else tasks).items())}
+        self._pending.append(("checkpoint", ts, tasks))
+        self._edits = 0
+        # Снимок из n задач окупается не раньше, чем через n изменений
+        self._threshold = max(self.checkpoint_interval, len(tasks))
+
+    def on_add(self, task: Task):
+
+        self._record({"op": "add", "id": task.id, "task": task.to_dict()})
+
+    def on_update(self, task: Task, old: dict):
+
+        new = task.snapshot()
+        changed = [field for field in FIELDS if new[field] != old[field]]
+
+        if not changed:
+            return
+
+        data = task.to_dict()
+        self._record({"op": "update", "id": task.id, "fields": {field: data.get(field) for field in changed}})
+
+    def on_delete(self, task: Task):
+
+        self._record({"op": "delete", "id": task.id})
+
+    def on_reset(self, tasks: dict):
+
+        with self._lock:
+            self._pending = []
+            index = self._read_index()
+
+            if not index:
+                # Первый снимок задаёт начальное состояние, от которого ведётся история
+                self._checkpoint(_timestamp(datetime.now()), tasks)
+                return
+
+            latest = self._replay_from_disk()
+            current = {task_id: task.to_dict() for task_id, task in list(tasks.items())}
+
+            if latest != current:
+                logger.warning("Задачи в %s изменены без записи истории, сделан новый контрольный снимок", self.manager.filename)
+                self._checkpoint(_timestamp(datetime.now()), tasks)
+                return
+
+            # Изменения после последнего снимка учитываются при выборе момента следующего
+            self._edits = 0
+            self._threshold = max(self.checkpoint_interval, len(tasks))
+
+            if os.path.exists(self.log_path):
+                with open(self.log_path, "rb") as file:
+                    file.seek(index[-1]["log"])
+                    self._edits = sum(1 for _ in file)
+
+    def _read_index(self) -> list[dict]:
+
+        if not os.path.exists(self.index_path):
+            return []
+
+        with open(self.index_path, "r", encoding="utf-8") as file:
+            return [json.loads(line) for line in file if line.strip()]
+
+    def flush(self):
+        """
+        Записывает накопленные изменения и контрольные снимки на диск.
+        """
+        with self._lock:
+            if not self._pending:
+                return
+
+            with open(self.log_path, "ab") as log, open(self.checkpoints_path, "ab") as checkpoints, open(self.index_path, "a", encoding="utf-8") as index:
+                for entry in self._pending:
+                    if entry[0] == "edit":
+                        log.write(json.dumps(entry[1], ensure_ascii=False).encode("utf-8") + b"\n")
+                        continue
+
+                    _, ts, tasks = entry
+                    offset = checkpoints.tell()
+                    checkpoints.write(json.dumps({"ts": ts, "tasks": tasks}, ensure_ascii=False).encode("utf-8") + b"\n")
+                    index.write(json.dumps({"ts": ts, "log": log.tell(), "checkpoint": offset}) + "\n")
+
+            logger.info("История изменений записана: %d записей", len(self._pending))
+            self._pending = []
+
+    @staticmethod
+    def _apply(tasks: dict, record: dict):
+
+        if record["op"] == "add":
+            tasks[record["id"]] = record["task"]
+        elif record["op"] == "update":
+            # Задачу могли добавить без записи истории: без полного словаря её не восстановить
+            if record["id"] not in tasks:
+                logger.warning("Изменение задачи %s, отсутствующей в истории, пропущено", record["id"])
+                return
+
+            data = {**tasks[record["id"]], **record["fields"]}
+            tasks[record["id"]] = {field: value for field, value in data.items() if value is not None}
+        else:
+            tasks.pop(record["id"], None)
+
+    def as_of(self, when: datetime) -> dict[str, Task]:
+        """
+        Восстанавливает задачи в состоянии на момент when.
+
+        Состояние строится от ближайшего контрольного снимка не позже when,
+        затем применяются записи журнала до when включительно.
+        """
+        stamp = _timestamp(when)
+
+        with self._lock:
+            pending = list(self._pending)
+
+        tasks = None
+        start = 0
+
+        # Снимок, ещё не записанный на диск, ближе к when, чем любой снимок на диске
+        for position in range(len(pending) - 1, -1, -1):
+            entry = pending[position]
+
+            if entry[0] == "checkpoint" and entry[1] <= stamp:
+                tasks = dict(entry[2])
+                start = position + 1
+                break
+
+        if tasks is None:
+            tasks = self._replay_from_disk(stamp)
+
+        if tasks is None:
+            message = self._unavailable_message(pending)
+            logger.error("Не удалось восстановить задачи на %s: %s", stamp, message)
+            raise ValueError(message)
+
+        for entry in pending[start:]:
+            if entry[0] == "edit":
+                if entry[1]["ts"] > stamp:
+                    break
+
+                self._apply(tasks, entry[1])
+
+        return self._build(tasks)
+
+    def _unavailable_message(self, pending: list) -> str:
+
+        index = self._read_index()
+        first = index[0]["ts"] if index else next((entry[1] for entry in pending if entry[0] == "checkpoint"), None)
+
+        if first is None:
+            return "История изменений пуста"
+
+        return f"История изменений доступна начиная с {datetime.fromisoformat(first).strftime('%d.%m.%Y %H:%M')}"
+
+    def _replay_from_disk(self, stamp: str | None = None) -> dict | None:
+        """
+        Восстанавливает словари задач на момент stamp по истории на диске (без stamp — последнее состояние).
+        """
+        index = self._read_index()
+        position = len(index) - 1 if stamp is None else bisect_right([entry["ts"] for entry in index], stamp) - 1
+
+        if position < 0:
+            return None
+
+        entry = index[position]
+
+        with open(self.checkpoints_path, "rb") as file:
+            file.seek(entry["checkpoint"])
+            tasks = json.loads(file.readline())["tasks"]
+
+        if os.path.exists(self.log_path):
+            with open(self.log_path, "rb") as file:
+                file.seek(entry["log"])
+
+                for line in file:
+                    record = json.loads(line)
+
+                    if stamp is not None and record["ts"] > stamp:
+                        break
+
+                    self._apply(tasks, record)
+
+        return tasks
+
+    @staticmethod
+    def _build(tasks: dict) -> dict[str, Task]:
+
+        return {task_id: Task.from_dict(data, task_id) for task_id, data in tasks.items()}
@@ -0,0 +1,145 @@
+import os
+import uuid
+import threading
+from bisect import bisect_left, insort
+from datetime import datetime
+
+from .listeners import TaskListener
+
+_lock = threading.Lock()
+_last_ms = 0
+_seq = 0
+
+
+def new_task_id() -> str:
+    """
+    Создаёт упорядоченный по времени ID задачи в формате UUIDv7.
+
+    Первые 48 бит — время создания в миллисекундах, поэтому лексикографический
+    порядок ID совпадает с порядком создания задач. Внутри одной миллисекунды
+    порядок сохраняется за счёт счётчика.
+    """
+    global _last_ms, _seq
+
+    with _lock:
+        ms = int(datetime.now().timestamp() * 1000)
+
+        if ms > _last_ms:
+            _last_ms = ms
+            _seq = int.from_bytes(os.urandom(2), "big") & 0x7FF
+        else:
+            _seq += 1
+
+            if _seq > 0xFFF:
+                _last_ms += 1
+                _seq = 0
+
+        ms, seq = _last_ms, _seq
+
+    rand_b = int.from_bytes(os.urandom(8), "big") & ((1 << 62) - 1)
+    value = (ms << 80) | (0x7 << 76) | (seq << 64) | (0b10 << 62) | rand_b
+
+    return str(uuid.UUID(int=value))
+
+
+def _time_prefix(moment: datetime) -> str:
+
+    digits = f"{int(moment.timestamp() * 1000):012x}"
+
+    return f"{digits[:8]}-{digits[8:]}"
+
+
+def id_created_at(task_id: str) -> datetime | None:
+    """
+    Возвращает время создания для ID в формате UUIDv7 и None для остальных ID.
+    """
+    if len(task_id) != 36 or task_id[14] != "7":
+        return None
+
+    return datetime.fromtimestamp(int(task_id[:8] + task_id[9:13], 16) / 1000)
+
+
+class IdIndex(TaskListener):
+    """
+    Отсортированный список ID задач.
+
+    Позволяет за O(log n) находить задачу по уникальному префиксу ID,
+    вычислять кратчайший однозначный префикс и выбирать задачи,
+    созданные в заданный промежуток времени.
+
+    Список не изменяется на месте: изменение строит новый список и заменяет ссылку,
+    поэтому запросы можно выполнять без блокировки, пока другой поток меняет задачи.
+    """
+    def __init__(self):
+
+        self._ids = []
+
+    def __len__(self) -> int:
+
+        return len(self._ids)
+
+    def on_add(self, task):
+
+        ids = list(self._ids)
+        insort(ids, task.id)
+        self._ids = ids
+
+    def on_delete(self, task):
+
+        ids = self._ids
+        i = bisect_left(ids, task.id)
+
+        if i < len(ids) and ids[i] == task.id:
+            self._ids = ids[:i] + ids[i + 1:]
+
+    def on_reset(self, tasks: dict):
+
+        self._ids = sorted(tasks)
+
+    def resolve(self, prefix: str) -> str:
+        """
+        Возвращает полный ID по его уникальному префиксу.
+        """
+        ids = self._ids
+        prefix = prefix.lower()
+        i = bisect_left(ids, prefix)
+
+        if i == len(ids) or not ids[i].startswith(prefix):
+            raise ValueError(f"Задача с id {prefix} отсутствует в списке.")
+
+        if i + 1 < len(ids) and ids[i + 1].startswith(prefix):
+            raise ValueError(f"Префикс {prefix} соответствует нескольким задачам, укажите ID длиннее.")
+
+        return ids[i]
+
+    def short_id(self, task_id: str, min_length: int = 10) -> str:
+        """
+        Возвращает кратчайший (но не короче min_length) однозначный префикс ID.
+        """
+        ids = self._ids
+        i = bisect_left(ids, task_id)
+        length = min_length
+
+        for j in (i - 1, i + 1):
+            if 0 <= j < len(ids):
+                other = ids[j]
+                common = 0
+
+                while common < min(len(task_id), len(other)) and task_id[common] == other[common]:
+                    common += 1
+
+                length = max(length, common + 1)
+
+        return task_id[:length]
+
+    def created_between(self, start: datetime, end: datetime | None = None):
+        """
+        Перебирает ID в формате UUIDv7, созданные в промежутке [start, end), по порядку создания.
+        """
+        ids = self._ids
+        lo = bisect_left(ids, _time_prefix(start))
+        hi = len(ids) if end is None else bisect_left(ids, _time_prefix(end))
+
+        for task_id in ids[lo:hi]:
+            if id_created_at(task_id) is not None:
+                yield task_id
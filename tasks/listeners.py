@@ -0,0 +1,26 @@
+class TaskListener:
+    """
+    Базовый класс слушателя изменений в TaskManager.
+
+    Индексы и подсистемы, которые поддерживают состояние инкрементально,
+    переопределяют нужные методы и подписываются через TaskManager.add_listener.
+    """
+    def on_add(self, task):
+        """
+        Вызывается после добавления задачи
+        """
+
+    def on_update(self, task, old: dict):
+        """
+        Вызывается после обновления задачи. old содержит значения полей до изменения
+        """
+
+    def on_delete(self, task):
+        """
+        Вызывается после удаления задачи
+        """
+
+    def on_reset(self, tasks: dict):
+        """
+        Вызывается после загрузки задач и при подписке: слушатель перестраивает состояние целиком
+        """
@@ -0,0 +1,164 @@
+import logging
+from math import ceil
+from calendar import monthrange
+from datetime import datetime, timedelta
+
+logger = logging.getLogger(__name__)
+
+
+class Recurrence:
+    """
+    Правило повторения задачи.
+
+    Атрибуты:
+
+        kind: Тип повторения: 'daily', 'weekly' или 'monthly'
+        interval: Каждые N дней, недель или месяцев
+        weekdays: Дни недели для 'weekly' (0 — понедельник, 6 — воскресенье)
+    """
+    KINDS = {"daily", "weekly", "monthly"}
+
+    def __init__(self, kind: str, interval: int = 1, weekdays: list[int] | None = None):
+
+        if kind not in self.KINDS:
+            logger.error("Неверный тип повторения задачи: %s", kind)
+            raise ValueError("Тип повторения должен быть 'daily', 'weekly' или 'monthly'")
+
+        if not isinstance(interval, int) or interval < 1:
+            logger.error("Неверный интервал повторения задачи: %s", interval)
+            raise ValueError("Интервал повторения должен быть положительным целым числом")
+
+        weekdays = sorted(set(weekdays or []))
+
+        if any(not 0 <= day <= 6 for day in weekdays):
+            logger.error("Неверные дни недели для повторения задачи: %s", weekdays)
+            raise ValueError("Дни недели должны быть числами от 0 (понедельник) до 6 (воскресенье)")
+
+        if weekdays and kind != "weekly":
+            raise ValueError("Дни недели можно указать только для еженедельного повторения")
+
+        self.kind = kind
+        self.interval = interval
+        self.weekdays = weekdays
+
+    def __repr__(self):
+
+        return f"Recurrence(kind={self.kind!r}, interval={self.interval}, weekdays={self.weekdays})"
+
+    def __eq__(self, other) -> bool:
+
+        if isinstance(other, Recurrence):
+            return self.to_dict() == other.to_dict()
+
+        return False
+
+    def to_dict(self) -> dict:
+
+        data = {"kind": self.kind, "interval": self.interval}
+
+        if self.weekdays:
+            data["weekdays"] = self.weekdays
+
+        return data
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "Recurrence":
+
+        return cls(data["kind"], data.get("interval", 1), data.get("weekdays"))
+
+    def occurrences(self, start: datetime, window_start: datetime, window_end: datetime):
+        """
+        Лениво перебирает даты повторений начиная со start, попадающие в [window_start, window_end).
+
+        Повторения до начала окна не перебираются: первое подходящее вычисляется сразу,
+        поэтому стоимость зависит только от количества дат внутри окна.
+        """
+        if window_end <= window_start:
+            return
+
+        if self.kind == "daily":
+            yield from self._daily(start, window_start, window_end)
+        elif self.kind == "weekly":
+            yield from self._weekly(start, window_start, window_end)
+        else:
+            yield from self._monthly(start, window_start, window_end)
+
+    def _daily(self, start, window_start, window_end):
+
+        step = timedelta(days=self.interval)
+        current = start + step * max(0, ceil((window_start - start) / step))
+
+        while current < window_end:
+            yield current
+            current += step
+
+    def _weekly(self, start, window_start, window_end):
+
+        days = self.weekdays or [start.weekday()]
+        first_week = start - timedelta(days=start.weekday())
+
+        weeks = max(0, (window_start - first_week).days // 7)
+        week = first_week + timedelta(weeks=weeks - weeks % self.interval)
+
+        while week < window_end:
+            for day in days:
+                current = week + timedelta(days=day)
+
+                if current >= window_end:
+                    return
+
+                if current >= start and current >= window_start:
+                    yield current
+
+            week += timedelta(weeks=self.interval)
+
+    def _monthly(self, start, window_start, window_end):
+
+        months = max(0, (window_start.year - start.year) * 12 + window_start.month - start.month - 1)
+        months -= months % self.interval
+
+        while True:
+            year, month = divmod(start.month - 1 + months, 12)
+            year += start.year
+            month += 1
+
+            # Для коротких месяцев берётся последний день месяца
+            current = start.replace(year=year, month=month, day=min(start.day, monthrange(year, month)[1]))
+
+            if current >= window_end:
+                return
+
+            if current >= window_start:
+                yield current
+
+            months += self.interval
+
+
+class TaskOccurrence:
+    """
+    Повторение задачи на конкретную дату.
+
+    Все атрибуты, кроме due_date, берутся из исходной задачи; ID совпадает с ID задачи,
+    поэтому изменение и удаление повторения применяется к правилу целиком.
+    """
+    def __init__(self, task, due_date: datetime):
+
+        self.task = task
+        self.due_date = due_date
+
+    def __getattr__(self, name):
+
+        return getattr(self.task, name)
+
+    @property
+    def key(self) -> str:
+
+        return f"{self.task.id}@{self.due_date.strftime('%Y%m%d%H%M')}"
+
+    def __repr__(self):
+
+        return f"Повторение задачи: {self.task.title}, Срок выполнения до: {self.due_date.strftime('%d.%m.%Y')}"
+
+    def to_dict(self) -> dict:
+
+        return {**self.task.to_dict(), "due_date": self.due_date.strftime('%d.%m.%Y')}
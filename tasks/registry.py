@@ -0,0 +1,276 @@
+import os
+import logging
+import threading
+from collections import Counter, OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Callable
+
+from .task import Task
+from .codecs import EXTENSIONS
+from .task_manager import TaskManager
+from .concurrent import ConcurrentTaskManager
+
+logger = logging.getLogger(__name__)
+
+
+class TaskManagerRegistry:
+    """
+    Реестр менеджеров задач для серверного развёртывания с файлом задач на каждую команду.
+
+    Менеджеры открываются по имени файла по запросу. Одновременно загружено
+    не более max_open менеджеров: при вытеснении давно не использованного
+    менеджера его несохранённые изменения записываются в файл. Пул потоков
+    общий для всех менеджеров и используется для параллельных запросов по всем файлам.
+
+    Менеджер, взятый через lease (или acquire), не вытесняется, пока его не вернут:
+    иначе следующий get открыл бы второй менеджер того же файла, и сохранения
+    двух менеджеров затирали бы изменения друг друга. Вытесненные менеджеры
+    сохраняются вне блокировки реестра, поэтому запись одного файла
+    не задерживает запросы к остальным.
+    """
+    def __init__(self, directory: str, max_open: int = 32, max_workers: int = 8, manager_factory: Callable[[str], TaskManager] = ConcurrentTaskManager):
+
+        if max_open < 1:
+            raise ValueError("Количество открытых менеджеров должно быть положительным числом")
+
+        self.directory = directory
+        self.max_open = max_open
+        self.manager_factory = manager_factory
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="task-registry")
+        self._managers = OrderedDict()
+        self._users = Counter()
+        self._evicting = {}
+        self._lock = threading.RLock()
+
+    def __enter__(self):
+
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+
+        self.close()
+
+    def __len__(self) -> int:
+
+        return len(self._managers)
+
+    def path(self, name: str) -> str:
+        """
+        Возвращает путь к файлу задач внутри каталога реестра.
+        """
+        if not name or os.path.basename(name) != name or name in {".", ".."}:
+            logger.error("Недопустимое имя файла задач: %s", name)
+            raise ValueError(f"Недопустимое имя файла задач: {name}")
+
+        return os.path.join(self.directory, name)
+
+    def names(self) -> list[str]:
+        """
+        Возвращает имена всех файлов задач в каталоге реестра.
+        """
+        extensions = (".json", *(f".json{extension}" for extension in EXTENSIONS))
+
+        return sorted(name for name in os.listdir(self.directory) if name.endswith(extensions))
+
+    def get(self, name: str) -> TaskManager:
+        """
+        Возвращает менеджер файла задач, загружая его при необходимости.
+
+        После вызова менеджер может быть вытеснен из реестра; чтобы работать
+        с ним дольше одного обращения, используйте lease.
+        """
+        with self._lock:
+            manager = self._open(name)
+            evicted = self._evict()
+
+        self._flush_evicted(evicted)
+
+        return manager
+
+    def acquire(self, name: str) -> TaskManager:
+        """
+        Возвращает менеджер файла задач и запрещает его вытеснение до вызова release.
+        """
+        with self._lock:
+            manager = self._open(name)
+            self._users[name] += 1
+            evicted = self._evict()
+
+        self._flush_evicted(evicted)
+
+        return manager
+
+    def release(self, name: str):
+        """
+        Возвращает менеджер, взятый через acquire.
+        """
+        with self._lock:
+            if self._users[name] <= 0:
+                raise ValueError(f"Менеджер {name} не был получен через acquire")
+
+            self._users[name] -= 1
+
+            if not self._users[name]:
+                del self._users[name]
+
+            evicted = self._evict()
+
+        self._flush_evicted(evicted)
+
+    @contextmanager
+    def lease(self, name: str):
+        """
+        Выдаёт менеджер файла задач на время блока with, не допуская его вытеснения.
+        """
+        manager = self.acquire(name)
+
+        try:
+            yield manager
+        finally:
+            self.release(name)
+
+    def _open(self, name: str) -> TaskManager:
+
+        manager = self._managers.get(name)
+
+        if manager is not None:
+            self._managers.move_to_end(name)
+            return manager
+
+        # Менеджер, который ещё сохраняется после вытеснения, возвращается в реестр:
+        # новый менеджер прочитал бы файл до окончания записи
+        manager = self._evicting.get(name)
+
+        if manager is None:
+            manager = self.manager_factory(self.path(name))
+
+        self._managers[name] = manager
+
+        return manager
+
+    def _evict(self) -> list[tuple[str, TaskManager]]:
+
+        evicted = []
+
+        for name in list(self._managers):
+            if len(self._managers) <= self.max_open:
+                break
+
+            if self._users[name]:
+                continue
+
+            manager = self._managers.pop(name)
+            self._evicting[name] = manager
+            evicted.append((name, manager))
+
+        return evicted
+
+    def _flush_evicted(self, evicted: list[tuple[str, TaskManager]]):
+
+        for position, (name, manager) in enumerate(evicted):
+            try:
+                self._flush_manager(name, manager)
+            except Exception:
+                # Несохранённые изменения не теряются: менеджеры возвращаются в реестр,
+                # а ошибка передаётся вызывающему коду
+                with self._lock:
+                    for failed_name, failed in evicted[position:]:
+                        if self._evicting.get(failed_name) is failed:
+                            del self._evicting[failed_name]
+                            self._managers.setdefault(failed_name, failed)
+                raise
+
+            with self._lock:
+                if self._evicting.get(name) is manager:
+                    del self._evicting[name]
+
+    def _flush_manager(self, name: str, manager: TaskManager):
+
+        # save_json печатает ошибку и не передаёт её дальше, а flush передаёт,
+        # поэтому неудачное сохранение не выглядит успешным
+        if manager.flush():
+            logger.info("Менеджер %s сохранён", name)
+
+    def flush(self):
+        """
+        Сохраняет все загруженные менеджеры с несохранёнными изменениями.
+
+        Ошибка сохранения одного менеджера не мешает сохранить остальные;
+        первая из ошибок передаётся вызывающему коду.
+        """
+        with self._lock:
+            managers = list(self._managers.items())
+
+        error = None
+
+        for name, manager in managers:
+            try:
+                self._flush_manager(name, manager)
+            except Exception as e:
+                error = error or e
+
+        if error is not None:
+            raise error
+
+    def close(self):
+        """
+        Сохраняет менеджеры и закрывает реестр.
+
+        Если сохранение не удалось, менеджеры остаются в реестре, и flush можно повторить.
+        """
+        try:
+            self.flush()
+        finally:
+            self.executor.shutdown()
+
+        with self._lock:
+            self._managers.clear()
+
+    def _query_one(self, name: str, predicate: Callable[[Task], bool]) -> list[Task]:
+
+        with self._lock:
+            manager = self._managers.get(name)
+
+            if manager is None:
+                manager = self._evicting.get(name)
+
+        # Незагруженные файлы читаются без добавления в реестр, чтобы запрос
+        # по всем файлам не вытеснял рабочие менеджеры
+        if manager is None:
+            manager = TaskManager(self.path(name))
+
+        return [task for task in list(manager.tasks.values()) if predicate(task)]
+
+    def query(self, predicate: Callable[[Task], bool], names: list[str] | None = None) -> dict[str, list[Task]]:
+        """
+        Параллельно выбирает задачи, удовлетворяющие predicate, во всех файлах (или в names).
+
+        Возвращает словарь {имя файла: список задач} только для файлов с найденными задачами.
+        """
+        names = self.names() if names is None else names
+        futures = {name: self.executor.submit(self._query_one, name, predicate) for name in names}
+
+        result = {}
+        for name, future in futures.items():
+            tasks = future.result()
+
+            if tasks:
+                result[name] = tasks
+
+        return result
+
+    def overdue(self, priority: str | None = None, now: datetime | None = None, names: list[str] | None = None) -> dict[str, list[Task]]:
+        """
+        Возвращает просроченные невыполненные задачи во всех файлах, при необходимости с заданным приоритетом.
+        """
+        if priority is not None:
+            TaskManager.validate_priority(priority)
+
+        now = now or datetime.now()
+
+        return self.query(
+            lambda task: task.status != "выполнено" and task.due_date < now and (priority is None or task.priority == priority),
+            names
+        )
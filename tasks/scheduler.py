@@ -0,0 +1,243 @@
+import json
+import heapq
+import logging
+import threading
+import urllib.request
+from datetime import datetime, timedelta
+from itertools import count
+from typing import Callable
+
+from .task import Task
+from .listeners import TaskListener
+from .recurrence import TaskOccurrence
+
+logger = logging.getLogger(__name__)
+
+Notifier = Callable[[Task, datetime], None]
+
+
+class StdoutNotifier:
+    """
+    Печатает напоминание о задаче в стандартный вывод.
+    """
+    def __init__(self, manager):
+
+        self.manager = manager
+
+    def __call__(self, task: Task, now: datetime):
+
+        print(f"Напоминание: задача '{task.title}' (ID: {self.manager.short_id(task.id)}) должна быть выполнена до {task.due_date.strftime('%d.%m.%Y')}")
+
+
+def log_notifier(task: Task, now: datetime):
+    """
+    Записывает напоминание о задаче в лог
+    """
+    logger.warning("Приближается срок выполнения задачи: %s (ID: %s, до %s)",
+                   task.title, task.id, task.due_date.strftime('%d.%m.%Y'))
+
+
+class WebhookNotifier:
+    """
+    Отправляет напоминание POST-запросом с JSON-телом на локальный webhook.
+    """
+    def __init__(self, url: str, timeout: float = 2.0):
+
+        self.url = url
+        self.timeout = timeout
+
+    def __call__(self, task: Task, now: datetime):
+
+        payload = json.dumps({"event": "deadline", "task": task.to_dict()}, ensure_ascii=False).encode("utf-8")
+        request = urllib.request.Request(self.url, data=payload, headers={"Content-Type": "application/json"})
+
+        try:
+            with urllib.request.urlopen(request, timeout=self.timeout):
+                pass
+        except OSError as e:
+            logger.error("Не удалось отправить напоминание на %s: %s", self.url, e)
+
+
+class DeadlineScheduler(TaskListener):
+    """
+    Планировщик напоминаний о приближении срока выполнения задач.
+
+    Невыполненные задачи хранятся в куче по времени срабатывания (due_date - lead_time).
+    Добавление, обновление и удаление задачи стоят O(log n): устаревшие записи кучи
+    не удаляются, а помечаются и пропускаются при извлечении. Когда устаревших
+    записей становится больше, чем действующих, куча перестраивается, поэтому
+    её размер не превышает удвоенного числа запланированных напоминаний.
+
+    Для повторяющейся задачи в куче хранится ближайшее повторение не раньше текущего
+    момента; после напоминания планируется следующее повторение.
+    """
+    def __init__(self, manager, lead_time: timedelta = timedelta(days=1), notifiers: list[Notifier] | None = None):
+
+        self.manager = manager
+        self.lead_time = lead_time
+        self.notifiers = list(notifiers) if notifiers is not None else [StdoutNotifier(manager)]
+        self._heap = []
+        self._entries = {}
+        self._counter = count()
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+
+        manager.add_listener(self)
+
+    def __len__(self) -> int:
+
+        return len(self._entries)
+
+    def on_add(self, task: Task):
+
+        with self._lock:
+            self._schedule(task)
+
+    def on_update(self, task: Task, old: dict):
+
+        if task.due_date == old["due_date"] and task.status == old["status"]:
+            return
+
+        with self._lock:
+            self._cancel(task.id)
+            self._schedule(task)
+
+    def on_delete(self, task: Task):
+
+        with self._lock:
+            self._cancel(task.id)
+
+    def on_reset(self, tasks: dict):
+
+        with self._lock:
+            self._entries = {}
+            self._heap = []
+
+            now = datetime.now()
+
+            for task in tasks.values():
+                entry = self._entry(task, now)
+
+                if entry is not None:
+                    self._entries[task.id] = entry
+                    self._heap.append(entry)
+
+            heapq.heapify(self._heap)
+
+    def _entry(self, task: Task, now: datetime) -> list | None:
+
+        if task.status == "выполнено":
+            return None
+
+        due_date = task.next_due_date(now)
+
+        if due_date is None:
+            return None
+
+        return [due_date - self.lead_time, next(self._counter), task.id, due_date]
+
+    def _schedule(self, task: Task, now: datetime | None = None):
+
+        entry = self._entry(task, now or datetime.now())
+
+        if entry is not None:
+            self._entries[task.id] = entry
+            heapq.heappush(self._heap, entry)
+
+    def _cancel(self, task_id: str):
+
+        entry = self._entries.pop(task_id, None)
+
+        if entry is not None:
+            entry[2] = None
+
+        # Каждая действующая запись лежит в куче один раз, остальные записи устарели
+        if len(self._heap) - len(self._entries) > len(self._entries):
+            self._heap = list(self._entries.values())
+            heapq.heapify(self._heap)
+
+    def next_fire_time(self) -> datetime | None:
+        """
+        Возвращает время ближайшего напоминания или None, если напоминаний нет.
+        """
+        with self._lock:
+            while self._heap and self._heap[0][2] is None:
+                heapq.heappop(self._heap)
+
+            return self._heap[0][0] if self._heap else None
+
+    def poll(self, now: datetime | None = None) -> list[Task]:
+        """
+        Срабатывает для всех задач, время напоминания которых наступило.
+
+        Каждая задача напоминает о себе один раз; повторное напоминание
+        планируется только после изменения срока или статуса. Повторяющаяся
+        задача напоминает о каждом повторении, notifiers получают TaskOccurrence.
+        """
+        now = now or datetime.now()
+        due = []
+
+        with self._lock:
+            while self._heap and self._heap[0][0] <= now:
+                _, _, task_id, due_date = heapq.heappop(self._heap)
+
+                if task_id is None:
+                    continue
+
+                del self._entries[task_id]
+                task = self.manager.tasks.get(task_id)
+
+                if task is None:
+                    continue
+
+                if task.recurrence is None:
+                    due.append(task)
+                    continue
+
+                due.append(TaskOccurrence(task, due_date))
+                # Пропущенные за время простоя повторения не напоминают о себе по одному
+                self._schedule(task, max(due_date + timedelta(microseconds=1), now))
+
+        for task in due:
+            for notifier in self.notifiers:
+                try:
+                    notifier(task, now)
+                except Exception as e:
+                    logger.error("Ошибка при отправке напоминания о задаче %s: %s", task.id, e)
+
+        return due
+
+    def run(self, interval: float = 60.0):
+        """
+        Проверяет напоминания в цикле до вызова stop().
+        """
+        while not self._stop.is_set():
+            self.poll()
+
+            timeout = interval
+            next_fire = self.next_fire_time()
+
+            if next_fire is not None:
+                timeout = max(0.0, min(interval, (next_fire - datetime.now()).total_seconds()))
+
+            self._stop.wait(timeout)
+
+    def start(self, interval: float = 60.0):
+        """
+        Запускает цикл проверки в фоновом потоке.
+        """
+        if self._thread is not None and self._thread.is_alive():
+            return
+
+        self._stop.clear()
+        self._thread = threading.Thread(target=self.run, args=(interval,), name="deadline-scheduler", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+
+        self._stop.set()
+
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
@@ -0,0 +1,128 @@
+from bisect import bisect_left, bisect_right, insort
+from collections import Counter
+from datetime import datetime
+
+import tabulate
+
+from .task import Task
+from .listeners import TaskListener
+
+
+class TaskStats(TaskListener):
+    """
+    Материализованные счётчики задач по категориям, статусам и приоритетам.
+
+    Счётчики обновляются за O(1) при каждом добавлении, изменении и удалении задачи.
+    Для подсчёта просроченных задач сроки невыполненных задач хранятся
+    в отсортированных списках, поэтому запрос стоит O(log n) и не требует обхода задач.
+    """
+    def __init__(self):
+
+        self.on_reset({})
+
+    @property
+    def total(self) -> int:
+
+        return sum(self.by_status.values())
+
+    # Повторяющаяся задача не бывает просроченной: её ближайшее повторение всегда впереди,
+    # поэтому её срок не попадает в списки для подсчёта просроченных задач
+
+    def on_add(self, task: Task):
+
+        self._count(task.category, task.priority, task.status, task.due_date if task.recurrence is None else None, 1)
+
+    def on_update(self, task: Task, old: dict):
+
+        self._count(old["category"], old["priority"], old["status"], old["due_date"] if old["recurrence"] is None else None, -1)
+        self._count(task.category, task.priority, task.status, task.due_date if task.recurrence is None else None, 1)
+
+    def on_delete(self, task: Task):
+
+        self._count(task.category, task.priority, task.status, task.due_date if task.recurrence is None else None, -1)
+
+    def on_reset(self, tasks: dict):
+
+        self.by_status = Counter()
+        self.by_priority = Counter()
+        self.by_category = {}
+        self._open_due = []
+        self._open_due_by_category = {}
+
+        for task in tasks.values():
+            self.on_add(task)
+
+    def _count(self, category: str, priority: str, status: str, due_date: datetime | None, delta: int):
+
+        self.by_status[status] += delta
+        self.by_priority[priority] += delta
+
+        counters = self.by_category.setdefault(category, Counter())
+        counters[status] += delta
+
+        if status != "выполнено" and due_date is not None:
+            due = due_date.timestamp()
+            category_due = self._open_due_by_category.setdefault(category, [])
+
+            if delta > 0:
+                insort(self._open_due, due)
+                insort(category_due, due)
+            else:
+                del self._open_due[bisect_left(self._open_due, due)]
+                del category_due[bisect_left(category_due, due)]
+
+        if not +counters:
+            del self.by_category[category]
+            self._open_due_by_category.pop(category, None)
+
+    def overdue(self, category: str | None = None, now: datetime | None = None) -> int:
+        """
+        Возвращает количество невыполненных задач с истёкшим сроком (без повторяющихся задач).
+        """
+        now = now or datetime.now()
+        due = self._open_due if category is None else self._open_due_by_category.get(category, [])
+
+        return bisect_right(due, now.timestamp())
+
+    def completion_ratio(self, category: str | None = None) -> float:
+
+        counters = self.by_status if category is None else self.by_category.get(category, Counter())
+        total = sum(counters.values())
+
+        return counters["выполнено"] / total if total else 0.0
+
+    def report(self, now: datetime | None = None) -> str:
+        """
+        Формирует текстовый отчёт по счётчикам.
+        """
+        now = now or datetime.now()
+
+        summary = [
+            ["Всего задач", self.total],
+            ["Выполнено", self.by_status["выполнено"]],
+            ["Не выполнено", self.by_status["не выполнено"]],
+            ["Просрочено", self.overdue(now=now)],
+            ["Доля выполненных", f"{self.completion_ratio():.0%}"],
+            ["Приоритет: высокий", self.by_priority["высокий"]],
+            ["Приоритет: средний", self.by_priority["средний"]],
+            ["Приоритет: низкий", self.by_priority["низкий"]],
+        ]
+
+        table = []
+        for category in sorted(self.by_category):
+            counters = self.by_category[category]
+            table.append([
+                category,
+                sum(counters.values()),
+                counters["выполнено"],
+                counters["не выполнено"],
+                self.overdue(category, now),
+                f"{self.completion_ratio(category):.0%}"
+            ])
+
+        headers = ["Категория", "Всего", "Выполнено", "Не выполнено", "Просрочено", "Доля выполненных"]
+
+        return "\n\n".join([
+            tabulate.tabulate(summary, tablefmt="grid"),
+            tabulate.tabulate(table, headers=headers, tablefmt="grid")
+        ])
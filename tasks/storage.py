@@ -0,0 +1,158 @@
+import json
+import logging
+import sqlite3
+import threading
+from collections import OrderedDict
+from collections.abc import MutableMapping
+
+from .task import Task
+
+logger = logging.getLogger(__name__)
+
+SQLITE_HEADER = b"SQLite format 3\x00"
+
+
+def is_sqlite_file(path: str) -> bool:
+    """
+    Проверяет по заголовку, что файл является базой SQLite
+    """
+    with open(path, "rb") as file:
+        return file.read(len(SQLITE_HEADER)) == SQLITE_HEADER
+
+
+class DiskTaskStore(MutableMapping):
+    """
+    Словарь задач, хранящихся на диске в SQLite, с LRU-кэшем восстановленных объектов Task.
+
+    В памяти одновременно находится не более cache_size задач. Изменённые задачи
+    (записанные через store[task_id] = task) записываются на диск при вытеснении
+    из кэша или при вызове flush().
+
+    Все операции выполняются под общей блокировкой, поэтому flush() можно вызывать
+    из потока отложенной записи, пока основной поток изменяет задачи.
+    """
+    ITER_BATCH = 1000
+
+    def __init__(self, path: str, cache_size: int = 1000):
+
+        if cache_size < 1:
+            raise ValueError("Размер кэша должен быть положительным числом")
+
+        self.path = path
+        self.cache_size = cache_size
+        self._cache = OrderedDict()
+        self._dirty = set()
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("CREATE TABLE IF NOT EXISTS tasks (id TEXT PRIMARY KEY, data TEXT NOT NULL) WITHOUT ROWID")
+        self._conn.commit()
+
+    def __getitem__(self, task_id: str) -> Task:
+
+        with self._lock:
+            task = self._cache.get(task_id)
+
+            if task is not None:
+                self._cache.move_to_end(task_id)
+                return task
+
+            row = self._conn.execute("SELECT data FROM tasks WHERE id = ?", (task_id,)).fetchone()
+
+            if row is None:
+                raise KeyError(task_id)
+
+            task = Task.from_dict(json.loads(row[0]), task_id)
+            self._cache[task_id] = task
+            self._evict()
+
+        return task
+
+    def __setitem__(self, task_id: str, task: Task):
+
+        with self._lock:
+            self._cache[task_id] = task
+            self._cache.move_to_end(task_id)
+            self._dirty.add(task_id)
+            self._evict()
+
+    def __delitem__(self, task_id: str):
+
+        with self._lock:
+            cached = self._cache.pop(task_id, None)
+            self._dirty.discard(task_id)
+            deleted = self._conn.execute("DELETE FROM tasks WHERE id = ?", (task_id,)).rowcount
+
+        if cached is None and not deleted:
+            raise KeyError(task_id)
+
+    def __contains__(self, task_id) -> bool:
+
+        with self._lock:
+            if task_id in self._cache:
+                return True
+
+            return self._conn.execute("SELECT 1 FROM tasks WHERE id = ?", (task_id,)).fetchone() is not None
+
+    def __iter__(self):
+
+        self.flush()
+        last_id = ""
+
+        # Читаем ID порциями по ключу, чтобы не держать открытый курсор,
+        # пока вытеснение из кэша записывает задачи в ту же таблицу
+        while True:
+            with self._lock:
+                rows = self._conn.execute(
+                    "SELECT id FROM tasks WHERE id > ? ORDER BY id LIMIT ?", (last_id, self.ITER_BATCH)
+                ).fetchall()
+
+            if not rows:
+                return
+
+            for (task_id,) in rows:
+                yield task_id
+
+            last_id = rows[-1][0]
+
+    def __len__(self) -> int:
+
+        with self._lock:
+            self.flush()
+
+            return self._conn.execute("SELECT COUNT(*) FROM tasks").fetchone()[0]
+
+    def _write(self, task_ids):
+
+        self._conn.executemany(
+            "INSERT INTO tasks (id, data) VALUES (?, ?) ON CONFLICT(id) DO UPDATE SET data = excluded.data",
+            ((task_id, json.dumps(self._cache[task_id].to_dict(), ensure_ascii=False)) for task_id in task_ids)
+        )
+
+    def _evict(self):
+
+        while len(self._cache) > self.cache_size:
+            task_id = next(iter(self._cache))
+
+            if task_id in self._dirty:
+                self._write([task_id])
+                self._dirty.discard(task_id)
+
+            del self._cache[task_id]
+
+    def flush(self):
+        """
+        Записывает изменённые задачи на диск и фиксирует транзакцию.
+        """
+        with self._lock:
+            if self._dirty:
+                self._write(self._dirty)
+                logger.info("В %s записано изменённых задач: %d", self.path, len(self._dirty))
+                self._dirty.clear()
+
+            self._conn.commit()
+
+    def close(self):
+
+        with self._lock:
+            self.flush()
+            self._conn.close()
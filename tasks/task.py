@@ -1,10 +1,12 @@
 import os
-import uuid
 import logging.config
 from datetime import datetime, timedelta
 
 import yaml
 
+from .ids import new_task_id
+from .recurrence import Recurrence, TaskOccurrence
+
 if not os.path.exists('logs'):
     os.makedirs('logs')
 
@@ -25,23 +27,27 @@ class Task:
 
     Атрибуты:
 
-        id: Уникальный идентификатор задачи
+        id: Уникальный идентификатор задачи (UUIDv7, упорядочен по времени создания)
         title: Название задачи
         description: Подробное описание задачи
         category: Категория задачи
         due_date: Срок выполнения задачи
         priority: Приоритет задачи 
         status: Статус выполнения задачи
+        recurrence: Правило повторения задачи (due_date — дата первого повторения)
+        blocked_by: ID задач, которые нужно выполнить до этой задачи
         """
-    def __init__(self, title: str, description: str, category: str, due_date: int | datetime, priority: str = "средний", status: str = "не выполнено"):
+    def __init__(self, title: str, description: str, category: str, due_date: int | datetime, priority: str = "средний", status: str = "не выполнено", recurrence: Recurrence | dict | None = None, blocked_by=None):
 
-        self.id = str(uuid.uuid4())
+        self.id = new_task_id()
         self.title = self.validate_string(title, "Название задачи")
         self.description = self.validate_string(description, "Описание задачи")
         self.category = self.validate_string(category, "Категория задачи")
         self.due_date = self.validate_date(due_date)
         self.priority = self.validate_priority(priority)
         self.status = self.validate_status(status)
+        self.recurrence = self.validate_recurrence(recurrence)
+        self.blocked_by = self.validate_blocked_by(blocked_by)
 
         logger.info("Создана задача: %s (ID: %s, срок выполнения до: %s)",
                     self.title, self.id, self.due_date.strftime('%d.%m.%Y'))
@@ -84,6 +90,50 @@ class Task:
         
         return value
     
+    @staticmethod
+    def validate_recurrence(value: Recurrence | dict | None) -> Recurrence | None:
+
+        if value is None or isinstance(value, Recurrence):
+            return value
+        elif isinstance(value, dict):
+            return Recurrence.from_dict(value)
+        else:
+            logger.error("Неверный тип данных для правила повторения задачи")
+            raise TypeError("Правило повторения задачи должно иметь тип Recurrence или dict")
+
+    @staticmethod
+    def validate_blocked_by(value) -> frozenset[str]:
+
+        if value is None:
+            return frozenset()
+
+        if isinstance(value, str) or not all(isinstance(task_id, str) for task_id in value):
+            logger.error("Неверный тип данных для блокирующих задач")
+            raise TypeError("Блокирующие задачи должны быть перечислены списком ID")
+
+        return frozenset(value)
+
+    def occurrences(self, start: datetime, end: datetime):
+        """
+        Лениво перебирает задачу или её повторения со сроком в промежутке [start, end)
+        """
+        if self.recurrence is None:
+            if start <= self.due_date < end:
+                yield self
+            return
+
+        for due_date in self.recurrence.occurrences(self.due_date, start, end):
+            yield TaskOccurrence(self, due_date)
+
+    def next_due_date(self, now: datetime) -> datetime | None:
+        """
+        Возвращает срок ближайшего повторения не раньше now; для обычной задачи — её срок
+        """
+        if self.recurrence is None:
+            return self.due_date
+
+        return next(self.recurrence.occurrences(self.due_date, now, datetime.max), None)
+
     def __repr__(self):
         """
         Возвращает строковое представление объекта
@@ -99,11 +149,50 @@ class Task:
 
         return False
 
+    def snapshot(self) -> dict:
+        """
+        Возвращает значения полей задачи без преобразования типов
+        """
+        return {
+            "title": self.title,
+            "description": self.description,
+            "category": self.category,
+            "due_date": self.due_date,
+            "priority": self.priority,
+            "status": self.status,
+            "recurrence": self.recurrence,
+            "blocked_by": self.blocked_by
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict, task_id: str | None = None) -> "Task":
+        """
+        Восстанавливает задачу из словаря, полученного методом to_dict
+        """
+        due_date = data["due_date"]
+
+        if isinstance(due_date, str):
+            due_date = datetime.strptime(due_date, "%d.%m.%Y")
+
+        task = cls(
+            title=data["title"],
+            description=data["description"],
+            category=data["category"],
+            due_date=due_date,
+            priority=data["priority"],
+            status=data["status"],
+            recurrence=data.get("recurrence"),
+            blocked_by=data.get("blocked_by")
+        )
+
+        task.id = task_id or data["id"]
+        return task
+
     def to_dict(self) -> dict:
         """
         Преобразует объект книги в словарь
         """
-        return {
+        data = {
             "id": self.id,
             "title": self.title,
             "description": self.description,
@@ -111,4 +200,13 @@ class Task:
             "due_date": self.due_date.strftime('%d.%m.%Y') if isinstance(self.due_date, datetime) else self.due_date,
             "priority": self.priority,
             "status": self.status
-        }
\ No newline at end of file
+        }
+
+        # Правило повторения сохраняется только у повторяющихся задач
+        if self.recurrence is not None:
+            data["recurrence"] = self.recurrence.to_dict()
+
+        if self.blocked_by:
+            data["blocked_by"] = sorted(self.blocked_by)
+
+        return data
\ No newline at end of file
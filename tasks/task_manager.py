@@ -1,6 +1,8 @@
 import os
 import json
 import logging
+import threading
+from itertools import islice
 from datetime import datetime, timedelta
 
 import yaml
@@ -8,6 +10,18 @@ import tabulate
 from colorama import Fore, Style
 
 from .task import Task
+from .recurrence import Recurrence
+from .listeners import TaskListener
+from .urgency import UrgencyIndex
+from .stats import TaskStats
+from .fuzzy import TrigramIndex
+from .storage import DiskTaskStore, is_sqlite_file
+from .ids import IdIndex
+from .dependencies import DependencyGraph
+from .write_behind import WriteBehind
+from .history import ChangeHistory
+from .export import write_columnar, write_csv
+from .codecs import detect_compression, open_text, validate_compression
 
 if not os.path.exists('logs'):
     os.makedirs('logs')
@@ -23,22 +37,74 @@ logger = logging.getLogger(__name__)
 
 
 class TaskManager:
-    def __init__(self, filename="tasks.json"):
+    def __init__(self, filename="tasks.json", priority_weights: dict[str, float] | None = None, cache_size: int | None = None, compression: str | None = None):
 
         self.filename = filename
+        self.priority_weights = priority_weights
+        self.cache_size = cache_size
+        self.compression = validate_compression(compression or detect_compression(filename))
         self.tasks = {}
+        self.dirty = False
+        self.write_behind = None
+        self.history = None
+        self._save_lock = threading.Lock()
+        self.stats = TaskStats()
+        self.dependencies = DependencyGraph()
+        self._listeners = [self.stats, self.dependencies]
+        self._urgency = None
+        self._trigrams = None
+        self._ids = None
         self.load_json()
 
-    def add_task(self, title: str, description: str, category: str, due_date: int | datetime, priority: str = "средний", status: str = "не выполнено"):
+    def add_listener(self, listener: TaskListener):
         """
-        Добавляет задачу в список задач
+        Подписывает слушателя на изменения задач и передаёт ему текущее состояние.
+        """
+        self._listeners.append(listener)
+        listener.on_reset(self.tasks)
+
+    def remove_listener(self, listener: TaskListener):
+
+        self._listeners.remove(listener)
+
+    def _notify(self, event: str, *args):
+
+        # Любое изменение, кроме перезагрузки из файла, требует сохранения
+        self.dirty = event != "reset"
+
+        for listener in self._listeners:
+            getattr(listener, f"on_{event}")(*args)
+
+    def _insert(self, task: Task):
+
+        self.tasks[task.id] = task
+        self._notify("add", task)
+
+    def _remove(self, task: Task):
+
+        del self.tasks[task.id]
+        self._notify("delete", task)
+
+    def add_task(self, title: str, description: str, category: str, due_date: int | datetime, priority: str = "средний", status: str = "не выполнено", recurrence: Recurrence | dict | None = None, blocked_by: list[str] | None = None):
+        """
+        Добавляет задачу в список задач.
+
+        Повторяющаяся задача (recurrence) хранится одной записью, её повторения
+        вычисляются при запросах за промежуток времени.
+        blocked_by — ID существующих задач, которые нужно выполнить до этой задачи.
         """
             
         try:
-            new_tasks = Task(title, description, category, due_date, priority, status)
-            self.tasks[new_tasks.id] = new_tasks
+            for blocker_id in blocked_by or ():
+                if blocker_id not in self.tasks:
+                    logger.error("Блокирующая задача с id %s отсутствует в списке.", blocker_id)
+                    raise ValueError(f"Блокирующая задача с id {blocker_id} отсутствует в списке.")
+
+            new_tasks = Task(title, description, category, due_date, priority, status, recurrence, blocked_by)
+            self._insert(new_tasks)
 
             logger.info("Добавлена задача: %s (Приоритет: %s, до %s)", title, new_tasks.priority, new_tasks.due_date.strftime('%d.%m.%Y'))
+            return new_tasks
 
         except TypeError as e:
             logger.error("Ошибка при добавлении задачи: %s", e)
@@ -54,7 +120,7 @@ class TaskManager:
         task_delete = self.tasks.get(task_id)
 
         if task_delete:
-            del self.tasks[task_id]
+            self._remove(task_delete)
             logger.info("Задача с id %s удалена", task_id)
             print(f"Задача с id {task_id} удалена")
             # self.save_json()
@@ -72,7 +138,7 @@ class TaskManager:
         if len(tasks_category) == 1:
             
             selected_task = tasks_category[0]
-            del self.tasks[selected_task.id]
+            self._remove(selected_task)
             logger.info("Задача с ID '%s' удалена.", selected_task.id)
             print(f"Задача '{selected_task.title}' удалена.")
             # self.save_json()
@@ -85,7 +151,7 @@ class TaskManager:
         print(f"Задачи с категорией {category}:")
 
         for i, task in enumerate(tasks_category, start=1):
-            print(f"{i}. {task.title} (ID: {task.id[:10]}) - {task.description}")
+            print(f"{i}. {task.title} (ID: {self.short_id(task.id)}) - {task.description}")
 
         try:
 
@@ -113,11 +179,38 @@ class TaskManager:
             logger.error("Неизвестная ошибка при удалении задачи: %s", e)
             print("Произошла неизвестная ошибка при удалении задачи.")
 
-    def view_tasks(self, tasks, category=None) -> str:
+    def delete_tasks_by_category(self, category: str) -> list[Task]:
+        """
+        Удаляет все задачи категории без запроса подтверждения.
+
+        Возвращает список удалённых задач.
+        """
+        tasks_category = [task for task in self.tasks.values() if task.category == category]
+
+        if not tasks_category:
+            logger.warning("Задачи с категорией '%s' не найдены", category)
+            raise ValueError (f"Удаление задачи не удалось: задачи с категорией {category} не найдены")
+
+        for task in tasks_category:
+            self._remove(task)
+            logger.info("Задача с ID '%s' удалена.", task.id)
+
+        return tasks_category
+
+    def view_tasks(self, tasks, category=None, start: datetime = None, end: datetime = None) -> str:
         """
         Выводит список задач с визуальной подсветкой задач с высоким приоритетом.
+
+        tasks — словарь задач или список задач. Если указан промежуток [start, end),
+        выводятся задачи со сроком в нём, а повторяющиеся задачи разворачиваются в повторения.
         """
-        filter_task = [task for task in tasks.values() if category is None or task.category == category]
+        if hasattr(tasks, "values"):
+            tasks = tasks.values()
+
+        if start is not None or end is not None:
+            tasks = self.expand(tasks, start, end)
+
+        filter_task = [task for task in tasks if category is None or task.category == category]
 
         if not filter_task:
             logger.warning("Задачи не найдены")
@@ -136,7 +229,7 @@ class TaskManager:
                 Fore.RED
             )
             table.append([
-                task.id[:10],
+                self.short_id(task.id),
                 task.title,
                 task.description,
                 task.category,
@@ -154,8 +247,13 @@ class TaskManager:
         Ищет задачи по переданным параметрам (title, description, category, priority, status).
         
         Параметры поиска передаются через ключевые аргументы (kwargs).
+        Если переданы start и/или end, возвращаются задачи и повторения
+        повторяющихся задач со сроком в промежутке [start, end), упорядоченные по сроку.
+        Если передан as_of, поиск идёт по задачам в состоянии на эту дату (см. as_of).
         """
-        if not self.tasks:
+        tasks = self.as_of(kwargs["as_of"]) if kwargs.get("as_of") is not None else self.tasks
+
+        if not tasks:
             logger.warning("Неудачный поиск. Библиотека пуста")
             return []
         
@@ -175,7 +273,7 @@ class TaskManager:
             validate_type(key, value)
 
         result = [
-            task for task in self.tasks.values() if
+            task for task in tasks.values() if
             all(
                 getattr(task, key).lower() == value.lower() 
                 for key, value in search.items() 
@@ -183,6 +281,9 @@ class TaskManager:
             )
         ]
 
+        if result and (kwargs.get("start") is not None or kwargs.get("end") is not None):
+            result = self.expand(result, kwargs.get("start"), kwargs.get("end"))
+
         if result:
             logger.info("Найдены задачи: %s", [task.to_dict() for task in result])
         else:
@@ -191,14 +292,188 @@ class TaskManager:
         
         return result
 
+    @property
+    def id_index(self) -> IdIndex:
+        """
+        Индекс ID задач; строится при первом обращении.
+        """
+        if self._ids is None:
+            self._ids = IdIndex()
+            self.add_listener(self._ids)
+
+        return self._ids
+
+    def resolve_id(self, prefix: str) -> str:
+        """
+        Возвращает полный ID задачи по полному ID или его уникальному префиксу.
+        """
+        if prefix in self.tasks:
+            return prefix
+
+        try:
+            return self.id_index.resolve(prefix)
+        except ValueError as e:
+            logger.error("Не удалось определить задачу по ID '%s': %s", prefix, e)
+            raise
+
+    def short_id(self, task_id: str) -> str:
+        """
+        Возвращает однозначный сокращённый ID для вывода (не короче 10 символов).
+        """
+        if task_id not in self.tasks:
+            return task_id[:10]
+
+        return self.id_index.short_id(task_id)
+
+    def recent_tasks(self, since: datetime, until: datetime | None = None) -> list[Task]:
+        """
+        Возвращает задачи, созданные в промежутке [since, until), в порядке создания.
+
+        Время создания берётся из ID, поэтому выборка не требует обхода всех задач.
+        """
+        return [self.tasks[task_id] for task_id in self.id_index.created_between(since, until)]
+
+    @staticmethod
+    def expand(tasks, start: datetime = None, end: datetime = None) -> list:
+        """
+        Возвращает задачи со сроком в промежутке [start, end), упорядоченные по сроку.
+
+        Повторяющиеся задачи лениво разворачиваются в повторения (TaskOccurrence) внутри промежутка.
+        Если не указана одна из границ, промежуток отсчитывается в 30 дней от другой
+        (или от текущего момента), чтобы повторения не перебирались бесконечно.
+        """
+        if start is None:
+            start = end - timedelta(days=30) if end is not None else datetime.now()
+
+        if end is None:
+            end = start + timedelta(days=30)
+
+        return sorted(
+            (occurrence for task in tasks for occurrence in task.occurrences(start, end)),
+            key=lambda occurrence: occurrence.due_date
+        )
+
+    def tasks_due_between(self, start: datetime, end: datetime) -> list:
+        """
+        Возвращает задачи и повторения задач со сроком в промежутке [start, end).
+        """
+        return self.expand(self.tasks.values(), start, end)
+
+    def fuzzy_search(self, query: str, limit: int = 10, threshold: float = 0.3) -> list[Task]:
+        """
+        Нечёткий поиск по названию, описанию и категории, устойчивый к опечаткам.
+
+        Возвращает до limit задач по убыванию похожести. Задачи, у которых совпало
+        меньше threshold триграмм запроса, не возвращаются.
+        """
+        if not isinstance(query, str):
+            logger.error("Неверный тип данных для запроса")
+            raise TypeError("Запрос должен иметь строковый тип")
+
+        if self._trigrams is None:
+            self._trigrams = TrigramIndex()
+            self.add_listener(self._trigrams)
+
+        result = [self.tasks[task_id] for task_id, _ in self._trigrams.search(query, limit, threshold)]
+
+        if result:
+            logger.info("Нечёткий поиск '%s': найдено %d задач", query, len(result))
+        else:
+            logger.warning("Нечёткий поиск '%s': задачи не найдены", query)
+
+        return result
+
+    def next_tasks(self, k: int = 20, category: str = None) -> list[Task]:
+        """
+        Возвращает k самых срочных невыполненных задач.
+
+        Срочность учитывает приоритет и время до срока выполнения (см. UrgencyIndex).
+        Индекс строится при первом вызове и далее обновляется инкрементально.
+        """
+        if self._urgency is None:
+            self._urgency = UrgencyIndex(self.priority_weights)
+            self.add_listener(self._urgency)
+
+        if k <= 0:
+            return []
+
+        actionable = (
+            task_id for task_id in self._urgency.iter_ids(category)
+            if not self.dependencies.is_blocked(task_id)
+        )
+
+        return [self.tasks[task_id] for task_id in islice(actionable, k)]
+
+    def add_dependency(self, task_id: str, blocker_id: str) -> Task:
+        """
+        Отмечает, что задача task_id заблокирована задачей blocker_id.
+
+        Связь, которая создала бы цикл зависимостей, отклоняется с ValueError.
+        """
+        task = self._task_for_update(task_id)
+
+        if not task:
+            logger.error("Задача с ID '%s' не найдена.", task_id)
+            raise KeyError(f"Задача с ID '{task_id}' не найдена.")
+
+        try:
+            self.dependencies.check(blocker_id, task_id)
+        except ValueError as e:
+            logger.error("Не удалось добавить зависимость: %s", e)
+            raise
+
+        old = task.snapshot()
+        task.blocked_by = task.blocked_by | {blocker_id}
+        self.tasks[task.id] = task
+        self._notify("update", task, old)
+
+        logger.info("Задача %s заблокирована задачей %s", task_id, blocker_id)
+        return task
+
+    def remove_dependency(self, task_id: str, blocker_id: str) -> Task:
+        """
+        Удаляет связь "задача task_id заблокирована задачей blocker_id".
+        """
+        task = self._task_for_update(task_id)
+
+        if not task:
+            logger.error("Задача с ID '%s' не найдена.", task_id)
+            raise KeyError(f"Задача с ID '{task_id}' не найдена.")
+
+        old = task.snapshot()
+        task.blocked_by = task.blocked_by - {blocker_id}
+        self.tasks[task.id] = task
+        self._notify("update", task, old)
+
+        logger.info("Задача %s больше не заблокирована задачей %s", task_id, blocker_id)
+        return task
+
+    def ready_tasks(self) -> list[Task]:
+        """
+        Возвращает невыполненные задачи, у которых нет невыполненных блокирующих задач, по сроку выполнения.
+        """
+        return sorted((self.tasks[task_id] for task_id in self.dependencies.ready()), key=lambda task: task.due_date)
+
     def update_task(self, task_id: str, title: str = None, description: str = None, category: str = None, due_date: int | datetime = None, priority: str = None, status: str = None):
 
-        task = self.tasks.get(task_id)
+        task = self._task_for_update(task_id)
 
         if not task:
             logger.error("Задача с ID '%s' не найдена.", task_id)
             raise KeyError(f"Задача с ID '{task_id}' не найдена.")
-        
+
+        # Проверяем значения до изменения задачи, чтобы ошибка не оставила её обновлённой наполовину
+        if due_date:
+            due_date = self.validate_due_date(due_date)
+
+        if priority:
+            priority = self.validate_priority(priority)
+
+        if status:
+            status = self.validate_status(status)
+
+        old = task.snapshot()
+
         if title:
             task.title = title
 
@@ -209,17 +484,27 @@ class TaskManager:
             task.category = category
 
         if due_date:
-            task.due_date = self.validate_due_date(due_date)
+            task.due_date = due_date
 
         if priority:
-            task.priority = self.validate_priority(priority)
+            task.priority = priority
 
         if status:
-            task.status = self.validate_status(status)
+            task.status = status
+
+        # Повторное присваивание помечает задачу изменённой в хранилище на диске
+        self.tasks[task.id] = task
+        self._notify("update", task, old)
 
         logging.info("Задача обновлена: %s (ID: %s)", task.title, task.id)
         return task
 
+    def _task_for_update(self, task_id: str) -> Task | None:
+        """
+        Возвращает объект задачи, который будет изменён в update_task
+        """
+        return self.tasks.get(task_id)
+
     @staticmethod
     def validate_due_date(due_date):
         """
@@ -259,10 +544,7 @@ class TaskManager:
         """
 
         try:
-            tasks_dict = {task_id: task.to_dict() for task_id, task in self.tasks.items()}
-            
-            with open(self.filename, "w", encoding="utf-8") as file:
-                json.dump(tasks_dict, file, indent=4, ensure_ascii=False)
+            self._save()
 
             logger.info("Задачи сохранены в %s", self.filename)
             print(f"Задачи сохранены в {self.filename}")
@@ -271,48 +553,297 @@ class TaskManager:
             logger.error("Не удалось сохранить задачи: %s", e)
             print("Произошла ошибка при сохранении задач:", e)
 
+    def _save(self, tasks_dict: dict | None = None):
+        """
+        Записывает задачи на диск. Все сохранения выполняются по одному.
+
+        tasks_dict — снимок задач, сделанный вызывающим кодом; в этом случае
+        флаг dirty сбрасывает сам вызывающий код в момент снимка.
+        """
+        with self._save_lock:
+            if tasks_dict is None:
+                # Флаг сбрасывается до снимка, чтобы изменения, сделанные во время записи, не потерялись
+                self.dirty = False
+
+            try:
+                if isinstance(self.tasks, DiskTaskStore):
+                    self.tasks.flush()
+                else:
+                    self._write_json(self._dump_tasks() if tasks_dict is None else tasks_dict)
+
+                if self.history is not None:
+                    self.history.flush()
+            except Exception:
+                self.dirty = True
+                raise
+
+    def flush(self) -> bool:
+        """
+        Сохраняет задачи, только если есть несохранённые изменения. Возвращает True, если запись была.
+        """
+        if not self.dirty:
+            return False
+
+        try:
+            self._save()
+        except Exception as e:
+            logger.error("Не удалось сохранить задачи: %s", e)
+            raise
+
+        logger.info("Задачи сохранены в %s", self.filename)
+        return True
+
+    def sync(self):
+        """
+        Сохраняет несохранённые изменения и сбрасывает файл задач на диск (fsync).
+        """
+        self.flush()
+
+        if not os.path.exists(self.filename):
+            return
+
+        with open(self.filename, "rb") as file:
+            os.fsync(file.fileno())
+
+        # Переименование при сохранении надёжно только после fsync каталога
+        if hasattr(os, "O_DIRECTORY"):
+            directory = os.open(os.path.dirname(os.path.abspath(self.filename)), os.O_RDONLY | os.O_DIRECTORY)
+            try:
+                os.fsync(directory)
+            finally:
+                os.close(directory)
+
+    def start_write_behind(self, interval: float = 1.0, batch_size: int = 1000) -> WriteBehind:
+        """
+        Включает отложенную запись: изменения сохраняются фоновым потоком раз в interval
+        секунд или после batch_size изменений, а также при завершении процесса.
+        """
+        if self.write_behind is None:
+            self.write_behind = WriteBehind(self, interval=interval, batch_size=batch_size)
+
+        return self.write_behind
+
+    def enable_history(self, checkpoint_interval: int = 1000) -> ChangeHistory:
+        """
+        Включает запись истории изменений задач (см. ChangeHistory).
+
+        История записывается рядом с файлом задач при каждом сохранении.
+        """
+        if self.history is None:
+            self.history = ChangeHistory(self, checkpoint_interval=checkpoint_interval)
+            self.add_listener(self.history)
+
+        return self.history
+
+    def as_of(self, when: datetime) -> dict[str, Task]:
+        """
+        Возвращает задачи в состоянии на момент when, восстановленные по истории изменений.
+        """
+        if self.history is None:
+            logger.error("Запрос задач на дату без истории изменений")
+            raise ValueError("История изменений не включена")
+
+        return self.history.as_of(when)
+
+    def export(self, path: str, columnar: bool = False, batch_size: int = 10000) -> int:
+        """
+        Потоково выгружает задачи для аналитики пакетами по batch_size задач.
+
+        columnar=True — бинарный колоночный формат (см. tasks.export.write_columnar),
+        иначе CSV. Возвращает количество выгруженных задач.
+        """
+        try:
+            if columnar:
+                with open(path, "wb") as file:
+                    rows = write_columnar(self.tasks.values(), file, batch_size)
+            else:
+                with open(path, "w", encoding="utf-8", newline="") as file:
+                    rows = write_csv(self.tasks.values(), file, batch_size)
+
+        except OSError as e:
+            logger.error("Не удалось выгрузить задачи в %s: %s", path, e)
+            raise
+
+        logger.info("Выгружено задач в %s: %d", path, rows)
+        return rows
+
+    def _dump_tasks(self) -> dict:
+        """
+        Возвращает снимок задач в виде словарей, готовый к записи в файл.
+        """
+        # list() копирует пары атомарно, поэтому снимок можно делать из фонового потока
+        return {task_id: task.to_dict() for task_id, task in list(self.tasks.items())}
+
+    def _write_json(self, tasks_dict: dict):
+        """
+        Записывает подготовленный снимок задач в JSON-файл.
+
+        Сжатый файл записывается без отступов: json.dump отдаёт данные
+        частями, и они сжимаются по мере записи.
+
+        Запись идёт во временный файл, который затем атомарно заменяет
+        основной, поэтому сбой во время записи не повреждает сохранённые задачи.
+        Временный файл сбрасывается на диск до замены: иначе после сбоя питания
+        основной файл мог бы оказаться пустым.
+        """
+        indent = None if self.compression else 4
+        temp_filename = f"{self.filename}.tmp"
+
+        try:
+            with open_text(temp_filename, "w", self.compression) as file:
+                json.dump(tasks_dict, file, indent=indent, ensure_ascii=False)
+
+            # Сжатый поток дописывает данные при закрытии, поэтому файл открывается заново
+            with open(temp_filename, "rb") as file:
+                os.fsync(file.fileno())
+
+            os.replace(temp_filename, self.filename)
+        except BaseException:
+            if os.path.exists(temp_filename):
+                os.remove(temp_filename)
+            raise
+
+    def _read_json(self) -> dict:
+        """
+        Читает словари задач из JSON-файла, распаковывая его при необходимости.
+        """
+        with open_text(self.filename, "r", self.compression) as file:
+            return json.load(file)
+
     def load_json(self):
         """
         Загружает задачи из JSON-файла.
+
+        В режиме ограниченной памяти (cache_size) открывает хранилище на диске.
         """
-        if not os.path.exists(self.filename):
-            logging.warning("Файл %s не найден. Создана пустая библиотека.", self.filename)
-            self.tasks = {}
+        if self.cache_size is not None:
+            # Ошибка открытия хранилища не заменяется пустым словарём: иначе
+            # следующее сохранение затёрло бы задачи пользователя
+            if not isinstance(self.tasks, DiskTaskStore):
+                self.tasks = self._open_store()
+
+            self._notify("reset", self.tasks)
             return
 
+        self._reset(self._load_tasks())
+
+    def _load_tasks(self) -> dict:
+        """
+        Читает задачи из JSON-файла. При ошибке возвращает пустой словарь.
+        """
         try:
-            with open(self.filename, "r", encoding="utf-8") as file:
-                tasks_data = json.load(file)
+            if not os.path.exists(self.filename):
+                logging.warning("Файл %s не найден. Создана пустая библиотека.", self.filename)
+                return {}
+
+            tasks_data = self._read_json()
 
             if not tasks_data:
-                self.tasks = {}
                 logger.info("Файл %s пуст. Создана пустая библиотека.", self.filename)
-                return
+                return {}
 
-            self.tasks = {}
+            tasks = {}
 
             for task_id, data in tasks_data.items():
-    
-                data["due_date"] = datetime.strptime(data["due_date"], "%d.%m.%Y")
-  
-                task = Task(
-                    title=data["title"],
-                    description=data["description"],
-                    category=data["category"],
-                    due_date=data["due_date"],
-                    priority=data["priority"],
-                    status=data["status"]
-                )
-                
-                task.id = task_id
-                self.tasks[task_id] = task
+                tasks[task_id] = Task.from_dict(data, task_id)
 
             logger.info("Задачи загружены из %s", self.filename)
+            return tasks
 
         except json.JSONDecodeError as e:
             logger.error("Ошибка при преобразовании данных в формат JSON: %s. Создана пустая библиотека.", e)
-            self.tasks = {}
+            return {}
 
         except Exception as e:
             logger.error("Ошибка при загрузке задач: %s", e)
-            self.tasks = {}
\ No newline at end of file
+            return {}
+
+    def _reset(self, tasks: dict):
+        """
+        Заменяет все задачи и перестраивает индексы.
+        """
+        self.tasks = tasks
+        self._notify("reset", self.tasks)
+
+    def _open_store(self) -> DiskTaskStore:
+        """
+        Открывает хранилище SQLite для режима ограниченной памяти.
+
+        Если filename — JSON-файл задач, задачи переносятся в отдельный файл
+        <filename>.db, а исходный файл не изменяется.
+        """
+        path = self.filename
+        migrate = False
+
+        if os.path.exists(path) and os.path.getsize(path) and not is_sqlite_file(path):
+            path = f"{self.filename}.db"
+            migrate = not os.path.exists(path)
+
+        store = DiskTaskStore(path, self.cache_size)
+
+        if migrate:
+            try:
+                for task_id, data in (self._read_json() or {}).items():
+                    store[task_id] = Task.from_dict(data, task_id)
+
+                store.flush()
+            except Exception as e:
+                store.close()
+                os.remove(path)
+                logger.error("Не удалось перенести задачи из %s в хранилище %s: %s", self.filename, path, e)
+                raise
+
+            logger.info("Задачи из %s перенесены в хранилище %s", self.filename, path)
+
+        logger.info("Открыто хранилище задач %s (кэш: %d задач)", path, self.cache_size)
+        return store
+
+    def reload_json(self) -> tuple[int, int, int]:
+        """
+        Перечитывает JSON-файл и применяет только изменившиеся записи.
+
+        Неизменённые задачи и индексы по ним не перестраиваются.
+        Возвращает количество добавленных, обновлённых и удалённых задач.
+        """
+        if isinstance(self.tasks, DiskTaskStore) or not os.path.exists(self.filename):
+            self.load_json()
+            return 0, 0, 0
+
+        try:
+            tasks_data = self._read_json() or {}
+        except json.JSONDecodeError as e:
+            # Файл может быть прочитан в момент записи: оставляем текущее состояние
+            logger.error("Ошибка при преобразовании данных в формат JSON: %s", e)
+            return 0, 0, 0
+
+        return self._apply_reload(tasks_data)
+
+    def _apply_reload(self, tasks_data: dict) -> tuple[int, int, int]:
+        """
+        Применяет к задачам отличия прочитанного файла.
+        """
+        added = updated = 0
+
+        for task_id, data in tasks_data.items():
+            task = self.tasks.get(task_id)
+
+            if task is None:
+                self._insert(Task.from_dict(data, task_id))
+                added += 1
+            elif task.to_dict() != {"id": task_id, **data}:
+                old = task.snapshot()
+                task = Task.from_dict(data, task_id)
+                self.tasks[task_id] = task
+                self._notify("update", task, old)
+                updated += 1
+
+        removed = [task for task_id, task in self.tasks.items() if task_id not in tasks_data]
+
+        for task in removed:
+            self._remove(task)
+
+        if added or updated or removed:
+            logger.info("Задачи перечитаны из %s: добавлено %d, обновлено %d, удалено %d",
+                        self.filename, added, updated, len(removed))
+
+        return added, updated, len(removed)
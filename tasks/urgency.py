@@ -0,0 +1,127 @@
+import heapq
+from bisect import bisect_left, insort
+from datetime import datetime
+
+from .task import Task
+from .listeners import TaskListener
+
+# Бонус срочности в днях: задача с высоким приоритетом и сроком через 8 дней
+# так же срочна, как задача с низким приоритетом и сроком через день.
+DEFAULT_PRIORITY_WEIGHTS = {"высокий": 7.0, "средний": 3.0, "низкий": 0.0}
+
+SECONDS_PER_DAY = 86400
+
+
+class UrgencyIndex(TaskListener):
+    """
+    Инкрементально поддерживаемый рейтинг невыполненных задач по срочности.
+
+    Срочность задачи: urgency = вес_приоритета - дней_до_срока. Текущее время входит
+    в формулу одинаково для всех задач, поэтому порядок не зависит от момента запроса
+    и задачи можно держать в отсортированных списках по неизменному ключу
+    (срок в секундах - вес приоритета). Выборка первых k задач стоит O(k).
+
+    Повторяющиеся задачи ранжируются по ближайшему повторению не раньше текущего
+    момента. Их ключ меняется со временем, поэтому они хранятся отдельно
+    и сортируются при каждом запросе.
+    """
+    def __init__(self, priority_weights: dict[str, float] | None = None):
+
+        self.priority_weights = dict(DEFAULT_PRIORITY_WEIGHTS if priority_weights is None else priority_weights)
+        self._order = []
+        self._by_category = {}
+        self._keys = {}
+        self._recurring = {}
+
+    def __len__(self) -> int:
+
+        return len(self._keys) + len(self._recurring)
+
+    def key(self, task: Task, now: datetime | None = None) -> float:
+
+        due_date = task.due_date if task.recurrence is None else task.next_due_date(now or datetime.now())
+
+        return due_date.timestamp() - self.priority_weights.get(task.priority, 0.0) * SECONDS_PER_DAY
+
+    def urgency(self, task: Task, now: datetime | None = None) -> float:
+        """
+        Возвращает срочность задачи в днях: чем больше значение, тем срочнее задача.
+        """
+        now = now or datetime.now()
+
+        return (now.timestamp() - self.key(task, now)) / SECONDS_PER_DAY
+
+    def on_add(self, task: Task):
+
+        if task.status == "выполнено":
+            return
+
+        if task.recurrence is not None:
+            self._recurring[task.id] = task
+            return
+
+        entry = (self.key(task), task.id)
+        self._keys[task.id] = (entry, task.category)
+        insort(self._order, entry)
+        insort(self._by_category.setdefault(task.category, []), entry)
+
+    def on_update(self, task: Task, old: dict):
+
+        self._discard(task.id)
+        self.on_add(task)
+
+    def on_delete(self, task: Task):
+
+        self._discard(task.id)
+
+    def on_reset(self, tasks: dict):
+
+        self._keys = {}
+        self._by_category = {}
+        self._recurring = {}
+
+        for task in tasks.values():
+            if task.status != "выполнено" and task.recurrence is not None:
+                self._recurring[task.id] = task
+            elif task.status != "выполнено":
+                entry = (self.key(task), task.id)
+                self._keys[task.id] = (entry, task.category)
+                self._by_category.setdefault(task.category, []).append(entry)
+
+        self._order = sorted(entry for entry, _ in self._keys.values())
+
+        for entries in self._by_category.values():
+            entries.sort()
+
+    def _discard(self, task_id: str):
+
+        self._recurring.pop(task_id, None)
+        found = self._keys.pop(task_id, None)
+
+        if found is None:
+            return
+
+        entry, category = found
+
+        for entries in (self._order, self._by_category[category]):
+            del entries[bisect_left(entries, entry)]
+
+        if not self._by_category[category]:
+            del self._by_category[category]
+
+    def iter_ids(self, category: str | None = None, now: datetime | None = None):
+        """
+        Перебирает ID невыполненных задач от самой срочной к наименее срочной.
+        """
+        entries = self._order if category is None else self._by_category.get(category, [])
+
+        if self._recurring:
+            now = now or datetime.now()
+            recurring = sorted(
+                (self.key(task, now), task.id) for task in self._recurring.values()
+                if category is None or task.category == category
+            )
+            entries = heapq.merge(entries, recurring)
+
+        for _, task_id in entries:
+            yield task_id
@@ -0,0 +1,82 @@
+import os
+import sys
+import time
+import logging
+
+logger = logging.getLogger(__name__)
+
+CLEAR_SCREEN = "\x1b[H\x1b[2J"
+CLEAR_LINE = "\x1b[K"
+
+
+class TaskWatcher:
+    """
+    Следит за файлом задач и перерисовывает таблицу view только при изменениях.
+
+    Изменения обнаруживаются по времени изменения и размеру файла, поэтому
+    пока файл не меняется, каждая проверка стоит один вызов os.stat.
+    При изменении перечитываются только изменившиеся записи, а на экране
+    переписываются только строки таблицы, которые отличаются от предыдущих.
+    """
+    def __init__(self, manager, category: str | None = None, interval: float = 1.0, out=None):
+
+        self.manager = manager
+        self.category = category
+        self.interval = interval
+        self.out = out or sys.stdout
+        self._signature = self._stat()
+        self._lines = None
+
+    def _stat(self):
+
+        try:
+            stat = os.stat(self.manager.filename)
+        except FileNotFoundError:
+            return None
+
+        return stat.st_mtime_ns, stat.st_size
+
+    def refresh(self) -> bool:
+        """
+        Перечитывает файл, если он изменился. Возвращает True, если таблица могла измениться.
+        """
+        signature = self._stat()
+
+        if signature == self._signature:
+            return False
+
+        self._signature = signature
+        return any(self.manager.reload_json())
+
+    def render(self):
+        """
+        Выводит таблицу, переписывая только изменившиеся строки.
+        """
+        lines = self.manager.view_tasks(self.manager.tasks, category=self.category).splitlines()
+
+        if self._lines is None or len(lines) != len(self._lines):
+            self.out.write(CLEAR_SCREEN + "\n".join(lines) + "\n")
+        else:
+            for row, (line, previous) in enumerate(zip(lines, self._lines), start=1):
+                if line != previous:
+                    self.out.write(f"\x1b[{row};1H{line}{CLEAR_LINE}")
+
+            self.out.write(f"\x1b[{len(lines) + 1};1H")
+
+        self.out.flush()
+        self._lines = lines
+
+    def run(self, iterations: int | None = None):
+        """
+        Проверяет файл каждые interval секунд. iterations ограничивает число проверок.
+        """
+        self.render()
+
+        while iterations is None or iterations > 0:
+            time.sleep(self.interval)
+
+            if self.refresh():
+                self.render()
+
+            if iterations is not None:
+                iterations -= 1
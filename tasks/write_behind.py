@@ -0,0 +1,100 @@
+import atexit
+import logging
+import threading
+
+from .listeners import TaskListener
+
+logger = logging.getLogger(__name__)
+
+
+class WriteBehind(TaskListener):
+    """
+    Отложенная запись изменений TaskManager фоновым потоком.
+
+    Изменения только помечают менеджер как несохранённый. Фоновый поток
+    сохраняет задачи раз в interval секунд или сразу после batch_size изменений,
+    поэтому серия из тысяч изменений записывается на диск одним сохранением.
+    При завершении процесса несохранённые изменения записываются через atexit.
+    """
+    def __init__(self, manager, interval: float = 1.0, batch_size: int = 1000):
+
+        if interval <= 0 or batch_size < 1:
+            raise ValueError("Интервал и размер пакета отложенной записи должны быть положительными")
+
+        self.manager = manager
+        self.interval = interval
+        self.batch_size = batch_size
+        self._pending = 0
+        self._wake = threading.Event()
+        self._stopped = threading.Event()
+
+        manager.add_listener(self)
+
+        self._thread = threading.Thread(target=self._run, name="write-behind", daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    def _changed(self):
+
+        self._pending += 1
+
+        if self._pending >= self.batch_size:
+            self._wake.set()
+
+    def on_add(self, task):
+
+        self._changed()
+
+    def on_update(self, task, old: dict):
+
+        self._changed()
+
+    def on_delete(self, task):
+
+        self._changed()
+
+    def on_reset(self, tasks: dict):
+
+        self._pending = 0
+
+    def _run(self):
+
+        while not self._stopped.is_set():
+            self._wake.wait(self.interval)
+            self._wake.clear()
+
+            try:
+                self.flush()
+            except Exception as e:
+                # Ошибка уже записана в лог менеджером; изменения останутся несохранёнными до следующей попытки
+                logger.error("Отложенная запись не удалась: %s", e)
+
+    def flush(self) -> bool:
+        """
+        Немедленно сохраняет несохранённые изменения.
+        """
+        self._pending = 0
+
+        return self.manager.flush()
+
+    def sync(self):
+        """
+        Сохраняет несохранённые изменения и сбрасывает файл на диск.
+        """
+        self._pending = 0
+        self.manager.sync()
+
+    def close(self):
+        """
+        Останавливает фоновый поток и записывает оставшиеся изменения.
+        """
+        if self._stopped.is_set():
+            return
+
+        self._stopped.set()
+        self._wake.set()
+        self._thread.join()
+
+        atexit.unregister(self.close)
+        self.manager.remove_listener(self)
+        self.flush()
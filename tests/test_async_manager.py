@@ -0,0 +1,123 @@
+import json
+import asyncio
+
+import pytest
+
+from tasks.async_manager import AsyncTaskManager
+
+
+class TestAsyncTaskManager:
+
+    @pytest.fixture
+    def temp_file(self, tmp_path):
+
+        return str(tmp_path / "async_tasks.json")
+
+    def test_add_and_search(self, temp_file):
+
+        async def scenario():
+            manager = await AsyncTaskManager.open(temp_file)
+
+            async with manager:
+                await manager.add_task("Задача 1", "Описание задачи 1", "Работа", 7)
+                await manager.add_task("Задача 2", "Описание задачи 2", "Личное", 3, priority="высокий")
+
+                return await manager.search_task(category="Работа")
+
+        result = asyncio.run(scenario())
+
+        assert len(result) == 1
+        assert result[0].title == "Задача 1"
+
+        with open(temp_file, "r", encoding="utf-8") as file:
+            assert len(json.load(file)) == 2
+
+    def test_burst_is_saved_once(self, temp_file, mocker):
+
+        async def scenario():
+            manager = await AsyncTaskManager.open(temp_file, save_delay=0.01)
+            write = mocker.spy(manager.manager, "_write_json")
+
+            await asyncio.gather(*(
+                manager.add_task(f"Задача {i}", "Описание", "Работа", 7)
+                for i in range(50)
+            ))
+            await manager.flush()
+
+            return write.call_count
+
+        assert asyncio.run(scenario()) == 1
+
+        with open(temp_file, "r", encoding="utf-8") as file:
+            assert len(json.load(file)) == 50
+
+    def test_delete_by_category_is_not_interactive(self, temp_file, mocker):
+
+        mocker.patch("builtins.input", side_effect=AssertionError("input() не должен вызываться"))
+
+        async def scenario():
+            manager = await AsyncTaskManager.open(temp_file)
+
+            async with manager:
+                await manager.add_task("Задача 1", "Описание", "Работа", 7)
+                await manager.add_task("Задача 2", "Описание", "Работа", 3)
+                deleted = await manager.delete_task_by_category("Работа")
+
+            return deleted, manager.tasks
+
+        deleted, tasks = asyncio.run(scenario())
+
+        assert len(deleted) == 2
+        assert tasks == {}
+
+    def test_update_task(self, temp_file):
+
+        async def scenario():
+            manager = await AsyncTaskManager.open(temp_file)
+
+            async with manager:
+                task = await manager.add_task("Задача 1", "Описание", "Работа", 7)
+                return await manager.update_task(task.id, status="выполнено")
+
+        assert asyncio.run(scenario()).status == "выполнено"
+
+    def test_concurrent_saves(self, temp_file):
+
+        async def scenario():
+            manager = await AsyncTaskManager.open(temp_file, save_delay=0)
+
+            for i in range(20):
+                await manager.add_task(f"Задача {i}", "Описание", "Работа", 7)
+
+            await asyncio.gather(manager.save_json(), manager.save_json(), manager.flush())
+
+            return manager.manager.dirty
+
+        assert asyncio.run(scenario()) is False
+
+        with open(temp_file, "r", encoding="utf-8") as file:
+            assert len(json.load(file)) == 20
+
+    def test_failed_delayed_save_is_retried(self, temp_file, mocker):
+
+        async def scenario():
+            manager = await AsyncTaskManager.open(temp_file, save_delay=0.01)
+            write_json = manager.manager._write_json
+            mocker.patch.object(manager.manager, "_write_json", side_effect=OSError("Диск заполнен"))
+
+            await manager.add_task("Задача 1", "Описание", "Работа", 7)
+
+            with pytest.raises(OSError):
+                await manager.flush()
+
+            assert manager.manager.dirty
+
+            manager.manager._write_json = write_json
+            await manager.flush()
+
+            return manager.manager.dirty
+
+        assert asyncio.run(scenario()) is False
+
+        with open(temp_file, "r", encoding="utf-8") as file:
+            assert len(json.load(file)) == 1
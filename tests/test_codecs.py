@@ -0,0 +1,48 @@
+import gzip
+import json
+
+import pytest
+
+from tasks.codecs import CODECS, detect_compression
+from tasks.task_manager import TaskManager
+
+
+class TestCompressedStore:
+
+    @pytest.mark.parametrize("compression", list(CODECS))
+    def test_roundtrip(self, tmp_path, compression):
+
+        filename = str(tmp_path / "tasks.json")
+        manager = TaskManager(filename, compression=compression)
+        manager.add_task("Задача 1", "Описание задачи 1", "Работа", 7)
+        manager.add_task("Задача 2", "Описание задачи 2", "Личное", 3, priority="высокий")
+        manager.save_json()
+
+        loaded = TaskManager(filename, compression=compression)
+
+        assert {task_id: task.to_dict() for task_id, task in loaded.tasks.items()} == manager._dump_tasks()
+
+    def test_detect_by_extension(self, tmp_path):
+
+        filename = str(tmp_path / "tasks.json.gz")
+        manager = TaskManager(filename)
+        manager.add_task("Задача 1", "Описание задачи 1", "Работа", 7)
+        manager.save_json()
+
+        assert manager.compression == "gzip"
+
+        with gzip.open(filename, "rt", encoding="utf-8") as file:
+            assert len(json.load(file)) == 1
+
+        assert len(TaskManager(filename).tasks) == 1
+
+    def test_detect_compression(self):
+
+        assert detect_compression("tasks.json") is None
+        assert detect_compression("tasks.json.xz") == "lzma"
+        assert detect_compression("tasks.json.bz2") == "bz2"
+
+    def test_unknown_compression(self, tmp_path):
+
+        with pytest.raises(ValueError, match="Неизвестный формат сжатия"):
+            TaskManager(str(tmp_path / "tasks.json"), compression="rar")
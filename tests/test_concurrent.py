@@ -0,0 +1,141 @@
+import random
+import threading
+
+import pytest
+
+from tasks.concurrent import ConcurrentTaskManager
+
+
+class TestConcurrentTaskManager:
+
+    @pytest.fixture
+    def manager(self, tmp_path):
+
+        manager = ConcurrentTaskManager(str(tmp_path / "concurrent.json"))
+
+        for i in range(50):
+            manager.add_task(f"Задача {i}", "Описание", "Работа" if i % 2 else "Личное", 7)
+
+        return manager
+
+    def test_snapshot_is_isolated(self, manager):
+
+        snapshot = manager.snapshot()
+        task_id = next(iter(snapshot))
+        title = snapshot[task_id].title
+
+        manager.add_task("Новая", "Описание", "Работа", 7)
+        manager.update_task(task_id, title="Изменённая")
+        manager.delete_task_by_id(list(snapshot)[1])
+
+        assert len(snapshot) == 50
+        assert snapshot[task_id].title == title
+        assert len(manager.tasks) == 50
+        assert manager.tasks[task_id].title == "Изменённая"
+
+    def test_reload_keeps_snapshot(self, manager, tmp_path):
+
+        manager.save_json()
+
+        other = ConcurrentTaskManager(manager.filename)
+        other.add_task("Новая", "Описание", "Работа", 7)
+        other.delete_task_by_id(next(iter(other.tasks)))
+        other.save_json()
+
+        snapshot = manager.snapshot()
+
+        assert manager.reload_json() == (1, 0, 1)
+        assert len(snapshot) == 50
+        assert len(manager.tasks) == 50
+        assert set(snapshot) != set(manager.tasks)
+
+    def test_readers_do_not_wait_for_writer(self, manager):
+
+        inside = threading.Event()
+        release = threading.Event()
+
+        def writer():
+            with manager.batch():
+                manager.add_task("Новая 1", "Описание", "Работа", 7)
+                manager.add_task("Новая 2", "Описание", "Работа", 7)
+                inside.set()
+                release.wait(5)
+
+        thread = threading.Thread(target=writer)
+        thread.start()
+        inside.wait(5)
+
+        # Писатель держит блокировку, а читатель сразу получает опубликованный снимок
+        assert len(manager.tasks) == 50
+
+        reader = threading.Thread(target=lambda: manager.view_tasks(manager.tasks))
+        reader.start()
+        reader.join(2)
+
+        assert not reader.is_alive()
+
+        release.set()
+        thread.join()
+
+        assert len(manager.tasks) == 52
+
+    def test_stress(self, manager, capsys):
+
+        errors = []
+        stop = threading.Event()
+
+        def writer(seed):
+            rng = random.Random(seed)
+            try:
+                for i in range(200):
+                    action = rng.random()
+                    if action < 0.5:
+                        manager.add_task(f"Задача {seed}-{i}", "Описание", rng.choice(["Работа", "Личное"]), 7)
+                    else:
+                        ids = list(manager.tasks)
+                        if not ids:
+                            continue
+                        task_id = rng.choice(ids)
+                        try:
+                            if action < 0.75:
+                                manager.delete_task_by_id(task_id)
+                            else:
+                                manager.update_task(task_id, status=rng.choice(["выполнено", "не выполнено"]))
+                        except (KeyError, ValueError):
+                            # Задачу успел удалить другой поток
+                            pass
+            except Exception as e:
+                errors.append(e)
+
+        def reader():
+            try:
+                while not stop.is_set():
+                    manager.search_task(category="Работа")
+                    manager.view_tasks(manager.tasks)
+                    manager.next_tasks(5)
+                    manager.fuzzy_search("задача")
+                    sum(1 for task in manager.tasks.values() if task.status == "выполнено")
+            except Exception as e:
+                errors.append(e)
+
+        writers = [threading.Thread(target=writer, args=(seed,)) for seed in range(8)]
+        readers = [threading.Thread(target=reader) for _ in range(8)]
+
+        for thread in readers + writers:
+            thread.start()
+        for thread in writers:
+            thread.join()
+
+        stop.set()
+        for thread in readers:
+            thread.join()
+
+        assert errors == []
+        assert manager.stats.total == len(manager.tasks)
+        assert len(manager.id_index) == len(manager.tasks)
+        assert [task.id for task in manager.next_tasks(1000)] == [
+            task.id for task in sorted(
+                (task for task in manager.tasks.values() if task.status != "выполнено"),
+                key=lambda task: (manager._urgency.key(task), task.id)
+            )
+        ]
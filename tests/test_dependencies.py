@@ -0,0 +1,113 @@
+import random
+
+import pytest
+
+from tasks.task_manager import TaskManager
+
+
+class TestDependencies:
+
+    @pytest.fixture
+    def setup_manager(self, tmp_path):
+
+        manager = TaskManager(str(tmp_path / "dependencies.json"))
+
+        design = manager.add_task("Проект", "Описание", "Работа", 3)
+        build = manager.add_task("Разработка", "Описание", "Работа", 5, blocked_by=[design.id])
+        test = manager.add_task("Тестирование", "Описание", "Работа", 1, priority="высокий", blocked_by=[build.id])
+
+        return manager, design, build, test
+
+    def test_ready_and_next(self, setup_manager):
+
+        manager, design, build, test = setup_manager
+
+        assert [task.id for task in manager.ready_tasks()] == [design.id]
+        assert [task.id for task in manager.next_tasks(10)] == [design.id]
+
+    def test_completion_unblocks_dependents(self, setup_manager):
+
+        manager, design, build, test = setup_manager
+
+        manager.update_task(design.id, status="выполнено")
+        assert [task.id for task in manager.ready_tasks()] == [build.id]
+
+        manager.update_task(build.id, status="выполнено")
+        assert [task.id for task in manager.next_tasks(10)] == [test.id]
+
+        manager.update_task(design.id, status="не выполнено")
+        assert manager.dependencies.is_blocked(test.id) is False
+        assert manager.dependencies.is_blocked(build.id) is True
+
+    def test_cycle_is_rejected(self, setup_manager):
+
+        manager, design, build, test = setup_manager
+
+        with pytest.raises(ValueError, match="цикл"):
+            manager.add_dependency(design.id, test.id)
+
+        with pytest.raises(ValueError, match="сама себя"):
+            manager.add_dependency(design.id, design.id)
+
+        assert design.blocked_by == frozenset()
+
+    def test_topological_order_is_maintained(self, setup_manager):
+
+        manager, design, build, test = setup_manager
+
+        docs = manager.add_task("Документация", "Описание", "Работа", 2)
+        manager.add_dependency(design.id, docs.id)
+        manager.remove_dependency(build.id, design.id)
+
+        order = manager.dependencies.topological_order()
+
+        for task in manager.tasks.values():
+            for blocker_id in task.blocked_by:
+                assert order.index(blocker_id) < order.index(task.id)
+
+        assert order.index(docs.id) < order.index(design.id)
+
+    def test_delete_blocker_unblocks(self, setup_manager):
+
+        manager, design, build, test = setup_manager
+
+        manager.delete_task_by_id(design.id)
+
+        assert manager.dependencies.is_blocked(build.id) is False
+
+    def test_unknown_blocker(self, setup_manager):
+
+        manager = setup_manager[0]
+
+        with pytest.raises(ValueError, match="Блокирующая задача"):
+            manager.add_task("Задача", "Описание", "Работа", 1, blocked_by=["unknown"])
+
+    def test_dependencies_are_saved(self, setup_manager):
+
+        manager, design, build, test = setup_manager
+        manager.save_json()
+
+        loaded = TaskManager(manager.filename)
+
+        assert loaded.tasks[test.id].blocked_by == {build.id}
+        assert [task.id for task in loaded.ready_tasks()] == [design.id]
+        assert loaded.dependencies.topological_order() == [design.id, build.id, test.id]
+
+    def test_random_edges_keep_order_valid(self, tmp_path):
+
+        rng = random.Random(7)
+        manager = TaskManager(str(tmp_path / "random.json"))
+        ids = [manager.add_task(f"Задача {i}", "Описание", "Работа", 1).id for i in range(30)]
+
+        for _ in range(120):
+            blocker_id, task_id = rng.sample(ids, 2)
+            try:
+                manager.add_dependency(task_id, blocker_id)
+            except ValueError:
+                pass
+
+        order = {task_id: i for i, task_id in enumerate(manager.dependencies.topological_order())}
+
+        for task in manager.tasks.values():
+            for blocker_id in task.blocked_by:
+                assert order[blocker_id] < order[task.id]
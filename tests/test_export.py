@@ -0,0 +1,83 @@
+import io
+import csv
+
+import pytest
+
+from tasks.task_manager import TaskManager
+from tasks.export import iter_batches, read_columnar, write_columnar
+
+
+class TestExport:
+
+    @pytest.fixture
+    def setup_manager(self, tmp_path):
+
+        manager = TaskManager(str(tmp_path / "export.json"))
+
+        for i in range(25):
+            manager.add_task(
+                f"Задача {i}",
+                f"Описание, \"с кавычками\" {i}",
+                ["Работа", "Личное", "Спорт"][i % 3],
+                i + 1,
+                priority=["низкий", "средний", "высокий"][i % 3],
+                status="выполнено" if i % 4 == 0 else "не выполнено"
+            )
+
+        return manager
+
+    def test_batches(self, setup_manager):
+
+        batches = list(iter_batches(setup_manager.tasks.values(), batch_size=10))
+
+        assert [len(batch["id"]) for batch in batches] == [10, 10, 5]
+
+    def test_columnar_roundtrip(self, setup_manager):
+
+        manager = setup_manager
+        buffer = io.BytesIO()
+
+        assert write_columnar(manager.tasks.values(), buffer, batch_size=7) == 25
+
+        buffer.seek(0)
+        batches = list(read_columnar(buffer))
+
+        assert [len(batch["id"]) for batch in batches] == [7, 7, 7, 4]
+
+        for batch in batches:
+            for i, task_id in enumerate(batch["id"]):
+                task = manager.tasks[task_id]
+
+                assert batch["title"][i] == task.title
+                assert batch["description"][i] == task.description
+                assert batch["category"][i] == task.category
+                assert batch["priority"][i] == task.priority
+                assert batch["status"][i] == task.status
+                assert abs((batch["due_date"][i] - task.due_date).total_seconds()) < 0.001
+
+    def test_export_csv(self, setup_manager, tmp_path):
+
+        manager = setup_manager
+        path = str(tmp_path / "export.csv")
+
+        assert manager.export(path, batch_size=4) == 25
+
+        with open(path, "r", encoding="utf-8", newline="") as file:
+            rows = list(csv.DictReader(file))
+
+        assert len(rows) == 25
+        assert rows[0] == manager.tasks[rows[0]["id"]].to_dict()
+
+    def test_export_columnar_file(self, setup_manager, tmp_path):
+
+        path = str(tmp_path / "export.tcol")
+
+        assert setup_manager.export(path, columnar=True) == 25
+
+        with open(path, "rb") as file:
+            assert sum(len(batch["id"]) for batch in read_columnar(file)) == 25
+
+    def test_not_columnar_file(self):
+
+        with pytest.raises(ValueError, match="не является колоночным"):
+            list(read_columnar(io.BytesIO(b"garbage")))
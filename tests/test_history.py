@@ -0,0 +1,181 @@
+import json
+from datetime import datetime, timedelta
+
+import pytest
+
+from tasks.history import ChangeHistory
+from tasks.task_manager import TaskManager
+
+
+class FakeClock:
+
+    def __init__(self):
+
+        self.current = datetime(2026, 1, 1, 12, 0)
+
+    def now(self):
+
+        self.current += timedelta(minutes=1)
+        return self.current
+
+    @staticmethod
+    def fromisoformat(value):
+
+        return datetime.fromisoformat(value)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+
+    clock = FakeClock()
+    monkeypatch.setattr("tasks.history.datetime", clock)
+
+    return clock
+
+
+@pytest.fixture
+def manager(tmp_path, clock):
+
+    manager = TaskManager(str(tmp_path / "tasks.json"))
+    manager.enable_history(checkpoint_interval=5)
+
+    return manager
+
+
+def read_lines(path) -> list[dict]:
+
+    with open(path, encoding="utf-8") as file:
+        return [json.loads(line) for line in file]
+
+
+class TestChangeHistory:
+
+    def test_update_records_changed_fields_only(self, manager):
+
+        task = manager.add_task("Задача", "Описание", "Работа", 7)
+        manager.update_task(task.id, status="выполнено", title="Задача")
+        manager.save_json()
+
+        records = read_lines(manager.history.log_path)
+
+        assert [record["op"] for record in records] == ["add", "update"]
+        assert records[1]["fields"] == {"status": "выполнено"}
+
+    def test_as_of_restores_past_state(self, manager, clock):
+
+        task = manager.add_task("Задача", "Описание", "Работа", 7)
+        after_add = clock.now()
+        manager.update_task(task.id, category="Личное")
+        after_update = clock.now()
+        manager.delete_task_by_id(task.id)
+        manager.save_json()
+
+        assert manager.as_of(after_add)[task.id].category == "Работа"
+        assert manager.as_of(after_update)[task.id].category == "Личное"
+        assert manager.as_of(clock.now()) == {}
+
+    def test_as_of_includes_unsaved_changes(self, manager, clock):
+
+        task = manager.add_task("Задача", "Описание", "Работа", 7)
+
+        assert manager.as_of(clock.now())[task.id].title == "Задача"
+
+    def test_as_of_before_history_raises(self, manager):
+
+        with pytest.raises(ValueError):
+            manager.as_of(datetime(2020, 1, 1))
+
+    def test_checkpoints_follow_edit_count(self, manager, clock):
+
+        task = manager.add_task("Задача", "Описание", "Работа", 7)
+        moments = []
+
+        for i in range(12):
+            manager.update_task(task.id, title=f"Задача {i}")
+            moments.append(clock.now())
+
+        manager.save_json()
+
+        # Начальный снимок и по снимку на каждые 5 изменений
+        index = read_lines(manager.history.index_path)
+        assert len(index) == 3
+        assert len(read_lines(manager.history.log_path)) == 13
+
+        for i, moment in enumerate(moments):
+            assert manager.as_of(moment)[task.id].title == f"Задача {i}"
+
+    def test_checkpoint_interval_grows_with_task_count(self, manager):
+
+        for i in range(20):
+            manager.add_task(f"Задача {i}", "Описание", "Работа", 7)
+
+        manager.save_json()
+
+        # Начальный снимок и снимки после 5, 10 и 20 изменений: снимок из 10 задач окупается через 10 изменений
+        assert len(read_lines(manager.history.index_path)) == 4
+
+    def test_history_survives_reload(self, manager, clock, tmp_path):
+
+        task = manager.add_task("Задача", "Описание", "Работа", 7)
+        after_add = clock.now()
+        manager.save_json()
+
+        reloaded = TaskManager(manager.filename)
+        reloaded.enable_history(checkpoint_interval=5)
+        reloaded.update_task(task.id, priority="высокий")
+        reloaded.save_json()
+
+        # Изменения после последнего снимка учитываются и после перезапуска
+        assert reloaded.history._edits == 2
+        assert reloaded.as_of(after_add)[task.id].priority == "средний"
+        assert reloaded.as_of(clock.now())[task.id].priority == "высокий"
+
+        # Повторное подключение не добавляет начальный снимок
+        assert len(read_lines(manager.history.index_path)) == 1
+
+    def test_changes_without_history_get_checkpoint(self, manager, clock):
+
+        manager.add_task("Задача 1", "Описание", "Работа", 7)
+        manager.save_json()
+
+        # Другой процесс меняет файл без записи истории
+        other = TaskManager(manager.filename)
+        task = other.add_task("Задача 2", "Описание", "Работа", 7)
+        other.save_json()
+        after_other = clock.now()
+
+        reloaded = TaskManager(manager.filename)
+        reloaded.enable_history(checkpoint_interval=5)
+        reloaded.update_task(task.id, priority="высокий")
+        reloaded.save_json()
+
+        restored = TaskManager(manager.filename)
+        restored.enable_history(checkpoint_interval=5)
+
+        # Изменение без истории попадает в неё в момент следующего подключения истории
+        assert task.id not in restored.as_of(after_other)
+        assert restored.as_of(clock.now())[task.id].priority == "высокий"
+        assert len(read_lines(manager.history.index_path)) == 2
+
+    def test_update_of_unknown_task_is_skipped(self):
+
+        tasks = {}
+
+        ChangeHistory._apply(tasks, {"op": "update", "id": "unknown", "fields": {"priority": "высокий"}})
+        ChangeHistory._apply(tasks, {"op": "delete", "id": "unknown"})
+
+        assert tasks == {}
+
+    def test_search_as_of(self, manager, clock):
+
+        task = manager.add_task("Задача", "Описание", "Работа", 7)
+        before = clock.now()
+        manager.update_task(task.id, category="Личное")
+
+        assert [found.id for found in manager.search_task(category="Работа", as_of=before)] == [task.id]
+        assert manager.search_task(category="Работа") == []
+
+    def test_history_requires_enable(self, tmp_path):
+
+        with pytest.raises(ValueError):
+            TaskManager(str(tmp_path / "tasks.json")).as_of(datetime.now())
@@ -0,0 +1,85 @@
+import time
+from uuid import UUID
+from datetime import datetime, timedelta
+
+import pytest
+
+from tasks.ids import new_task_id, id_created_at
+from tasks.task_manager import TaskManager
+
+
+class TestNewTaskId:
+
+    def test_ids_are_uuid7(self):
+
+        task_id = new_task_id()
+
+        assert UUID(task_id).version == 7
+        assert abs(id_created_at(task_id) - datetime.now()) < timedelta(seconds=5)
+
+    def test_ids_are_time_ordered(self):
+
+        ids = [new_task_id() for _ in range(1000)]
+
+        assert ids == sorted(ids)
+        assert len(set(ids)) == len(ids)
+
+    def test_uuid4_has_no_creation_time(self):
+
+        assert id_created_at("0b6a2f7e-9f3c-4d5b-8a1e-2c3d4e5f6a7b") is None
+
+
+class TestResolveId:
+
+    @pytest.fixture
+    def setup_manager(self, tmp_path):
+
+        manager = TaskManager(str(tmp_path / "ids.json"))
+
+        for i in range(3):
+            manager.add_task(f"Задача {i}", "Описание", "Работа", 7)
+
+        return manager
+
+    def test_resolve_short_id(self, setup_manager):
+
+        manager = setup_manager
+
+        for task_id in manager.tasks:
+            short = manager.short_id(task_id)
+
+            assert len(short) >= 10
+            assert manager.resolve_id(short) == task_id
+
+    def test_resolve_ambiguous_and_missing(self, setup_manager):
+
+        manager = setup_manager
+        first = next(iter(manager.tasks))
+
+        with pytest.raises(ValueError, match="нескольким задачам"):
+            manager.resolve_id(first[:4])
+
+        with pytest.raises(ValueError, match="отсутствует в списке"):
+            manager.resolve_id("ffffffff")
+
+    def test_resolve_after_delete(self, setup_manager):
+
+        manager = setup_manager
+        manager.resolve_id(next(iter(manager.tasks)))
+
+        task_id = next(iter(manager.tasks))
+        manager.delete_task_by_id(task_id)
+
+        with pytest.raises(ValueError):
+            manager.resolve_id(task_id[:30])
+
+    def test_recent_tasks(self, setup_manager):
+
+        manager = setup_manager
+        time.sleep(0.01)
+        middle = datetime.now()
+        time.sleep(0.01)
+        manager.add_task("Новая", "Описание", "Работа", 7)
+
+        assert [task.title for task in manager.recent_tasks(middle)] == ["Новая"]
+        assert len(manager.recent_tasks(datetime.now() - timedelta(days=1))) == 4
@@ -0,0 +1,189 @@
+import io
+
+import pytest
+
+import main as main_module
+from main import build_parser, main, run_batch
+from tasks.task_manager import TaskManager
+
+
+@pytest.fixture
+def manager(tmp_path):
+
+    return TaskManager(str(tmp_path / "tasks.json"))
+
+
+class TestBatch:
+
+    def test_commands_share_one_manager_and_save_once(self, manager, monkeypatch, capsys):
+
+        saves = []
+        save_json = manager.save_json
+        monkeypatch.setattr(manager, "save_json", lambda: saves.append(1) or save_json())
+
+        script = io.StringIO(
+            "# комментарий\n"
+            "\n"
+            'add --title "Задача 1" --description "Описание 1" --category Работа --due_date 3\n'
+            "add --title Задача2 --description Описание2 --category Личное --due_date 1\n"
+            "search --category Работа\n"
+        )
+
+        failed = run_batch(manager, build_parser(), script)
+
+        assert failed == 0
+        assert saves == [1]
+        assert len(TaskManager(manager.filename).tasks) == 2
+
+        output = capsys.readouterr().out
+        assert "[3] Готово" in output
+        assert "Задача 1" in output
+        assert "Выполнено команд: 3, с ошибками: 0" in output
+
+    def test_errors_do_not_stop_batch(self, manager, capsys):
+
+        script = [
+            "update --id zzz --status выполнено",
+            "add --title",
+            "remind --once",
+            "add --title Задача --description Описание --category Работа --due_date 1",
+        ]
+
+        assert run_batch(manager, build_parser(), script) == 3
+        assert len(manager.tasks) == 1
+
+    def test_stop_on_error(self, manager):
+
+        script = [
+            "update --id zzz --status выполнено",
+            "add --title Задача --description Описание --category Работа --due_date 1",
+        ]
+
+        assert run_batch(manager, build_parser(), script, stop_on_error=True) == 1
+        assert len(manager.tasks) == 0
+
+    def test_category_delete_is_not_interactive(self, manager, monkeypatch):
+
+        manager.add_task("Задача 1", "Описание 1", "Личное", 1)
+        manager.add_task("Задача 2", "Описание 2", "Личное", 2)
+
+        def no_input(prompt=""):
+            raise AssertionError("Пакетный режим не должен запрашивать ввод")
+
+        monkeypatch.setattr("builtins.input", no_input)
+
+        assert run_batch(manager, build_parser(), ["delete --category Личное"]) == 1
+        assert len(manager.tasks) == 2
+
+        assert run_batch(manager, build_parser(), ["delete --category Личное --all"]) == 0
+        assert len(manager.tasks) == 0
+
+    def test_main_with_file_option(self, tmp_path, monkeypatch):
+
+        filename = str(tmp_path / "tasks.json")
+        script = tmp_path / "script.txt"
+        script.write_text("add --title Задача --description Описание --category Работа --due_date 1\n", encoding="utf-8")
+
+        def no_input(prompt=""):
+            raise AssertionError("Имя файла передано через --file")
+
+        monkeypatch.setattr("builtins.input", no_input)
+
+        main(["--file", filename, "batch", "--input", str(script)])
+
+        assert len(TaskManager(filename).tasks) == 1
+
+    def test_main_reads_batch_from_stdin(self, tmp_path, monkeypatch, capsys):
+
+        filename = str(tmp_path / "tasks.json")
+        monkeypatch.setattr("sys.stdin", io.StringIO(
+            "add --title Задача --description Описание --category Работа --due_date 1\n"
+            "view\n"
+        ))
+
+        main(["--file", filename, "batch"])
+
+        assert len(TaskManager(filename).tasks) == 1
+        assert "Выполнено команд: 2, с ошибками: 0" in capsys.readouterr().out
+
+    def test_stdin_batch_requires_file(self, monkeypatch, capsys):
+
+        def no_input(prompt=""):
+            raise AssertionError("Имя файла нельзя читать из потока команд")
+
+        monkeypatch.setattr("builtins.input", no_input)
+
+        with pytest.raises(SystemExit) as error:
+            main(["batch"])
+
+        assert error.value.code == 2
+        assert "--file" in capsys.readouterr().err
+
+    def test_main_exit_code_on_errors(self, tmp_path):
+
+        script = tmp_path / "script.txt"
+        script.write_text("update --id zzz --status выполнено\n", encoding="utf-8")
+
+        with pytest.raises(SystemExit) as error:
+            main(["--file", str(tmp_path / "tasks.json"), "batch", "--input", str(script)])
+
+        assert error.value.code == 1
+
+    def test_invalid_values_are_command_errors(self, manager):
+
+        script = [
+            "add --title Задача --description Описание --category Работа --due_date 1",
+            "add --title Задача --description Описание --category Работа --due_date 0",
+            'add --title "" --description Описание --category Работа --due_date 1',
+        ]
+
+        assert run_batch(manager, build_parser(), script) == 2
+        assert len(TaskManager(manager.filename).tasks) == 1
+
+    def test_unexpected_error_keeps_earlier_commands(self, manager, monkeypatch):
+
+        def broken(task_manager, args, interactive):
+            raise RuntimeError("Сбой")
+
+        monkeypatch.setitem(main_module.COMMANDS, "stats", broken)
+
+        script = [
+            "add --title Задача --description Описание --category Работа --due_date 1",
+            "stats",
+        ]
+
+        with pytest.raises(RuntimeError):
+            run_batch(manager, build_parser(), script)
+
+        assert len(TaskManager(manager.filename).tasks) == 1
+
+
+class TestHistory:
+
+    @pytest.fixture
+    def enabled(self, monkeypatch):
+
+        enabled = []
+        enable_history = TaskManager.enable_history
+        monkeypatch.setattr(TaskManager, "enable_history", lambda self, *args, **kwargs: enabled.append(1) or enable_history(self, *args, **kwargs))
+
+        return enabled
+
+    def test_read_only_commands_skip_history(self, tmp_path, enabled, capsys):
+
+        filename = str(tmp_path / "tasks.json")
+
+        main(["--file", filename, "view"])
+        main(["--file", filename, "search", "--category", "Работа"])
+
+        assert enabled == []
+
+    def test_saving_and_as_of_commands_record_history(self, tmp_path, enabled, capsys):
+
+        filename = str(tmp_path / "tasks.json")
+
+        main(["--file", filename, "add", "--title", "Задача", "--description", "Описание", "--category", "Работа", "--due_date", "1"])
+        main(["--file", filename, "view", "--as-of", "01.01.2030"])
+
+        assert len(enabled) == 2
+        assert "Задача" in capsys.readouterr().out
@@ -1,10 +1,13 @@
 import os
 import json
 import uuid
+import random
+from math import ceil
 from datetime import datetime, timedelta
 
 import pytest
 
+from tasks.fuzzy import trigrams
 from tasks.task_manager import TaskManager
 
 
@@ -138,6 +141,19 @@ class TestDeleteTask:
 
         assert len(manager.tasks) == 0
 
+    def test_delete_by_category_lists_unambiguous_ids(self, setup_manager, monkeypatch, capsys):
+
+        manager = setup_manager
+        tasks = [manager.add_task(f"Задача {i}", "Описание", "Test Category", 7) for i in range(5)]
+        monkeypatch.setattr("builtins.input", lambda prompt="": "0")
+
+        manager.delete_task_by_category("Test Category")
+
+        output = capsys.readouterr().out
+
+        assert len(manager.tasks) == 5
+        assert all(f"(ID: {manager.short_id(task.id)})" in output for task in tasks)
+
     def test_delete_by_category_invalid(self, setup_manager):
 
         manager = setup_manager
@@ -373,4 +389,184 @@ class TestLoadJson:
 
         assert manager.tasks == {}  # Список задач должен быть пустым
 
-    
\ No newline at end of file
+class TestNextTasks:
+
+    @pytest.fixture
+    def setup_manager(self, tmp_path):
+
+        manager = TaskManager(str(tmp_path / "next.json"))
+        now = datetime.now()
+
+        manager.add_task("Низкий завтра", "Описание", "Работа", now + timedelta(days=1), priority="низкий")
+        manager.add_task("Высокий через 5 дней", "Описание", "Работа", now + timedelta(days=5), priority="высокий")
+        manager.add_task("Средний через 10 дней", "Описание", "Личное", now + timedelta(days=10), priority="средний")
+        manager.add_task("Выполнено", "Описание", "Работа", now + timedelta(days=1), priority="высокий", status="выполнено")
+
+        return manager
+
+    def test_next_tasks_order(self, setup_manager):
+
+        manager = setup_manager
+
+        result = manager.next_tasks(10)
+
+        assert [task.title for task in result] == ["Высокий через 5 дней", "Низкий завтра", "Средний через 10 дней"]
+
+    def test_next_tasks_limit_and_category(self, setup_manager):
+
+        manager = setup_manager
+
+        assert [task.title for task in manager.next_tasks(1)] == ["Высокий через 5 дней"]
+        assert [task.title for task in manager.next_tasks(5, category="Личное")] == ["Средний через 10 дней"]
+
+    def test_next_tasks_follows_updates(self, setup_manager):
+
+        manager = setup_manager
+        manager.next_tasks(1)
+
+        urgent = manager.search_task(title="Средний через 10 дней")[0]
+        manager.update_task(urgent.id, priority="высокий", due_date=datetime.now() + timedelta(hours=1))
+
+        first = manager.search_task(title="Высокий через 5 дней")[0]
+        manager.update_task(first.id, status="выполнено")
+
+        manager.add_task("Новая", "Описание", "Работа", datetime.now() + timedelta(days=30), priority="низкий")
+
+        assert [task.title for task in manager.next_tasks(10)] == ["Средний через 10 дней", "Низкий завтра", "Новая"]
+
+    def test_next_tasks_custom_weights(self, tmp_path):
+
+        manager = TaskManager(str(tmp_path / "weights.json"), priority_weights={"высокий": 0, "средний": 0, "низкий": 0})
+        now = datetime.now()
+
+        manager.add_task("Высокий", "Описание", "Работа", now + timedelta(days=5), priority="высокий")
+        manager.add_task("Низкий", "Описание", "Работа", now + timedelta(days=1), priority="низкий")
+
+        assert [task.title for task in manager.next_tasks(2)] == ["Низкий", "Высокий"]
+
+class TestStats:
+
+    @pytest.fixture
+    def setup_manager(self, tmp_path):
+
+        manager = TaskManager(str(tmp_path / "stats.json"))
+        now = datetime.now()
+
+        manager.add_task("Задача 1", "Описание", "Работа", now - timedelta(days=1), priority="высокий")
+        manager.add_task("Задача 2", "Описание", "Работа", now + timedelta(days=3), status="выполнено")
+        manager.add_task("Задача 3", "Описание", "Личное", now + timedelta(days=3), priority="низкий")
+
+        return manager
+
+    def test_counters(self, setup_manager):
+
+        stats = setup_manager.stats
+
+        assert stats.total == 3
+        assert stats.by_status["выполнено"] == 1
+        assert stats.by_priority["высокий"] == 1
+        assert stats.by_category["Работа"]["не выполнено"] == 1
+        assert stats.overdue() == 1
+        assert stats.overdue("Личное") == 0
+        assert stats.completion_ratio("Работа") == 0.5
+
+    def test_counters_follow_changes(self, setup_manager):
+
+        manager = setup_manager
+        overdue = manager.search_task(title="Задача 1")[0]
+
+        manager.update_task(overdue.id, status="выполнено", category="Личное")
+        manager.delete_task_by_id(manager.search_task(title="Задача 2")[0].id)
+
+        stats = manager.stats
+
+        assert stats.total == 2
+        assert stats.overdue() == 0
+        assert "Работа" not in stats.by_category
+        assert stats.completion_ratio("Личное") == 0.5
+
+    def test_report(self, setup_manager):
+
+        report = setup_manager.stats.report()
+
+        assert "Работа" in report
+        assert "Просрочено" in report
+
+class TestFuzzySearch:
+
+    @pytest.fixture
+    def setup_manager(self, tmp_path):
+
+        manager = TaskManager(str(tmp_path / "fuzzy.json"))
+
+        manager.add_task("Купить молоко", "Зайти в магазин после работы", "Покупки", 1)
+        manager.add_task("Подготовить отчёт", "Квартальный отчёт для руководства", "Работа", 3)
+        manager.add_task("Тренировка", "Бег в парке", "Спорт", 2)
+
+        return manager
+
+    def test_fuzzy_with_typo(self, setup_manager):
+
+        manager = setup_manager
+
+        result = manager.fuzzy_search("атчет")
+
+        assert result[0].title == "Подготовить отчёт"
+
+    def test_fuzzy_limit(self, setup_manager):
+
+        manager = setup_manager
+
+        assert len(manager.fuzzy_search("задача купить отчет бег", limit=2, threshold=0.1)) == 2
+
+    def test_fuzzy_no_results(self, setup_manager):
+
+        manager = setup_manager
+
+        assert manager.fuzzy_search("xyz") == []
+
+    def test_fuzzy_follows_updates(self, setup_manager):
+
+        manager = setup_manager
+        manager.fuzzy_search("молоко")
+
+        task = manager.search_task(title="Купить молоко")[0]
+        manager.update_task(task.id, title="Купить хлеб")
+
+        assert manager.fuzzy_search("молако") == []
+        assert manager.fuzzy_search("хлеп")[0].id == task.id
+
+    def test_fuzzy_matches_full_scan(self, tmp_path):
+
+        manager = TaskManager(str(tmp_path / "fuzzy.json"))
+        rng = random.Random(0)
+        words = ["отчёт", "встреча", "бюджет", "клиент", "звонок", "план", "ремонт", "письмо"]
+
+        for i in range(300):
+            manager.add_task(f"{rng.choice(words)} {i}", " ".join(rng.choices(words, k=rng.randint(1, 6))), rng.choice(words[:3]), 7)
+
+        for task_id in rng.sample(list(manager.tasks), 50):
+            manager.delete_task_by_id(task_id)
+
+        def scan(query):
+            query_grams = trigrams(query)
+            scored = []
+
+            for task in manager.tasks.values():
+                grams = trigrams(" ".join([task.title, task.description, task.category]))
+                shared = len(query_grams & grams)
+
+                if shared >= ceil(0.3 * len(query_grams)):
+                    scored.append((shared, -len(grams), task.id))
+
+            return [task_id for _, _, task_id in sorted(scored, reverse=True)[:10]]
+
+        for query in ["атчет", "встреча по бюджету", "звонок клиенту 42", "праект", "xyz"]:
+            assert [task.id for task in manager.fuzzy_search(query)] == scan(query)
+
+    def test_fuzzy_invalid_query(self, setup_manager):
+
+        manager = setup_manager
+
+        with pytest.raises(TypeError, match="Запрос должен иметь строковый тип"):
+            manager.fuzzy_search(1)
@@ -0,0 +1,145 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from tasks.task import Task
+from tasks.recurrence import Recurrence, TaskOccurrence
+from tasks.task_manager import TaskManager
+
+
+class TestRecurrence:
+
+    def test_daily(self):
+
+        rule = Recurrence("daily", interval=2)
+        start = datetime(2024, 1, 1, 9)
+
+        result = list(rule.occurrences(start, datetime(2024, 1, 4), datetime(2024, 1, 10)))
+
+        assert result == [datetime(2024, 1, 5, 9), datetime(2024, 1, 7, 9), datetime(2024, 1, 9, 9)]
+
+    def test_weekly_weekdays(self):
+
+        # 1 января 2024 года — понедельник
+        rule = Recurrence("weekly", interval=2, weekdays=[0, 4])
+        start = datetime(2024, 1, 1)
+
+        result = list(rule.occurrences(start, datetime(2024, 1, 1), datetime(2024, 1, 29)))
+
+        assert result == [datetime(2024, 1, 1), datetime(2024, 1, 5), datetime(2024, 1, 15), datetime(2024, 1, 19)]
+
+    def test_monthly_clamps_to_month_end(self):
+
+        rule = Recurrence("monthly")
+        start = datetime(2024, 1, 31)
+
+        result = list(rule.occurrences(start, datetime(2024, 1, 1), datetime(2024, 5, 1)))
+
+        assert result == [datetime(2024, 1, 31), datetime(2024, 2, 29), datetime(2024, 3, 31), datetime(2024, 4, 30)]
+
+    def test_far_window_is_lazy(self):
+
+        rule = Recurrence("daily")
+        start = datetime(2024, 1, 1)
+
+        result = rule.occurrences(start, datetime(9000, 1, 1), datetime(9000, 1, 3))
+
+        assert list(result) == [datetime(9000, 1, 1), datetime(9000, 1, 2)]
+
+    def test_invalid_rule(self):
+
+        with pytest.raises(ValueError, match="Тип повторения"):
+            Recurrence("yearly")
+
+        with pytest.raises(ValueError, match="Интервал повторения"):
+            Recurrence("daily", interval=0)
+
+        with pytest.raises(ValueError, match="Дни недели"):
+            Recurrence("weekly", weekdays=[7])
+
+    def test_to_dict_roundtrip(self):
+
+        task = Task("Зарядка", "Утренняя зарядка", "Спорт", datetime(2024, 1, 1), recurrence=Recurrence("weekly", weekdays=[0, 2]))
+
+        restored = Task.from_dict(task.to_dict())
+
+        assert restored.recurrence == task.recurrence
+        assert "recurrence" not in Task("Разовая", "Описание", "Работа", 1).to_dict()
+
+
+class TestRecurringTasksInManager:
+
+    @pytest.fixture
+    def setup_manager(self, tmp_path):
+
+        manager = TaskManager(str(tmp_path / "recurring.json"))
+        start = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0) + timedelta(days=1)
+
+        manager.add_task("Полить цветы", "Цветы на балконе", "Дом", start, recurrence=Recurrence("daily"))
+        manager.add_task("Отчёт", "Квартальный отчёт", "Работа", start + timedelta(days=2))
+
+        return manager, start
+
+    def test_one_record_many_occurrences(self, setup_manager):
+
+        manager, start = setup_manager
+
+        result = manager.tasks_due_between(start, start + timedelta(days=5))
+
+        assert len(manager.tasks) == 2
+        assert len(result) == 6
+        assert sum(isinstance(task, TaskOccurrence) for task in result) == 5
+        assert [task.due_date for task in result] == sorted(task.due_date for task in result)
+
+    def test_search_in_window(self, setup_manager):
+
+        manager, start = setup_manager
+
+        result = manager.search_task(category="Дом", start=start + timedelta(days=365), end=start + timedelta(days=372))
+
+        assert len(result) == 7
+        assert all(task.title == "Полить цветы" for task in result)
+
+    def test_view_in_window(self, setup_manager):
+
+        manager, start = setup_manager
+
+        table = manager.view_tasks(manager.tasks, start=start, end=start + timedelta(days=3))
+
+        assert table.count("Полить цветы") == 3
+        assert table.count("Отчёт") == 1
+
+    def test_recurrence_is_saved(self, setup_manager):
+
+        manager, start = setup_manager
+        manager.save_json()
+
+        loaded = TaskManager(manager.filename)
+
+        assert len(loaded.tasks_due_between(start, start + timedelta(days=10))) == 11
+
+    def test_recurring_task_is_not_overdue(self, setup_manager):
+
+        manager, start = setup_manager
+        chore = manager.add_task("Зарядка", "Утренняя зарядка", "Спорт", start - timedelta(days=30), recurrence=Recurrence("daily"))
+        manager.add_task("Отчёт за прошлый месяц", "Просроченный отчёт", "Работа", start - timedelta(days=30))
+
+        assert manager.stats.overdue(now=start) == 1
+        assert manager.stats.overdue(category="Спорт", now=start) == 0
+
+        manager.delete_task_by_id(chore.id)
+
+        assert manager.stats.overdue(now=start) == 1
+
+    def test_next_tasks_use_next_occurrence(self, setup_manager):
+
+        manager, start = setup_manager
+        now = datetime.now()
+
+        # Первое повторение было месяц назад, ближайшее — через 12 часов
+        chore = manager.add_task("Зарядка", "Утренняя зарядка", "Спорт", now + timedelta(hours=12) - timedelta(days=30), recurrence=Recurrence("daily"))
+        urgent = manager.add_task("Срочно", "Срочная задача", "Работа", now + timedelta(hours=5))
+
+        ids = [task.id for task in manager.next_tasks(10)]
+
+        assert ids.index(urgent.id) < ids.index(chore.id)
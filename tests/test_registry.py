@@ -0,0 +1,134 @@
+import json
+import threading
+from datetime import datetime, timedelta
+
+import pytest
+
+from tasks.registry import TaskManagerRegistry
+
+
+class TestTaskManagerRegistry:
+
+    @pytest.fixture
+    def registry(self, tmp_path):
+
+        registry = TaskManagerRegistry(str(tmp_path), max_open=2, max_workers=4)
+        yield registry
+        registry.close()
+
+    def test_get_is_cached(self, registry):
+
+        assert registry.get("team1.json") is registry.get("team1.json")
+
+    def test_evicted_manager_is_flushed(self, registry, tmp_path):
+
+        registry.get("team1.json").add_task("Задача 1", "Описание", "Работа", 7)
+        registry.get("team2.json")
+        registry.get("team3.json")
+
+        assert len(registry) == 2
+
+        with open(tmp_path / "team1.json", "r", encoding="utf-8") as file:
+            assert len(json.load(file)) == 1
+
+        assert len(registry.get("team1.json").tasks) == 1
+
+    def test_leased_manager_is_not_evicted(self, registry, tmp_path):
+
+        with registry.lease("team1.json") as manager:
+            for i in range(2, 5):
+                registry.get(f"team{i}.json")
+
+            assert registry.get("team1.json") is manager
+            manager.add_task("Задача 1", "Описание", "Работа", 7)
+
+        # После возврата менеджер вытесняется как обычно, и изменения сохраняются
+        registry.get("team5.json")
+        registry.get("team6.json")
+
+        with open(tmp_path / "team1.json", "r", encoding="utf-8") as file:
+            assert len(json.load(file)) == 1
+
+        with pytest.raises(ValueError, match="не был получен"):
+            registry.release("team1.json")
+
+    def test_eviction_saves_outside_lock(self, registry):
+
+        evicted = registry.get("team1.json")
+        evicted.add_task("Задача 1", "Описание", "Работа", 7)
+        registry.get("team2.json")
+        flush = evicted.flush
+        acquired = []
+
+        def try_lock():
+            acquired.append(registry._lock.acquire(timeout=1))
+
+            if acquired[-1]:
+                registry._lock.release()
+
+        def save():
+            # Другой поток может работать с реестром, пока файл записывается
+            thread = threading.Thread(target=try_lock)
+            thread.start()
+            thread.join()
+            return flush()
+
+        evicted.flush = save
+        registry.get("team3.json")
+
+        assert acquired == [True]
+        assert not evicted.dirty
+        assert registry.get("team1.json") is not evicted
+
+    def test_failed_eviction_keeps_manager(self, tmp_path):
+
+        registry = TaskManagerRegistry(str(tmp_path), max_open=1)
+        manager = registry.get("team1.json")
+        manager.add_task("Задача 1", "Описание", "Работа", 7)
+        write_json = manager._write_json
+
+        def broken_write(tasks_dict):
+            raise OSError("Диск заполнен")
+
+        manager._write_json = broken_write
+
+        with pytest.raises(OSError, match="Диск заполнен"):
+            registry.get("team2.json")
+
+        assert manager.dirty
+        assert registry.get("team1.json") is manager
+
+        with pytest.raises(OSError, match="Диск заполнен"):
+            registry.close()
+
+        assert manager.dirty
+
+        manager._write_json = write_json
+        registry.flush()
+
+        with open(tmp_path / "team1.json", "r", encoding="utf-8") as file:
+            assert len(json.load(file)) == 1
+
+    def test_invalid_name(self, registry):
+
+        with pytest.raises(ValueError, match="Недопустимое имя файла задач"):
+            registry.get("../team.json")
+
+    def test_overdue_across_files(self, registry):
+
+        now = datetime.now()
+
+        for i in range(5):
+            manager = registry.get(f"team{i}.json")
+            manager.add_task(f"Просрочена {i}", "Описание", "Работа", now - timedelta(days=1), priority="высокий")
+            manager.add_task(f"Низкий {i}", "Описание", "Работа", now - timedelta(days=1), priority="низкий")
+            manager.add_task(f"Будущая {i}", "Описание", "Работа", now + timedelta(days=1), priority="высокий")
+            manager.save_json()
+
+        registry.get("empty.json").save_json()
+
+        result = registry.overdue(priority="высокий", now=now)
+
+        assert sorted(result) == [f"team{i}.json" for i in range(5)]
+        assert all([task.title for task in tasks] == [f"Просрочена {name[4]}"] for name, tasks in result.items())
+        assert len(registry) == 2
@@ -0,0 +1,120 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from tasks.task_manager import TaskManager
+from tasks.scheduler import DeadlineScheduler
+from tasks.recurrence import Recurrence, TaskOccurrence
+
+
+class TestDeadlineScheduler:
+
+    @pytest.fixture
+    def setup_scheduler(self, tmp_path):
+
+        manager = TaskManager(str(tmp_path / "scheduler.json"))
+        fired = []
+        scheduler = DeadlineScheduler(manager, lead_time=timedelta(days=1), notifiers=[lambda task, now: fired.append(task.id)])
+
+        return manager, scheduler, fired
+
+    def test_fires_when_deadline_approaches(self, setup_scheduler):
+
+        manager, scheduler, fired = setup_scheduler
+        now = datetime.now()
+
+        soon = manager.add_task("Задача 1", "Описание", "Работа", now + timedelta(hours=12))
+        manager.add_task("Задача 2", "Описание", "Работа", now + timedelta(days=10))
+
+        assert scheduler.poll(now) == [soon]
+        assert fired == [soon.id]
+
+        # Повторно о той же задаче не напоминаем
+        assert scheduler.poll(now) == []
+
+    def test_completed_and_deleted_tasks_are_skipped(self, setup_scheduler):
+
+        manager, scheduler, fired = setup_scheduler
+        now = datetime.now()
+
+        done = manager.add_task("Задача 1", "Описание", "Работа", now + timedelta(hours=1))
+        deleted = manager.add_task("Задача 2", "Описание", "Работа", now + timedelta(hours=2))
+        manager.add_task("Задача 3", "Описание", "Работа", now + timedelta(hours=3), status="выполнено")
+
+        manager.update_task(done.id, status="выполнено")
+        manager.delete_task_by_id(deleted.id)
+
+        assert scheduler.poll(now + timedelta(days=1)) == []
+        assert len(scheduler) == 0
+
+    def test_rescheduled_on_due_date_update(self, setup_scheduler):
+
+        manager, scheduler, fired = setup_scheduler
+        now = datetime.now()
+
+        task = manager.add_task("Задача 1", "Описание", "Работа", now + timedelta(days=10))
+        assert scheduler.next_fire_time() == task.due_date - timedelta(days=1)
+
+        manager.update_task(task.id, due_date=now + timedelta(hours=6))
+
+        assert scheduler.poll(now) == [task]
+
+    def test_heap_stays_bounded_on_updates(self, setup_scheduler):
+
+        manager, scheduler, fired = setup_scheduler
+        now = datetime.now()
+
+        tasks = [manager.add_task(f"Задача {i}", "Описание", "Работа", now + timedelta(days=10)) for i in range(10)]
+
+        for hours in range(1, 1001):
+            manager.update_task(tasks[hours % 10].id, due_date=now + timedelta(days=10, hours=hours))
+
+        assert len(scheduler) == 10
+        assert len(scheduler._heap) <= 2 * len(scheduler)
+        assert scheduler.next_fire_time() == min(task.due_date for task in tasks) - timedelta(days=1)
+
+    def test_reset_on_load(self, setup_scheduler):
+
+        manager, scheduler, fired = setup_scheduler
+        manager.add_task("Задача 1", "Описание", "Работа", datetime.now() + timedelta(hours=6))
+        manager.save_json()
+
+        manager.load_json()
+
+        assert len(scheduler) == 1
+        assert len(scheduler.poll()) == 1
+
+    def test_recurring_task_fires_for_each_occurrence(self, tmp_path):
+
+        manager = TaskManager(str(tmp_path / "scheduler.json"))
+        fired = []
+        scheduler = DeadlineScheduler(manager, lead_time=timedelta(hours=1), notifiers=[lambda task, now: fired.append(task)])
+        now = datetime.now()
+
+        # Срок первого повторения давно прошёл, напоминание — о ближайшем
+        task = manager.add_task("Зарядка", "Утренняя зарядка", "Спорт", now + timedelta(minutes=30) - timedelta(days=30), recurrence=Recurrence("daily"))
+
+        assert [occurrence.due_date for occurrence in scheduler.poll(now)] == [task.due_date + timedelta(days=30)]
+        assert scheduler.poll(now) == []
+
+        tomorrow = now + timedelta(days=1)
+        due = scheduler.poll(tomorrow)
+
+        assert [occurrence.due_date for occurrence in due] == [task.due_date + timedelta(days=31)]
+        assert all(isinstance(occurrence, TaskOccurrence) and occurrence.id == task.id for occurrence in fired)
+        assert len(fired) == 2
+
+    def test_stdout_notifier_prints_unambiguous_id(self, tmp_path, capsys):
+
+        manager = TaskManager(str(tmp_path / "scheduler.json"))
+        now = datetime.now()
+
+        # ID, созданные в одну миллисекунду, совпадают в первых 10 символах
+        tasks = [manager.add_task(f"Задача {i}", "Описание", "Работа", now + timedelta(hours=1)) for i in range(20)]
+        DeadlineScheduler(manager, lead_time=timedelta(days=1)).poll(now)
+
+        output = capsys.readouterr().out
+
+        for task in tasks:
+            assert f"(ID: {manager.short_id(task.id)})" in output
+            assert manager.resolve_id(manager.short_id(task.id)) == task.id
@@ -0,0 +1,154 @@
+import threading
+
+import pytest
+
+from tasks.task import Task
+from tasks.storage import DiskTaskStore
+from tasks.task_manager import TaskManager
+
+
+class TestDiskTaskStore:
+
+    @pytest.fixture
+    def store(self, tmp_path):
+
+        store = DiskTaskStore(str(tmp_path / "tasks.db"), cache_size=2)
+        yield store
+        store.close()
+
+    def test_cache_is_bounded(self, store):
+
+        tasks = [Task(f"Задача {i}", "Описание", "Работа", 7) for i in range(10)]
+
+        for task in tasks:
+            store[task.id] = task
+
+        assert len(store._cache) == 2
+        assert len(store) == 10
+        assert sorted(store) == sorted(task.id for task in tasks)
+        assert store[tasks[0].id].title == "Задача 0"
+
+    def test_evicted_changes_are_written(self, store):
+
+        task = Task("Задача", "Описание", "Работа", 7)
+        store[task.id] = task
+
+        task.status = "выполнено"
+        store[task.id] = task
+
+        for i in range(5):
+            other = Task(f"Другая {i}", "Описание", "Работа", 7)
+            store[other.id] = other
+
+        assert task.id not in store._cache
+        assert store[task.id].status == "выполнено"
+
+    def test_delete(self, store):
+
+        task = Task("Задача", "Описание", "Работа", 7)
+        store[task.id] = task
+
+        del store[task.id]
+
+        assert task.id not in store
+
+        with pytest.raises(KeyError):
+            del store[task.id]
+
+    def test_change_during_flush_is_not_lost(self, store, monkeypatch):
+
+        first = Task("Задача 1", "Описание", "Работа", 7)
+        second = Task("Задача 2", "Описание", "Работа", 7)
+        store[first.id] = first
+
+        writing = threading.Event()
+        resume = threading.Event()
+        write = store._write
+
+        def slow_write(task_ids):
+            write(task_ids)
+            writing.set()
+            resume.wait(5)
+
+        monkeypatch.setattr(store, "_write", slow_write)
+
+        # flush в потоке отложенной записи, пока основной поток меняет задачи
+        flusher = threading.Thread(target=store.flush)
+        flusher.start()
+        writing.wait(5)
+
+        writer = threading.Thread(target=store.__setitem__, args=(second.id, second))
+        writer.start()
+        writer.join(0.2)
+        resume.set()
+        flusher.join()
+        writer.join()
+
+        monkeypatch.undo()
+        store.flush()
+
+        stored = {task_id for (task_id,) in store._conn.execute("SELECT id FROM tasks")}
+
+        assert stored == {first.id, second.id}
+
+
+class TestMemoryBoundedManager:
+
+    def test_manager_with_cache(self, tmp_path):
+
+        filename = str(tmp_path / "tasks.db")
+        manager = TaskManager(filename, cache_size=3)
+
+        for i in range(20):
+            manager.add_task(f"Задача {i}", "Описание", "Работа" if i % 2 else "Личное", 7)
+
+        task_id = manager.search_task(title="Задача 4")[0].id
+        manager.update_task(task_id, status="выполнено")
+        manager.delete_task_by_id(manager.search_task(title="Задача 5")[0].id)
+        manager.save_json()
+
+        assert len(manager.tasks._cache) <= 3
+
+        reopened = TaskManager(filename, cache_size=3)
+
+        assert len(reopened.tasks) == 19
+        assert reopened.tasks[task_id].status == "выполнено"
+        assert reopened.stats.by_status["выполнено"] == 1
+        assert len(list(reopened.tasks.values())) == 19
+
+    def test_json_file_is_migrated(self, tmp_path):
+
+        filename = str(tmp_path / "tasks.json")
+        manager = TaskManager(filename)
+
+        for i in range(5):
+            manager.add_task(f"Задача {i}", "Описание", "Работа", 7)
+
+        manager.save_json()
+
+        with open(filename, encoding="utf-8") as file:
+            original = file.read()
+
+        bounded = TaskManager(filename, cache_size=2)
+        bounded.add_task("Новая задача", "Описание", "Работа", 7)
+        bounded.save_json()
+        bounded.tasks.close()
+
+        with open(filename, encoding="utf-8") as file:
+            assert file.read() == original
+
+        reopened = TaskManager(filename, cache_size=2)
+
+        assert reopened.tasks.path == f"{filename}.db"
+        assert len(reopened.tasks) == 6
+
+    def test_broken_json_file_is_not_replaced(self, tmp_path):
+
+        filename = tmp_path / "tasks.json"
+        filename.write_text("{не json", encoding="utf-8")
+
+        with pytest.raises(ValueError):
+            TaskManager(str(filename), cache_size=2)
+
+        assert filename.read_text(encoding="utf-8") == "{не json"
+        assert not (tmp_path / "tasks.json.db").exists()
@@ -0,0 +1,71 @@
+import io
+import os
+
+import pytest
+
+from tasks.task_manager import TaskManager
+from tasks.watch import TaskWatcher, CLEAR_SCREEN
+
+
+class TestTaskWatcher:
+
+    @pytest.fixture
+    def setup_watcher(self, tmp_path):
+
+        filename = str(tmp_path / "watch.json")
+
+        writer = TaskManager(filename)
+        writer.add_task("Задача 1", "Описание", "Работа", 7)
+        writer.add_task("Задача 2", "Описание", "Работа", 3)
+        writer.save_json()
+
+        out = io.StringIO()
+        watcher = TaskWatcher(TaskManager(filename), out=out)
+        watcher.render()
+
+        return writer, watcher, out
+
+    def _touch(self, filename):
+
+        stat = os.stat(filename)
+        os.utime(filename, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    def test_no_changes(self, setup_watcher):
+
+        writer, watcher, out = setup_watcher
+
+        assert watcher.refresh() is False
+
+    def test_redraws_only_changed_rows(self, setup_watcher):
+
+        writer, watcher, out = setup_watcher
+        task_id = writer.search_task(title="Задача 1")[0].id
+
+        writer.update_task(task_id, status="выполнено")
+        writer.save_json()
+        self._touch(writer.filename)
+        out.truncate(0)
+        out.seek(0)
+
+        assert watcher.refresh() is True
+        assert watcher.manager.tasks[task_id].status == "выполнено"
+
+        watcher.render()
+        output = out.getvalue()
+
+        assert CLEAR_SCREEN not in output
+        assert "Задача 1" in output
+        assert "Задача 2" not in output
+
+    def test_added_and_deleted_tasks(self, setup_watcher):
+
+        writer, watcher, out = setup_watcher
+
+        writer.delete_task_by_id(writer.search_task(title="Задача 2")[0].id)
+        writer.add_task("Задача 3", "Описание", "Работа", 5)
+        writer.save_json()
+        self._touch(writer.filename)
+
+        assert watcher.manager.reload_json() == (1, 0, 1)
+        assert sorted(task.title for task in watcher.manager.tasks.values()) == ["Задача 1", "Задача 3"]
+        assert watcher.manager.stats.total == 2
@@ -0,0 +1,163 @@
+import os
+import json
+import time
+
+import pytest
+
+from tasks.task_manager import TaskManager
+from tasks.concurrent import ConcurrentTaskManager
+
+
+@pytest.fixture
+def manager(tmp_path):
+
+    return TaskManager(str(tmp_path / "tasks.json"))
+
+
+def count_writes(manager, monkeypatch) -> list:
+
+    writes = []
+    write_json = manager._write_json
+
+    def spy(tasks_dict):
+        writes.append(len(tasks_dict))
+        write_json(tasks_dict)
+
+    monkeypatch.setattr(manager, "_write_json", spy)
+
+    return writes
+
+
+class TestWriteBehind:
+
+    def test_burst_is_written_once(self, manager, monkeypatch):
+
+        writes = count_writes(manager, monkeypatch)
+        write_behind = manager.start_write_behind(interval=60, batch_size=100000)
+
+        for i in range(2000):
+            manager.add_task(f"Задача {i}", "Описание", "Работа", 7)
+
+        assert writes == []
+
+        write_behind.close()
+
+        assert writes == [2000]
+        assert not manager.dirty
+        assert len(TaskManager(manager.filename).tasks) == 2000
+
+    def test_batch_size_triggers_flush(self, manager, monkeypatch):
+
+        writes = count_writes(manager, monkeypatch)
+        write_behind = manager.start_write_behind(interval=60, batch_size=10)
+
+        for i in range(10):
+            manager.add_task(f"Задача {i}", "Описание", "Работа", 7)
+
+        deadline = time.monotonic() + 5
+        while not writes and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        write_behind.close()
+
+        assert writes[0] == 10
+        assert write_behind not in manager._listeners
+
+    def test_interval_triggers_flush(self, tmp_path):
+
+        manager = ConcurrentTaskManager(str(tmp_path / "tasks.json"))
+        write_behind = manager.start_write_behind(interval=0.05)
+        manager.add_task("Задача", "Описание", "Работа", 7)
+
+        deadline = time.monotonic() + 5
+        while manager.dirty and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        write_behind.close()
+
+        assert not manager.dirty
+        assert os.path.exists(manager.filename)
+
+    def test_flush_skips_clean_manager(self, manager, monkeypatch):
+
+        writes = count_writes(manager, monkeypatch)
+
+        assert manager.flush() is False
+
+        manager.add_task("Задача", "Описание", "Работа", 7)
+
+        assert manager.flush() is True
+        assert manager.flush() is False
+        assert writes == [1]
+
+    def test_close_is_idempotent(self, manager):
+
+        write_behind = manager.start_write_behind(interval=60)
+
+        assert manager.start_write_behind() is write_behind
+
+        write_behind.close()
+        write_behind.close()
+
+
+class TestAtomicSave:
+
+    def test_no_temp_file_left(self, manager):
+
+        manager.add_task("Задача", "Описание", "Работа", 7)
+        manager.save_json()
+
+        assert os.listdir(os.path.dirname(manager.filename)) == ["tasks.json"]
+
+    @pytest.mark.parametrize("compression", [None, "gzip"])
+    def test_temp_file_is_synced_before_replace(self, tmp_path, monkeypatch, compression):
+
+        manager = TaskManager(str(tmp_path / "tasks.json"), compression=compression)
+        manager.add_task("Задача", "Описание", "Работа", 7)
+        calls = []
+        fsync, replace = os.fsync, os.replace
+
+        def spy_fsync(fd):
+            calls.append(("fsync", os.fstat(fd).st_size))
+            fsync(fd)
+
+        def spy_replace(src, dst):
+            calls.append(("replace", os.path.getsize(src)))
+            replace(src, dst)
+
+        monkeypatch.setattr(os, "fsync", spy_fsync)
+        monkeypatch.setattr(os, "replace", spy_replace)
+
+        manager.save_json()
+
+        # Сбрасывается на диск уже полностью записанный файл
+        assert [name for name, _ in calls] == ["fsync", "replace"]
+        assert calls[0][1] == calls[1][1] > 0
+
+    def test_failed_write_keeps_previous_file(self, manager, monkeypatch):
+
+        manager.add_task("Задача 1", "Описание", "Работа", 7)
+        manager.save_json()
+        manager.add_task("Задача 2", "Описание", "Работа", 7)
+
+        def broken_dump(*args, **kwargs):
+            raise OSError("Диск заполнен")
+
+        monkeypatch.setattr(json, "dump", broken_dump)
+
+        with pytest.raises(OSError):
+            manager.flush()
+
+        monkeypatch.undo()
+
+        assert manager.dirty
+        assert os.listdir(os.path.dirname(manager.filename)) == ["tasks.json"]
+        assert len(TaskManager(manager.filename).tasks) == 1
+
+    def test_sync(self, manager):
+
+        manager.add_task("Задача", "Описание", "Работа", 7)
+        manager.sync()
+
+        assert not manager.dirty
+        assert len(TaskManager(manager.filename).tasks) == 1